@@ -0,0 +1,247 @@
+"""Local ATS (applicant tracking system) check of a generated resume against a job description.
+
+Deterministic and offline: keywords from the job description are tokenized, stemmed and looked up in
+the resume, the resume's headings are matched against the sections its template style expects, and
+formatting that ATS parsers trip over is flagged. Scoring a resume takes a few milliseconds, so it can
+run on every rerun instead of regenerating the resume to "improve the score".
+
+Usage:
+    python ats_score.py resume.md --job job.txt [--template "ATS-Optimized"] [--json] [--min-score 70]
+"""
+
+import argparse
+import json
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from resume_templates import RESUME_TEMPLATES
+
+# part -> label, score weight (weights add up to 100)
+ATS_WEIGHTS = {
+    "keywords": {"label": "Keyword coverage", "weight": 55},
+    "phrases": {"label": "Key phrases", "weight": 10},
+    "sections": {"label": "Expected sections", "weight": 25},
+    "formatting": {"label": "ATS-safe formatting", "weight": 10},
+}
+
+MAX_KEYWORDS = 40
+DEFAULT_SECTIONS = ("summary", "skills", "experience", "education")
+
+# Words a heading may contain for each section (stemmed before matching)
+SECTION_ALIASES = {
+    "summary": ("summary", "profile", "objective", "about"),
+    "skills": ("skills", "competencies", "expertise", "technologies", "toolkit"),
+    "experience": ("experience", "employment", "work", "career", "journey"),
+    "projects": ("projects", "portfolio"),
+    "education": ("education", "academic", "degrees"),
+    "certifications": ("certifications", "certificates", "licenses", "achievements", "awards", "honors"),
+    "publications": ("publications", "research", "papers", "presentations"),
+}
+
+STOPWORDS = frozenset("""
+a about above across after again all also am an and any are as at be been being both but by can could
+did do does doing during each etc few for from further had has have having he her here hers him his how
+i if in into is it its itself just may me more most must my no nor not of off on once only or other our
+ours out over own same she should so some such than that the their them then there these they this those
+through to too under until up very via was we were what when where which while who whom why will with
+within would you your yours
+ability able apply candidate candidates company including job join looking new plus position preferred
+required requirements responsibilities role strong team us well work working years year experience
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+HAS_LETTER = re.compile(r"[a-z]")
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+# Section titles written as a bold line or a short all-caps line instead of a Markdown heading
+BOLD_LINE_PATTERN = re.compile(r"^\*\*([^*]+)\*\*:?$")
+EMAIL_PATTERN = re.compile(r"[^@\s|]+@[^@\s|]+\.[a-z]{2,}", re.IGNORECASE)
+PHONE_PATTERN = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+
+# Longest first; the remaining stem must keep at least 3 letters
+SUFFIXES = (
+    ("izations", "ize"), ("ization", "ize"), ("ations", "ate"), ("ation", "ate"),
+    ("ments", ""), ("ment", ""), ("ings", ""), ("ing", ""), ("ies", "y"), ("ied", "y"),
+    ("ers", "er"), ("ed", ""), ("es", "e"), ("s", ""),
+)
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words, keeping tech names such as c++, c#, node.js and ci/cd parts intact"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+@lru_cache(maxsize=16384)
+def stem(word: str) -> str:
+    """Light suffix stripping so optimize/optimized/optimizing/optimization compare equal.
+
+    Tokens with digits or symbols (python3, c++, node.js) are left as they are.
+    """
+    if not word.isalpha() or len(word) <= 3:
+        return word
+    for suffix, replacement in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix == "s" and word.endswith(("ss", "us", "is")):
+                break
+            word = word[:-len(suffix)] + replacement
+            break
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsz":
+        word = word[:-1]
+    return word
+
+def _keyword_tokens(text: str) -> List[Tuple[str, str]]:
+    """(stem, surface word) pairs for the tokens that can be keywords"""
+    return [(stem(token), token) for token in tokenize(text) if token not in STOPWORDS and HAS_LETTER.search(token)]
+
+def extract_keywords(job_description: str, limit: int = MAX_KEYWORDS) -> Dict:
+    """The job description's most frequent keywords and repeated two-word phrases, by stem.
+
+    Returns {'keywords': {stem: (count, surface)}, 'phrases': {(stem, stem): (count, surface)}}.
+    """
+    keywords = {}
+    phrases = {}
+    for line in job_description.splitlines():
+        tokens = _keyword_tokens(line)
+        for stemmed, surface in tokens:
+            count, first = keywords.get(stemmed, (0, surface))
+            keywords[stemmed] = (count + 1, first)
+        for (stem1, word1), (stem2, word2) in zip(tokens, tokens[1:]):
+            count, first = phrases.get((stem1, stem2), (0, f"{word1} {word2}"))
+            phrases[(stem1, stem2)] = (count + 1, first)
+    # Most frequent first; ties keep the order they appear in
+    top = sorted(keywords.items(), key=lambda item: -item[1][0])[:limit]
+    return {
+        'keywords': dict(top),
+        'phrases': {key: value for key, value in phrases.items() if value[0] >= 2},
+    }
+
+def section_titles(resume: str) -> List[str]:
+    """Level 1-2 headings (after the name), bold-only lines and short all-caps lines"""
+    titles = []
+    for line in resume.strip().splitlines()[1:]:
+        line = line.strip()
+        heading = HEADING_PATTERN.match(line)
+        bold = BOLD_LINE_PATTERN.match(line)
+        if heading and len(heading.group(1)) <= 2:
+            titles.append(heading.group(2))
+        elif bold:
+            titles.append(bold.group(1))
+        elif line.isupper() and len(line.split()) <= 5 and not line.startswith(("-", "*", "•")):
+            titles.append(line)
+    return titles
+
+def find_sections(resume: str) -> Tuple[List[str], List[str]]:
+    """Sections found among the resume's titles, and titles that match no section"""
+    section_stems = _section_stems()
+    found, unrecognized = [], []
+    for title in section_titles(resume):
+        stems = {stem(token) for token in tokenize(title)}
+        matches = [section for section, aliases in section_stems.items() if stems & aliases and section not in found]
+        found.extend(matches)
+        if not matches and not any(stems & aliases for aliases in section_stems.values()):
+            unrecognized.append(title)
+    return found, unrecognized
+
+@lru_cache(maxsize=None)
+def _section_stems() -> Dict[str, frozenset]:
+    return {section: frozenset(stem(word) for word in words) for section, words in SECTION_ALIASES.items()}
+
+# Things ATS parsers commonly mangle or miss: (issue, check(resume, first lines) -> True if present)
+FORMAT_CHECKS = (
+    ("No email address near the top", lambda resume, header: not EMAIL_PATTERN.search(header)),
+    ("No phone number near the top", lambda resume, header: not PHONE_PATTERN.search(header)),
+    ("Tables (many ATS read them out of order)", lambda resume, header: re.search(r"^\s*\|.*\|\s*$", resume, re.MULTILINE)),
+    ("Code blocks", lambda resume, header: "```" in resume),
+    ("Images (ATS ignore them)", lambda resume, header: re.search(r"!\[[^\]]*\]\(", resume)),
+    ("No section headings", lambda resume, header: not section_titles(resume)),
+)
+
+def check_formatting(resume: str) -> List[str]:
+    header = "\n".join(resume.strip().splitlines()[:6])
+    return [issue for issue, check in FORMAT_CHECKS if check(resume, header)]
+
+def analyze_resume(resume: str, job_description: str = "", template: str = None) -> Dict:
+    """Score a resume for a job description and template style. Returns score, parts and findings.
+
+    Without a job description only sections and formatting are scored.
+    """
+    resume_stems = {stem(token) for token in tokenize(resume)}
+    resume_tokens = [stemmed for stemmed, _ in _keyword_tokens(resume)]
+    resume_pairs = set(zip(resume_tokens, resume_tokens[1:]))
+
+    parts = {}
+    if job_description.strip():
+        extracted = extract_keywords(job_description)
+        keywords, phrases = extracted['keywords'], extracted['phrases']
+        total = sum(count for count, _ in keywords.values())
+        matched = [surface for key, (_, surface) in keywords.items() if key in resume_stems]
+        parts['keywords'] = {
+            'fraction': sum(count for key, (count, _) in keywords.items() if key in resume_stems) / total if total else 1.0,
+            'matched': matched,
+            'missing': [surface for key, (_, surface) in keywords.items() if key not in resume_stems],
+        }
+        if phrases:
+            parts['phrases'] = {
+                'fraction': sum(1 for key in phrases if key in resume_pairs) / len(phrases),
+                'matched': [surface for key, (_, surface) in phrases.items() if key in resume_pairs],
+                'missing': [surface for key, (_, surface) in phrases.items() if key not in resume_pairs],
+            }
+
+    expected = RESUME_TEMPLATES.get(template, {}).get("sections", DEFAULT_SECTIONS)
+    found, unrecognized = find_sections(resume)
+    parts['sections'] = {
+        'fraction': sum(1 for section in expected if section in found) / len(expected),
+        'matched': [section for section in expected if section in found],
+        'missing': [section for section in expected if section not in found],
+        'unrecognized': unrecognized,
+    }
+
+    issues = check_formatting(resume)
+    parts['formatting'] = {'fraction': 1 - len(issues) / len(FORMAT_CHECKS), 'matched': [], 'missing': issues}
+
+    weight = sum(ATS_WEIGHTS[name]["weight"] for name in parts)
+    score = sum(ATS_WEIGHTS[name]["weight"] * part['fraction'] for name, part in parts.items()) / weight * 100
+    findings = [{'part': name, 'label': ATS_WEIGHTS[name]["label"], **part} for name, part in parts.items()]
+    return {"score": int(round(score)), "template": template, "findings": findings}
+
+def format_ats_report(report: Dict, title: str = "Resume") -> str:
+    """Format an analyze_resume() report as plain text"""
+    lines = [f"{title}: ATS score {report['score']}/100"]
+    for finding in report["findings"]:
+        line = f"  {finding['label']}: {finding['fraction']:.0%}"
+        if finding["missing"]:
+            line += f" — missing: {', '.join(finding['missing'][:10])}"
+        if finding.get("unrecognized"):
+            line += f" — unrecognized headings: {', '.join(finding['unrecognized'])}"
+        lines.append(line)
+    return "\n".join(lines)
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Score generated resumes against a job description, offline")
+    parser.add_argument("paths", nargs="+", help="Resume Markdown files")
+    parser.add_argument("--job", help="Text file with the job description")
+    parser.add_argument("--template", choices=list(RESUME_TEMPLATES), help="Template style the resumes were generated in")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    parser.add_argument("--min-score", type=int, default=0, help="Exit with status 1 if any resume scores lower")
+    args = parser.parse_args(argv)
+
+    job_description = ""
+    if args.job:
+        with open(args.job, encoding="utf-8") as f:
+            job_description = f.read()
+
+    reports = {}
+    for path in args.paths:
+        with open(path, encoding="utf-8") as f:
+            reports[path] = analyze_resume(f.read(), job_description, args.template)
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print("\n\n".join(format_ats_report(report, path) for path, report in reports.items()))
+
+    return 1 if any(report["score"] < args.min_score for report in reports.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
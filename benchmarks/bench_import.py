@@ -0,0 +1,141 @@
+"""Benchmark bulk profile import from CSV and JSONL cohort files.
+
+Writes synthetic cohorts (1% of rows invalid) to a temporary directory, imports them with
+profile_import and reports rows/sec and peak traced memory, which should stay flat as the file grows.
+With --sqlite each cohort is also imported into a fresh profile store, timing the import and
+loading profiles back by id.
+
+Usage:
+    python benchmarks/bench_import.py [--rows 10000,50000] [--formats csv,jsonl] [--sqlite] [--output import.json]
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ["GEMINI_BACKEND"] = "fake"
+
+from bench_journey import make_profile  # noqa: E402
+from profile_import import import_file  # noqa: E402
+from profile_model import NESTED_FIELDS, PROFILE_FIELDS  # noqa: E402
+from profile_store import ProfileStore  # noqa: E402
+
+INVALID_EVERY = 100
+LOAD_SAMPLES = 1000
+
+def cohort_records(rows: int):
+    for user_id in range(rows):
+        record = make_profile(user_id).to_dict()
+        if user_id % INVALID_EVERY == INVALID_EVERY - 1:
+            record['email'] = ""
+        yield record
+
+def write_cohort(path: str, fmt: str, rows: int):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            writer = csv.DictWriter(f, fieldnames=PROFILE_FIELDS)
+            writer.writeheader()
+            for record in cohort_records(rows):
+                writer.writerow({
+                    name: json.dumps(value) if name in NESTED_FIELDS else value
+                    for name, value in record.items()
+                })
+        else:
+            for record in cohort_records(rows):
+                f.write(json.dumps(record) + "\n")
+
+def measure(path: str) -> Dict:
+    report = import_file(path, lambda profiles: None)
+    # Separate pass: tracing allocations slows the import down several times
+    tracemalloc.start()
+    import_file(path, lambda profiles: None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'rows': report['rows'],
+        'imported': report['imported'],
+        'rejected': report['rejected'],
+        'file_mb': round(os.path.getsize(path) / 1_000_000, 2),
+        'seconds': report['seconds'],
+        'rows_per_sec': report['rows_per_sec'],
+        'peak_traced_mb': round(peak / 1_000_000, 2),
+    }
+
+def measure_sqlite(path: str, db_path: str) -> Dict:
+    store = ProfileStore(db_path)
+    report = import_file(path, store.save_many)
+    with closing(sqlite3.connect(db_path)) as conn:
+        ids = [row[0] for row in conn.execute("SELECT id FROM profiles")]
+    timings = []
+    for profile_id in random.Random(0).choices(ids, k=LOAD_SAMPLES):
+        start = time.perf_counter()
+        store.load(profile_id)
+        timings.append(time.perf_counter() - start)
+    store.close()
+    return {
+        'sqlite_seconds': report['seconds'],
+        'sqlite_rows_per_sec': report['rows_per_sec'],
+        'db_mb': round(os.path.getsize(db_path) / 1_000_000, 2),
+        'load_by_id_p50_us': round(statistics.median(timings) * 1_000_000, 1),
+    }
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="10000,50000", help="Comma-separated cohort sizes (default: 10000,50000)")
+    parser.add_argument("--formats", default="csv,jsonl", help="Comma-separated formats (default: csv,jsonl)")
+    parser.add_argument("--sqlite", action="store_true", help="Also import into a SQLite profile store")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    header = f"{'Format':<8}{'Rows':>10}{'File MB':>10}{'Seconds':>10}{'Rows/sec':>12}{'Peak MB':>10}"
+    print(header + (f"{'DB rows/sec':>13}{'DB MB':>8}{'Load µs':>10}" if args.sqlite else ""))
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.formats.split(","):
+            for rows in [int(n) for n in args.rows.split(",")]:
+                path = os.path.join(tmp, f"cohort_{rows}.{fmt}")
+                write_cohort(path, fmt, rows)
+                result = {'format': fmt, **measure(path)}
+                line = (f"{fmt:<8}{rows:>10,}{result['file_mb']:>10.1f}{result['seconds']:>10.2f}"
+                        f"{result['rows_per_sec']:>12,.0f}{result['peak_traced_mb']:>10.2f}")
+                if args.sqlite:
+                    result.update(measure_sqlite(path, os.path.join(tmp, f"cohort_{rows}_{fmt}.db")))
+                    line += (f"{result['sqlite_rows_per_sec']:>13,.0f}{result['db_mb']:>8.1f}"
+                             f"{result['load_by_id_p50_us']:>10.1f}")
+                results.append(result)
+                print(line)
+
+    if args.output:
+        report = {
+            'meta': {
+                'benchmark': "profile_import",
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""End-to-end benchmark of the full user journey against the fake Gemini backend.
+
+Each simulated user builds candidate data, matches skills to a job posting, generates a resume (prompt,
+LLM call, PDF, local ATS check), a cover letter, asks the career advisor and builds a portfolio
+(HTML + deploy ZIP). Reports p50/p95/p99 latency per stage, overall throughput and Gemini token usage.
+Every user runs under a session token budget, and all of them under a shared daily budget (--daily-budget
+to see answers shortened and refused under a load spike). --structured generates the resume as JSON and
+renders its Markdown, PDF (in every template) and portfolio projects locally from that one answer.
+
+Usage:
+    python benchmarks/bench_journey.py --users 200 --concurrency 16 --latency lognormal:-0.7,0.5 [--daily-budget 500000]
+                                       [--structured] [--output journey.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ["GEMINI_BACKEND"] = "fake"
+
+import fake_gemini  # noqa: E402
+from ats_score import analyze_resume  # noqa: E402
+from bench_portfolio import make_config  # noqa: E402
+from llm_client import call_gemini_with_retry  # noqa: E402
+from pdf_export import create_professional_pdf, create_structured_pdf, render_template_pdfs  # noqa: E402
+from portfolio import PORTFOLIO_TEMPLATES, generate_portfolio_html  # noqa: E402
+from portfolio_export import build_portfolio_bundle, generate_portfolio_readme  # noqa: E402
+from profile_model import Profile  # noqa: E402
+from prompts import (CAREER_ADVISOR_SYSTEM_PROMPT, COVER_LETTER_SYSTEM_PROMPT, RESUME_JSON_SYSTEM_PROMPTS,  # noqa: E402
+                     RESUME_SYSTEM_PROMPTS, compile_candidate_data, generate_advisor_prompt, generate_cover_letter_prompt,
+                     generate_resume_prompt)
+from resume_schema import parse_resume_json, resume_portfolio_content, resume_to_markdown, validate_resume_json  # noqa: E402
+from resume_templates import RESUME_TEMPLATES  # noqa: E402
+from skills import match_job_skills  # noqa: E402
+from token_budget import OUTPUT_TOKEN_LIMITS, DailyTokenBudget, TokenBudget, new_session_budget  # noqa: E402
+
+STAGES = [
+    "candidate_data", "skill_match", "resume_prompt", "resume_llm", "resume_render", "resume_pdf", "resume_templates",
+    "ats_score",
+    "cover_letter_llm", "advisor_llm", "portfolio_html", "portfolio_zip",
+]
+
+JOB_DESCRIPTION = """Software Engineer, Backend Platform
+Design and build scalable backend services and REST APIs in Python, deploy them with Docker and
+Kubernetes on AWS, and optimize database performance with PostgreSQL.
+- 2+ years of experience with Python and backend services
+- Familiarity with Docker, Kubernetes and CI/CD pipelines
+- Strong SQL skills and excellent communication
+"""
+
+def make_profile(user_id: int) -> Profile:
+    """Build the sidebar profile of one simulated user"""
+    experiences = [{
+        'title': "Software Engineering Intern",
+        'company': "TechCorp Inc.",
+        'start_date': "Jun 2023",
+        'end_date': "Aug 2023",
+        'location': "San Francisco, CA",
+        'description': "• Built RESTful API serving 10,000+ requests/day\n• Reduced load time by 40% through optimization",
+    }]
+    projects = [
+        {'name': "AI Chatbot Platform", 'type': "Personal", 'description': "Built an NLP chatbot handling 1000+ conversations daily",
+         'tech': "Python, TensorFlow, React, MongoDB", 'link': "github.com/alex/chatbot"},
+        {'name': "E-commerce Dashboard", 'type': "Academic", 'description': "Real-time analytics over 100K+ transactions",
+         'tech': "React, Node.js, PostgreSQL, Docker", 'link': "github.com/alex/dashboard"},
+    ]
+    education_list = [{
+        'degree': "B.S. Computer Science", 'major': "Computer Science", 'university': "Stanford University",
+        'grad_year': "2024", 'gpa': "3.8/4.0", 'honors': "", 'coursework': "Machine Learning, Algorithms",
+    }]
+    profile = {
+        'name': f"Student {user_id}",
+        'email': f"student{user_id}@example.com",
+        'phone': "+1 (555) 123-4567",
+        'location': "San Francisco, CA",
+        'headline': "Software Engineer",
+        'education_list': education_list,
+        'target_role': "Software Engineer",
+        'target_industry': "Technology",
+        'target_companies': "Google, Microsoft",
+        'experience_level': "Entry Level",
+        'technical_skills': "Python, JavaScript, React, Node.js, SQL, Git, Docker, AWS",
+        'soft_skills': "Problem Solving, Team Collaboration, Communication",
+        'languages': "English (Native)",
+        'experiences': experiences,
+        'projects': projects,
+        'certifications': "",
+        'achievements': "1st Place - University Hackathon 2023",
+        'linkedin': "linkedin.com/in/student",
+        'github': "github.com/student",
+        'tone': "Professional",
+    }
+    return Profile.from_dict(profile)
+
+def render_structured(resume_json: str) -> Tuple:
+    """Everything the app renders locally from a structured answer, except the PDF"""
+    structured_resume = parse_resume_json(resume_json)
+    return structured_resume, resume_to_markdown(structured_resume), resume_portfolio_content(structured_resume)
+
+def run_journey(user_id: int, daily_budget: TokenBudget, structured: bool = False) -> Tuple[Dict[str, float], List[Dict]]:
+    """Run one user's journey, returning seconds spent per stage and the token usage of each Gemini call"""
+    timings = {}
+    usages = []
+    budgets = (new_session_budget(), daily_budget)
+
+    def generate(stage, kind, system_instruction, prompt, **kwargs):
+        usages.append({})
+        return timed(stage, call_gemini_with_retry, prompt, max_tokens=OUTPUT_TOKEN_LIMITS[kind],
+                     system_instruction=system_instruction, budgets=budgets, usage=usages[-1], **kwargs)
+
+    def timed(stage, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    profile = make_profile(user_id)
+    candidate_data = timed("candidate_data", compile_candidate_data, profile)
+    skill_match = timed("skill_match", match_job_skills, JOB_DESCRIPTION, profile.technical_skills, profile.soft_skills)
+
+    template = list(RESUME_TEMPLATES)[user_id % len(RESUME_TEMPLATES)]
+    prompt = timed("resume_prompt", generate_resume_prompt, template, candidate_data, skill_match['matched'])
+    if structured:
+        resume_json = generate("resume_llm", "resume_json", RESUME_JSON_SYSTEM_PROMPTS[template], prompt,
+                               json_output=True, validate=validate_resume_json)
+        structured_resume, resume, _ = timed("resume_render", render_structured, resume_json)
+        timed("resume_pdf", create_structured_pdf, structured_resume, template)
+        timed("resume_templates", render_template_pdfs, structured_resume)
+    else:
+        resume = generate("resume_llm", "resume", RESUME_SYSTEM_PROMPTS[template], prompt)
+        timed("resume_pdf", create_professional_pdf, resume, candidate_data['name'])
+    timed("ats_score", analyze_resume, resume, JOB_DESCRIPTION, template)
+
+    cover_prompt = generate_cover_letter_prompt(
+        candidate_data, "I love building scalable systems.", "Their mission inspires me.", "Cut API latency by 40%."
+    )
+    generate("cover_letter_llm", "cover_letter", COVER_LETTER_SYSTEM_PROMPT, cover_prompt)
+
+    advisor_prompt = generate_advisor_prompt(candidate_data, "What projects should I build to get hired?")
+    generate("advisor_llm", "advice", CAREER_ADVISOR_SYSTEM_PROMPT, advisor_prompt)
+
+    portfolio_template = list(PORTFOLIO_TEMPLATES)[user_id % len(PORTFOLIO_TEMPLATES)]
+    config = make_config(portfolio_template, "Purple Dream", "Modern (Inter)", "Dark", 2, 8)
+    html = timed("portfolio_html", generate_portfolio_html, config)
+    readme = generate_portfolio_readme(candidate_data['name'], "Dark", portfolio_template, "CDN (lazy loaded)")
+    timed("portfolio_zip", build_portfolio_bundle, html, readme)
+
+    return timings, usages
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def latency_stats(values: List[float]) -> Dict[str, float]:
+    return {
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p95_ms': round(percentile(values, 95) * 1000, 3),
+        'p99_ms': round(percentile(values, 99) * 1000, 3),
+        'max_ms': round(max(values) * 1000, 3),
+    }
+
+def token_stats(usages: List[Dict]) -> Dict[str, int]:
+    return {
+        'calls': len(usages),
+        'input_tokens': sum(usage.get('input_tokens', 0) for usage in usages),
+        'cached_tokens': sum(usage.get('cached_tokens', 0) for usage in usages),
+        'output_tokens': sum(usage.get('output_tokens', 0) for usage in usages),
+        'shortened_calls': sum(1 for usage in usages if usage.get('shortened_by') and usage.get('max_output_tokens')),
+        'refused_calls': sum(1 for usage in usages if not usage.get('max_output_tokens')),
+    }
+
+def run_benchmark(users: int, concurrency: int, daily_token_budget: int, structured: bool = False) -> Dict:
+    journeys = []
+    usages = []
+    errors = []
+    lock = threading.Lock()
+    daily_budget = DailyTokenBudget("today's", daily_token_budget)
+
+    def simulate(user_id):
+        start = time.perf_counter()
+        try:
+            timings, calls = run_journey(user_id, daily_budget, structured)
+        except Exception as e:
+            with lock:
+                errors.append(f"user {user_id}: {e}")
+            return
+        timings['total'] = time.perf_counter() - start
+        with lock:
+            journeys.append(timings)
+            usages.extend(calls)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(simulate, range(users)))
+    wall = time.perf_counter() - wall_start
+
+    stages = {stage: latency_stats([j[stage] for j in journeys]) for stage in STAGES + ['total']
+              if journeys and stage in journeys[0]}
+    return {
+        'users': users,
+        'completed': len(journeys),
+        'errors': errors,
+        'wall_seconds': round(wall, 3),
+        'throughput_users_per_sec': round(len(journeys) / wall, 3) if wall else 0.0,
+        'stages': stages,
+        'tokens': token_stats(usages),
+    }
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50, help="Simulated users (default: 50)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Users running at once (default: 8)")
+    parser.add_argument("--latency", default="lognormal:-0.7,0.5",
+                        help="Fake LLM latency distribution in seconds (default: lognormal:-0.7,0.5)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake LLM calls that fail")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the fake backend")
+    parser.add_argument("--daily-budget", type=int, default=10**9, help="Daily token budget shared by all users (default: unlimited)")
+    parser.add_argument("--structured", action="store_true", help="Generate the resume as JSON and render it locally")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    fake_gemini.configure(latency=args.latency, error_rate=args.error_rate, seed=args.seed)
+    results = run_benchmark(args.users, args.concurrency, args.daily_budget, args.structured)
+    report = {
+        'meta': {
+            'benchmark': "user_journey",
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'concurrency': args.concurrency,
+            'latency': args.latency,
+            'error_rate': args.error_rate,
+            'seed': args.seed,
+            'daily_budget': args.daily_budget,
+            'structured': args.structured,
+        },
+        **results,
+    }
+
+    print(f"{'Stage':<18}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for stage, stats in results['stages'].items():
+        print(f"{stage:<18}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+    print(f"\n{results['completed']}/{results['users']} users in {results['wall_seconds']}s "
+          f"→ {results['throughput_users_per_sec']} users/sec at concurrency {args.concurrency}")
+    tokens = results['tokens']
+    print(f"Tokens: {tokens['input_tokens']:,} input ({tokens['cached_tokens']:,} cached), {tokens['output_tokens']:,} output "
+          f"over {tokens['calls']} calls; {tokens['shortened_calls']} shortened, {tokens['refused_calls']} refused by the budget")
+    for error in results['errors'][:5]:
+        print(f"ERROR {error}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    return 1 if results['errors'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
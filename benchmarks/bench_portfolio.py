@@ -0,0 +1,238 @@
+"""Benchmark generate_portfolio_html across templates, presets, theme modes and profile sizes.
+
+Runs offline and writes machine-readable JSON so results can be compared between commits. The config
+matrix is recorded in the JSON, and --baseline refuses to compare runs over different matrices (a --quick
+run only compares against a --quick baseline).
+
+A single render takes tens of microseconds, so each timed sample runs --number renders and reports the time
+per render, and a median time only counts as a regression when it is also --min-delta-ms slower.
+
+Usage:
+    python benchmarks/bench_portfolio.py [--quick] [--repeat 5] [--number 50] [--output results.json] [--baseline old.json]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import portfolio  # noqa: E402
+
+THEME_MODES = ["Dark", "Light", "Toggle (User Choice)"]
+# (number of projects, number of technical skills)
+PROFILE_SIZES = [(2, 5), (6, 15), (15, 40)]
+
+SKILL_POOL = [
+    "Python", "JavaScript", "TypeScript", "React", "Node.js", "SQL", "PostgreSQL", "MongoDB", "Docker",
+    "Kubernetes", "AWS", "GCP", "Azure", "Terraform", "Git", "REST APIs", "GraphQL", "Redis", "Kafka",
+    "Spark", "Pandas", "NumPy", "TensorFlow", "PyTorch", "Scikit-learn", "Go", "Rust", "Java", "C++",
+    "Figma", "Tableau", "Linux", "CI/CD", "Jenkins", "Airflow", "FastAPI", "Django", "Flask", "Vue", "Svelte",
+]
+
+def make_config(template: str, color_preset: str, font_preset: str, theme_mode: str, num_projects: int, num_skills: int) -> Dict:
+    """Build a portfolio config the same way the Portfolio tab does"""
+    technical_skills = ", ".join(SKILL_POOL[i % len(SKILL_POOL)] for i in range(num_skills))
+    soft_skills = "Leadership, Communication, Problem Solving, Mentoring, Collaboration"
+    projects = [
+        {
+            'name': f"Project {i + 1}",
+            'type': "Personal",
+            'description': "Built a real-time analytics platform processing 100K+ events per day, cutting report latency by 70%.",
+            'tech': "Python, React, PostgreSQL, Docker",
+            'link': f"github.com/alex/project-{i + 1}",
+        }
+        for i in range(num_projects)
+    ]
+    colors = portfolio.COLOR_PRESETS[color_preset]
+
+    skills_html, projects_html, social_links_html = portfolio.build_portfolio_sections(
+        technical_skills, soft_skills, projects, "github.com/alex", "linkedin.com/in/alex", "alex@example.com"
+    )
+
+    return {
+        'name': "Alex Johnson",
+        'tagline': "Software Engineer | Building innovative solutions",
+        'about': "Passionate Software Engineer with expertise in Python. I love building products that make a difference.",
+        'email': "alex@example.com",
+        'skills_html': skills_html,
+        'projects_html': projects_html,
+        'social_links_html': social_links_html,
+        'primary_color': colors["primary"],
+        'secondary_color': colors["secondary"],
+        'accent_color': colors["accent"],
+        'font_family': portfolio.FONT_PRESETS[font_preset],
+        'hero_title_size': 6,
+        'logo_size': 1.5,
+        'hero_align': "center",
+        'about_layout': "1fr 1fr",
+        'card_radius': 20,
+        'hover_effect': -10,
+        'button_radius': 50,
+        'nav_opacity': 0.8,
+        'show_nav': True,
+        'show_particles': True,
+        'show_about': True,
+        'show_stats': True,
+        'greeting_text': "👋 Hello, I'm",
+        'particles_script': portfolio.generate_particles_script(colors["primary"]),
+        'num_projects': num_projects,
+        'num_skills': num_skills,
+        'years_exp': "1",
+        'theme_mode': theme_mode,
+        'template': template,
+        'bundled_assets': {},
+    }
+
+def bench_config(config: Dict, repeat: int, number: int) -> Dict:
+    """Time (per render, over samples of `number` renders), trace peak memory and measure output size for one config"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            html = portfolio.generate_portfolio_html(config)
+        timings.append((time.perf_counter() - start) * 1000 / number)
+
+    tracemalloc.start()
+    portfolio.generate_portfolio_html(config)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'median_ms': round(statistics.median(timings), 4),
+        'min_ms': round(min(timings), 4),
+        'max_ms': round(max(timings), 4),
+        'peak_kb': round(peak / 1024, 2),
+        'output_bytes': len(html.encode('utf-8')),
+    }
+
+def config_matrix(quick: bool) -> Dict[str, List]:
+    """The dimensions benchmarked; results are only comparable between runs over the same matrix"""
+    return {
+        'templates': list(portfolio.PORTFOLIO_TEMPLATES),
+        'color_presets': list(portfolio.COLOR_PRESETS)[:1] if quick else list(portfolio.COLOR_PRESETS),
+        'font_presets': list(portfolio.FONT_PRESETS)[:2] if quick else list(portfolio.FONT_PRESETS),
+        'theme_modes': THEME_MODES,
+        'profile_sizes': [list(size) for size in PROFILE_SIZES],
+    }
+
+def run_suite(repeat: int, number: int, matrix: Dict[str, List]) -> List[Dict]:
+    results = []
+    configs = itertools.product(matrix['templates'], matrix['color_presets'], matrix['font_presets'],
+                                matrix['theme_modes'], matrix['profile_sizes'])
+    for template, color_preset, font_preset, theme_mode, (num_projects, num_skills) in configs:
+        config = make_config(template, color_preset, font_preset, theme_mode, num_projects, num_skills)
+        results.append({
+            'template': template,
+            'color_preset': color_preset,
+            'font_preset': font_preset,
+            'theme_mode': theme_mode,
+            'num_projects': num_projects,
+            'num_skills': num_skills,
+            **bench_config(config, repeat, number),
+        })
+    return results
+
+def summarize(results: List[Dict]) -> Dict[str, Dict]:
+    """Aggregate results per template"""
+    summary = {}
+    for template in dict.fromkeys(r['template'] for r in results):
+        rows = [r for r in results if r['template'] == template]
+        summary[template] = {
+            'configs': len(rows),
+            'median_ms': round(statistics.median(r['median_ms'] for r in rows), 4),
+            'p95_ms': round(sorted(r['median_ms'] for r in rows)[int(0.95 * (len(rows) - 1))], 4),
+            'max_peak_kb': max(r['peak_kb'] for r in rows),
+            'max_output_bytes': max(r['output_bytes'] for r in rows),
+        }
+    return summary
+
+def compare(summary: Dict, matrix: Dict[str, List], baseline_path: str, threshold: float, min_delta_ms: float) -> List[str]:
+    """Return templates whose median time or output size regressed beyond the threshold.
+
+    A median time must also be at least min_delta_ms slower, so timer noise on fast templates doesn't count.
+
+    Raises ValueError when the baseline was run over a different config matrix.
+    """
+    with open(baseline_path, encoding='utf-8') as f:
+        report = json.load(f)
+    if report['meta'].get('matrix') != matrix:
+        raise ValueError(f"{baseline_path} was run over a different config matrix; "
+                         f"make the baseline with the same options (e.g. both with or both without --quick)")
+    baseline = report['summary']
+
+    regressions = []
+    for template, stats in summary.items():
+        old = baseline.get(template)
+        if not old:
+            continue
+        for metric in ('median_ms', 'max_output_bytes', 'max_peak_kb'):
+            if metric == 'median_ms' and stats[metric] - old[metric] < min_delta_ms:
+                continue
+            if old[metric] and stats[metric] > old[metric] * (1 + threshold):
+                regressions.append(f"{template}: {metric} {old[metric]} -> {stats[metric]}")
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed samples per config (default: 5)")
+    parser.add_argument("--number", type=int, default=50, help="Renders per timed sample (default: 50)")
+    parser.add_argument("--quick", action="store_true", help="Use one color preset and two font presets")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--baseline", help="Previous JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed regression ratio (default: 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.002,
+                        help="Smallest median time increase counted as a regression (default: 0.002)")
+    args = parser.parse_args(argv)
+
+    matrix = config_matrix(args.quick)
+    results = run_suite(args.repeat, args.number, matrix)
+    summary = summarize(results)
+    report = {
+        'meta': {
+            'benchmark': "portfolio_generation",
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'number': args.number,
+            'quick': args.quick,
+            'matrix': matrix,
+        },
+        'summary': summary,
+        'results': results,
+    }
+
+    print(f"{'Template':<24}{'Configs':>8}{'Median ms':>11}{'p95 ms':>9}{'Peak KB':>10}{'Max bytes':>11}")
+    for template, stats in summary.items():
+        print(f"{template:<24}{stats['configs']:>8}{stats['median_ms']:>11.3f}{stats['p95_ms']:>9.3f}"
+              f"{stats['max_peak_kb']:>10.1f}{stats['max_output_bytes']:>11,}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        try:
+            regressions = compare(summary, matrix, args.baseline, args.threshold, args.min_delta_ms)
+        except ValueError as e:
+            print(f"ERROR {e}")
+            return 2
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Measure the size of the prompts sent to Gemini, in characters and estimated input tokens.
+
+Compiles the resume (every template), cover letter and career advisor prompts for a full profile,
+a sparse one with only the required fields, and one with over-long experience descriptions, and
+reports the average size per prompt kind, split into the system instruction shared by every user
+and the per-user message. Nothing is sent; sizes are what each generation costs in input tokens.
+
+Usage:
+    python benchmarks/bench_prompts.py [--output prompts.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ["GEMINI_BACKEND"] = "fake"
+
+from bench_journey import make_profile  # noqa: E402
+from profile_model import Profile  # noqa: E402
+from prompts import (CAREER_ADVISOR_SYSTEM_PROMPT, COVER_LETTER_SYSTEM_PROMPT, RESUME_SYSTEM_PROMPTS,  # noqa: E402
+                     compile_candidate_data, estimate_tokens, generate_advisor_prompt, generate_cover_letter_prompt,
+                     generate_resume_prompt)
+from resume_templates import RESUME_TEMPLATES  # noqa: E402
+
+LONG_DESCRIPTION = "• Shipped features end to end, with measurable impact on latency and reliability. " * 60
+
+def make_profiles() -> Dict[str, Profile]:
+    full = make_profile(1)
+    return {
+        'full': full,
+        'sparse': Profile(name="Sam Lee", email="sam@example.com", phone="+1 555 123 4567",
+                          target_role="Data Analyst", technical_skills="SQL, Excel, Tableau"),
+        'long_descriptions': full.update(experiences=[
+            {'title': f"Engineer {i}", 'company': "TechCorp Inc.", 'description': LONG_DESCRIPTION} for i in range(3)
+        ]),
+    }
+
+def measure_prompts(profile: Profile) -> Dict[str, Dict]:
+    candidate_data = compile_candidate_data(profile)
+    # kind -> [(system instruction, per-user message)]
+    prompts = {
+        'resume': [(RESUME_SYSTEM_PROMPTS[template], generate_resume_prompt(template, candidate_data))
+                   for template in RESUME_TEMPLATES],
+        'cover_letter': [(COVER_LETTER_SYSTEM_PROMPT, generate_cover_letter_prompt(
+            candidate_data, "I love building products people use.", "Their mission matches mine.", "Led a team of 4 to ship an app."
+        ))],
+        'advice': [(CAREER_ADVISOR_SYSTEM_PROMPT, generate_advisor_prompt(candidate_data, "How do I negotiate my first salary offer?"))],
+    }
+    return {
+        kind: {
+            'chars': round(sum(len(system) + len(message) for system, message in pairs) / len(pairs)),
+            'shared_tokens': round(sum(estimate_tokens(system) for system, _ in pairs) / len(pairs)),
+            'user_tokens': round(sum(estimate_tokens(message) for _, message in pairs) / len(pairs)),
+        }
+        for kind, pairs in prompts.items()
+    }
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = {name: measure_prompts(profile) for name, profile in make_profiles().items()}
+
+    print(f"{'Profile':<20}{'Prompt':<15}{'chars':>10}{'~shared':>10}{'~per-user':>12}")
+    for name, kinds in results.items():
+        for kind, size in kinds.items():
+            print(f"{name:<20}{kind:<15}{size['chars']:>10,}{size['shared_tokens']:>10,}{size['user_tokens']:>12,}")
+
+    if args.output:
+        report = {
+            'meta': {
+                'benchmark': "prompts",
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'resume_templates': len(RESUME_TEMPLATES),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Measure cold-start cost of app.py with `python -X importtime` in fresh interpreters.
+
+Reports the time to import app (what every new server process pays before the first page paints),
+the heaviest imports underneath it, and the deferred costs paid later: loading the Gemini SDK on the
+first generation and the first PDF export with and without the ReportLab warm-up.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--top 10] [--output startup.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each snippet runs in a fresh interpreter and prints one number of seconds
+DEFERRED_COSTS = {
+    'gemini_sdk_load': (
+        "import time, app, llm_client; start = time.perf_counter(); llm_client.load_genai(); print(time.perf_counter() - start)"
+    ),
+    'first_pdf_cold': (
+        "import time, app, pdf_export; start = time.perf_counter(); "
+        "pdf_export.create_professional_pdf('# Alex\\n## Skills\\n- Python', 'Alex'); print(time.perf_counter() - start)"
+    ),
+    'first_pdf_after_warmup': (
+        "import time, app, pdf_export; pdf_export.warm_up_pdf_export(); start = time.perf_counter(); "
+        "pdf_export.create_professional_pdf('# Alex\\n## Skills\\n- Python', 'Alex'); print(time.perf_counter() - start)"
+    ),
+}
+
+def run_python(args: List[str]) -> subprocess.CompletedProcess:
+    # The real SDK backend, with a placeholder key so app.py doesn't stop; nothing calls the API
+    env = {**os.environ, 'GEMINI_API_KEY': os.environ.get('GEMINI_API_KEY', "startup-benchmark"), 'GEMINI_BACKEND': "google"}
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+def parse_importtime(stderr: str) -> List[Tuple[int, int, int, str]]:
+    """Parse `-X importtime` lines into (depth, self_us, cumulative_us, module)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+def measure_import(top: int) -> Dict:
+    rows = parse_importtime(run_python(["-X", "importtime", "-c", "import app"]).stderr)
+    app_row = next(row for row in rows if row[3] == "app")
+    # Modules app.py pulls in directly (nested one level below it)
+    direct = sorted((row for row in rows if row[0] == 1), key=lambda row: row[2], reverse=True)
+    return {
+        'app_import_ms': app_row[2] / 1000,
+        'app_module_body_ms': app_row[1] / 1000,
+        'heaviest_imports': {name: cumulative / 1000 for _, _, cumulative, name in direct[:top]},
+        'gemini_sdk_imported': any(row[3] == "google.generativeai" for row in rows),
+    }
+
+def measure_deferred(snippet: str) -> float:
+    return float(run_python(["-c", snippet]).stdout.strip().splitlines()[-1]) * 1000
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per measurement (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest direct imports to list (default: 10)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    imports = [measure_import(args.top) for _ in range(args.repeat)]
+    results = {
+        'app_import_ms': round(statistics.median(r['app_import_ms'] for r in imports), 1),
+        'app_module_body_ms': round(statistics.median(r['app_module_body_ms'] for r in imports), 1),
+        'gemini_sdk_imported_at_startup': imports[-1]['gemini_sdk_imported'],
+        'heaviest_imports_ms': {
+            name: round(statistics.median(r['heaviest_imports'].get(name, 0.0) for r in imports), 1)
+            for name in imports[-1]['heaviest_imports']
+        },
+        'deferred_ms': {
+            name: round(statistics.median(measure_deferred(snippet) for _ in range(args.repeat)), 1)
+            for name, snippet in DEFERRED_COSTS.items()
+        },
+    }
+
+    print(f"import app: {results['app_import_ms']:.1f} ms (module body {results['app_module_body_ms']:.1f} ms), "
+          f"Gemini SDK imported at startup: {'yes' if results['gemini_sdk_imported_at_startup'] else 'no'}")
+    print(f"\n{'Heaviest direct imports':<40}{'ms':>10}")
+    for name, ms in results['heaviest_imports_ms'].items():
+        print(f"{name:<40}{ms:>10.1f}")
+    print(f"\n{'Deferred cost':<40}{'ms':>10}")
+    for name, ms in results['deferred_ms'].items():
+        print(f"{name:<40}{ms:>10.1f}")
+
+    if args.output:
+        report = {
+            'meta': {
+                'benchmark': "startup",
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': args.repeat,
+            },
+            **results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""Load test that drives concurrent Streamlit sessions of app.py through Streamlit's AppTest API.
+
+Every simulated session runs the real script with the fake Gemini backend, fills in its profile and then
+performs a weighted mix of sidebar edits, customization changes and button clicks. For each session count
+the driver reports per-rerun latency, process CPU and memory growth per session, and flags the first
+session count where p95 rerun latency breaks the SLO.
+
+Usage:
+    python benchmarks/load_test.py --sessions 1,2,4,8,16 --actions 20 --latency constant:0.5 [--output load.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ["GEMINI_BACKEND"] = "fake"
+
+import fake_gemini  # noqa: E402
+from bench_journey import latency_stats  # noqa: E402
+from streamlit import config  # noqa: E402
+from streamlit.runtime import Runtime  # noqa: E402
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache  # noqa: E402
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "app.py")
+
+_shared_runtime = {}
+
+def share_apptest_runtime():
+    """Let concurrent AppTest sessions share one runtime and one compiled script.
+
+    AppTest installs a mock Runtime singleton and turns on the global.appTest option at the start of
+    every run and undoes both at the end, so parallel sessions would pull them out from under each
+    other mid-run. It also recompiles app.py on every run. Like a real server process, all sessions
+    here resolve to the most recently installed runtime, keep global.appTest on and reuse a single
+    script cache instead.
+    """
+    config.set_option("global.appTest", True)
+    script_cache = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+    def instance(cls):
+        if cls._instance is not None:
+            _shared_runtime['runtime'] = cls._instance
+        if 'runtime' not in _shared_runtime:
+            raise RuntimeError("Runtime hasn't been created!")
+        return _shared_runtime['runtime']
+
+    def exists(cls):
+        return cls._instance is not None or 'runtime' in _shared_runtime
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+
+def _find(elements, label: str):
+    for element in elements:
+        if element.label == label:
+            return element
+    raise LookupError(f"No widget labelled {label!r}")
+
+def edit_name(at, rng):
+    _find(at.sidebar.text_input, "Full Name *").input(f"Student {rng.randint(1, 99999)}")
+
+def edit_headline(at, rng):
+    _find(at.sidebar.text_input, "Professional Headline").input(rng.choice([
+        "Software Engineer | Open Source Contributor", "Data Scientist | ML Enthusiast", "Full-Stack Developer",
+    ]))
+
+def edit_skills(at, rng):
+    skills = ["Python", "JavaScript", "React", "SQL", "Docker", "AWS", "Go", "Kubernetes", "TensorFlow", "Figma"]
+    _find(at.sidebar.text_area, "Technical Skills *").input(", ".join(rng.sample(skills, rng.randint(3, len(skills)))))
+
+def edit_project(at, rng):
+    _find(at.sidebar.text_area, "Description & Impact").input(
+        f"Built a dashboard processing {rng.randint(10, 500)}K+ transactions, cutting report time by {rng.randint(10, 90)}%"
+    )
+
+def change_card_radius(at, rng):
+    _find(at.slider, "Card Border Radius (px)").set_value(rng.randint(10, 30))
+
+def change_color(at, rng):
+    _find(at.selectbox, "Color Preset").set_value(rng.choice(_find(at.selectbox, "Color Preset").options))
+
+def generate_resume(at, rng):
+    at.button(key="gen_resume_btn").click()
+
+def generate_cover_letter(at, rng):
+    _find(at.button, "✍️ Generate Cover Letter").click()
+
+def build_portfolio(at, rng):
+    _find(at.button, "🚀 Build My Portfolio").click()
+
+def ask_advisor(at, rng):
+    _find(at.text_area, "Ask anything about your career:").input("What projects should I build to get hired?")
+    _find(at.button, "🤖 Get AI Advice").click()
+
+RESUME_TAB = "📄 Resume Generator"
+COVER_LETTER_TAB = "💌 Cover Letter"
+PORTFOLIO_TAB = "🌐 Portfolio Website"
+ADVISOR_TAB = "🎯 Career Advisor"
+
+# (action, weight, tab it needs open). Form filling dominates real sessions; generation clicks are comparatively rare
+ACTIONS = {
+    "edit_name": (edit_name, 3, None),
+    "edit_headline": (edit_headline, 3, None),
+    "edit_skills": (edit_skills, 4, None),
+    "edit_project": (edit_project, 4, None),
+    "change_card_radius": (change_card_radius, 3, PORTFOLIO_TAB),
+    "change_color": (change_color, 2, PORTFOLIO_TAB),
+    "generate_resume": (generate_resume, 1, RESUME_TAB),
+    "generate_cover_letter": (generate_cover_letter, 1, COVER_LETTER_TAB),
+    "build_portfolio": (build_portfolio, 1, PORTFOLIO_TAB),
+    "ask_advisor": (ask_advisor, 1, ADVISOR_TAB),
+}
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_session(session_id: int, actions: int, think_time: float, timeout: float, seed: int,
+                samples: Dict[str, List[float]], errors: List[str], apps: List, lock: threading.Lock):
+    """Drive one session: initial load, profile fill-in, then a random mix of actions"""
+    rng = random.Random(seed + session_id)
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+    def rerun(action: str):
+        start = time.perf_counter()
+        at.run()
+        elapsed = time.perf_counter() - start
+        with lock:
+            samples.setdefault(action, []).append(elapsed)
+            samples.setdefault("all", []).append(elapsed)
+            if at.exception:
+                errors.append(f"session {session_id} {action}: {at.exception[0].message}")
+
+    try:
+        rerun("initial_load")
+        _find(at.sidebar.text_input, "Full Name *").input(f"Student {session_id}")
+        _find(at.sidebar.text_input, "Email *").input(f"student{session_id}@example.com")
+        rerun("fill_profile")
+
+        names = list(ACTIONS)
+        weights = [ACTIONS[name][1] for name in names]
+        active_tab = RESUME_TAB
+        for _ in range(actions):
+            time.sleep(rng.uniform(0, 2 * think_time))
+            name = rng.choices(names, weights)[0]
+            action, _, tab = ACTIONS[name]
+            # Only the open tab is rendered, so switch first like a user clicking the tab
+            if tab and tab != active_tab:
+                at.session_state["active_tab"] = active_tab = tab
+                rerun("switch_tab")
+            action(at, rng)
+            rerun(name)
+    except Exception as e:
+        with lock:
+            errors.append(f"session {session_id}: {e!r}")
+
+    # Keep the session alive until the step ends so its memory counts towards the measurement
+    with lock:
+        apps.append(at)
+
+def run_step(sessions: int, actions: int, think_time: float, timeout: float, seed: int) -> Dict:
+    samples = {}
+    errors = []
+    apps = []
+    lock = threading.Lock()
+
+    rss_before = current_rss_mb()
+    cpu_before = time.process_time()
+    wall_start = time.perf_counter()
+
+    threads = [
+        threading.Thread(target=run_session, args=(i, actions, think_time, timeout, seed, samples, errors, apps, lock))
+        for i in range(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_before
+    rss_after = current_rss_mb()
+    apps.clear()
+
+    return {
+        'sessions': sessions,
+        'reruns': len(samples.get("all", [])),
+        'wall_seconds': round(wall, 3),
+        'reruns_per_sec': round(len(samples.get("all", [])) / wall, 3) if wall else 0.0,
+        'cpu_seconds': round(cpu, 3),
+        'cpu_cores_busy': round(cpu / wall, 3) if wall else 0.0,
+        'rss_before_mb': round(rss_before, 1),
+        'rss_after_mb': round(rss_after, 1),
+        'rss_growth_per_session_mb': round((rss_after - rss_before) / sessions, 2),
+        'rerun_latency': {action: latency_stats(values) for action, values in samples.items()},
+        'errors': errors,
+    }
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", default="1,2,4,8,16", help="Comma-separated session counts (default: 1,2,4,8,16)")
+    parser.add_argument("--actions", type=int, default=20, help="Actions per session after the profile is filled in")
+    parser.add_argument("--think-time", type=float, default=0.2, help="Mean pause between actions in seconds")
+    parser.add_argument("--latency", default="constant:0.5", help="Fake LLM latency distribution (default: constant:0.5)")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-rerun timeout in seconds")
+    parser.add_argument("--slo-ms", type=float, default=1000, help="p95 rerun latency SLO in ms (default: 1000)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for actions and the fake backend")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    fake_gemini.configure(latency=args.latency, seed=args.seed)
+    share_apptest_runtime()
+    # A throwaway profile store, so outputs cached by earlier runs aren't reused
+    store_dir = tempfile.TemporaryDirectory(prefix="load_test_")
+    os.environ["PROFILE_DB_PATH"] = os.path.join(store_dir.name, "profiles.db")
+
+    # Warm-up: import caches and the shared runtime, outside the measurements
+    AppTest.from_file(APP_PATH, default_timeout=args.timeout).run()
+
+    steps = []
+    breaking_point = None
+    print(f"{'Sessions':>8}{'Reruns':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'CPU cores':>11}{'MB/session':>12}")
+    for sessions in [int(n) for n in args.sessions.split(",")]:
+        step = run_step(sessions, args.actions, args.think_time, args.timeout, args.seed)
+        steps.append(step)
+        overall = step['rerun_latency'].get("all", latency_stats([0.0]))
+        print(f"{sessions:>8}{step['reruns']:>8}{overall['p50_ms']:>10.1f}{overall['p95_ms']:>10.1f}{overall['p99_ms']:>10.1f}"
+              f"{step['cpu_cores_busy']:>11.2f}{step['rss_growth_per_session_mb']:>12.2f}")
+        for error in step['errors'][:5]:
+            print(f"    ERROR {error}")
+        if breaking_point is None and overall['p95_ms'] > args.slo_ms:
+            breaking_point = sessions
+
+    if breaking_point:
+        print(f"\np95 rerun latency exceeds {args.slo_ms:.0f} ms at {breaking_point} concurrent sessions")
+    else:
+        print(f"\np95 rerun latency stayed under {args.slo_ms:.0f} ms for all session counts")
+
+    if args.output:
+        report = {
+            'meta': {
+                'benchmark': "streamlit_sessions",
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'actions': args.actions,
+                'think_time': args.think_time,
+                'latency': args.latency,
+                'slo_ms': args.slo_ms,
+            },
+            'breaking_point_sessions': breaking_point,
+            'steps': steps,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Circuit breaker for calls to an upstream service, shared by every session in the server process.
+
+Closed: calls go through and consecutive failures are counted. After failure_threshold of them the breaker
+opens: calls fail fast, without touching the upstream, for reset_timeout seconds. Then it is half-open: a
+single trial call goes through; success closes the breaker, failure opens it for another reset_timeout.
+"""
+
+import threading
+import time
+from typing import Callable, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open breaker"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+
+    def _refresh(self):
+        """Move from open to half-open once the timeout has passed; called with the lock held"""
+        if self._state == OPEN and self._clock() >= self._opened_at + self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go to the upstream now; in half-open state only the first caller gets through"""
+        with self._lock:
+            self._refresh()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._trial_running = False
+
+    def release(self):
+        """A call allow() let through was abandoned before it finished; in half-open state the next caller may try"""
+        with self._lock:
+            self._trial_running = False
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a trial call through (0 if it isn't open)"""
+        with self._lock:
+            self._refresh()
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def summary(self) -> Dict:
+        with self._lock:
+            self._refresh()
+            return {'name': self.name, 'state': self._state, 'failures': self._failures}
@@ -0,0 +1,360 @@
+"""Gemini client: loads the SDK on first use and calls it with retries.
+
+Prompts come as a system instruction shared by every user plus a per-user message. Nothing is cached on
+the API side: the instructions are a few hundred tokens, below the minimum size of Gemini's context caching,
+so every call pays for its whole input.
+
+Calls can run under token budgets (see token_budget): the output limit is planned against what is left,
+each attempt reserves its input plus that limit up front, and when the request finishes (even after the
+caller gave up on it) the reservation is settled to the token counts from the response metadata.
+
+All calls in the process share one circuit breaker: while Gemini keeps failing, calls fail fast with a
+message instead of each session waiting through its own retries.
+
+Each attempt runs on a small worker pool inside a total deadline for the call; its own timeout starts when
+a worker picks it up, so time spent queued isn't taken from it. A request still queued at the deadline was
+never sent and doesn't count against Gemini in the circuit breaker. The caller waits in short slices and
+calls on_wait between them; when that raises (Streamlit does on the next element update once the user
+clicks again or leaves), the call is abandoned: a request still queued for a worker never starts, and a
+running one stops at its next streamed chunk, freeing its worker. Only the wait for the first chunk can't
+be cut short. Calls made for one owner (a session) are capped at MAX_SESSION_REQUESTS waiting at once; an
+abandoned request stops counting against its owner right away, so clicking again is never locked out.
+
+With json_output the API is asked for a JSON answer, and a validate hook can reject malformed answers,
+which are retried like empty ones.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Callable, Dict, Sequence, Set
+
+from dotenv import load_dotenv
+
+from circuit_breaker import CLOSED, CircuitBreaker
+from prompts import estimate_tokens
+from token_budget import TokenBudget, plan_output_tokens, reserve_tokens, settle_tokens
+
+load_dotenv()
+
+# GEMINI_BACKEND=fake swaps in the local stand-in used by benchmarks and load tests
+GEMINI_BACKEND = os.getenv("GEMINI_BACKEND", "google")
+
+MODEL_NAME = "gemini-2.0-flash-exp"
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failed attempts that open the breaker, and how long it stays open
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 30.0
+
+GEMINI_CIRCUIT = CircuitBreaker("Gemini", CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS)
+
+# Seconds per attempt and for the whole call including retries; requests in flight at once per process
+ATTEMPT_TIMEOUT = float(os.getenv("GEMINI_ATTEMPT_TIMEOUT", "60"))
+TOTAL_TIMEOUT = float(os.getenv("GEMINI_TOTAL_TIMEOUT", "120"))
+MAX_CONCURRENT_REQUESTS = int(os.getenv("GEMINI_MAX_CONCURRENCY", "16"))
+# Requests one session may be waiting for at once; abandoned ones don't count
+MAX_SESSION_REQUESTS = int(os.getenv("GEMINI_MAX_SESSION_REQUESTS", "2"))
+RETRY_DELAY = 2.0
+# How often a waiting caller gets control back to notice cancellation
+WAIT_SLICE = 0.25
+
+_request_pool = ThreadPoolExecutor(MAX_CONCURRENT_REQUESTS, thread_name_prefix="gemini")
+
+SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+]
+
+# Returned instead of generated text when every attempt failed; error messages start with ERROR_PREFIX
+ERROR_PREFIX = "⚠️"
+EMPTY_RESPONSE_MESSAGE = "I apologize, but I couldn't generate content at this moment. Please try again."
+NO_RESPONSE_MESSAGE = "Unable to generate content. Please try again."
+TIMEOUT_MESSAGE = f"{ERROR_PREFIX} Gemini took too long to answer. Please try again."
+BUSY_MESSAGE = f"{ERROR_PREFIX} The server is busy with other requests. Please try again in a moment."
+SESSION_BUSY_MESSAGE = f"{ERROR_PREFIX} Your previous requests are still finishing. Please try again in a few seconds."
+
+class NotStartedError(TimeoutError):
+    """The request was still queued for a worker at its deadline, so it was never sent"""
+
+class SessionBusyError(RuntimeError):
+    """The owner already has MAX_SESSION_REQUESTS requests in flight"""
+
+class RequestAbandoned(Exception):
+    """Stops a streamed request on its worker once nobody waits for it"""
+
+def gemini_unavailable() -> bool:
+    """True while the breaker is open or half-open, i.e. recent calls kept failing"""
+    return GEMINI_CIRCUIT.state != CLOSED
+
+def unavailable_message() -> str:
+    seconds = math.ceil(GEMINI_CIRCUIT.retry_after()) or 1
+    return f"{ERROR_PREFIX} Gemini isn't responding right now. Please try again in {seconds} seconds."
+
+def is_failed_response(text: str) -> bool:
+    """True for the error/apology messages call_gemini_with_retry returns instead of content"""
+    return not text or text.startswith(ERROR_PREFIX) or text in (EMPTY_RESPONSE_MESSAGE, NO_RESPONSE_MESSAGE)
+
+@lru_cache(maxsize=None)
+def load_genai():
+    """Import and configure the Gemini SDK once per process, on the first generation.
+
+    The SDK import is most of the app's cold start, so it is kept off the first page load.
+    """
+    if GEMINI_BACKEND == "fake":
+        import fake_gemini as genai
+    else:
+        import google.generativeai as genai
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY", ""))
+    return genai
+
+def build_model(genai, max_tokens: int, system_instruction: str = None, json_output: bool = False):
+    """Model for one call; the system instruction goes first, as the prefix shared by every user"""
+    generation_config = {
+        "temperature": 0.7,
+        "top_p": 0.95,
+        "top_k": 40,
+        "max_output_tokens": max_tokens,
+    }
+    if json_output:
+        generation_config["response_mime_type"] = "application/json"
+    return genai.GenerativeModel(MODEL_NAME, generation_config=generation_config, safety_settings=SAFETY_SETTINGS,
+                                 system_instruction=system_instruction)
+
+# ------------------------- Generation -----------------------------
+
+def extract_text(response) -> str:
+    """The response text, joined from the candidates' parts when .text is empty"""
+    if hasattr(response, 'text') and response.text:
+        return response.text.strip()
+    return parts_text(response).strip()
+
+def parts_text(response) -> str:
+    """Text of the candidates' parts; unlike .text it works on any streamed chunk, even one without parts"""
+    text_parts = []
+    for candidate in getattr(response, 'candidates', None) or ():
+        if hasattr(candidate, 'content') and hasattr(candidate.content, 'parts'):
+            for part in candidate.content.parts:
+                if hasattr(part, 'text') and part.text:
+                    text_parts.append(part.text)
+    return ' '.join(text_parts)
+
+def response_usage(response, input_estimate: int, text: str) -> Dict[str, int]:
+    """Token counts from the response metadata, or local estimates where it has none"""
+    metadata = getattr(response, 'usage_metadata', None)
+    return {
+        'input_tokens': getattr(metadata, 'prompt_token_count', 0) or input_estimate,
+        'cached_tokens': getattr(metadata, 'cached_content_token_count', 0) or 0,
+        'output_tokens': getattr(metadata, 'candidates_token_count', 0) or estimate_tokens(text),
+    }
+
+# owner -> its requests on the pool that haven't finished (or been cancelled) yet
+_owner_requests: Dict[str, Set] = {}
+_owner_lock = threading.Lock()
+
+def _forget_request(owner: str, future):
+    with _owner_lock:
+        requests = _owner_requests.get(owner)
+        if requests is not None:
+            requests.discard(future)
+            if not requests:
+                del _owner_requests[owner]
+
+def submit_request(func: Callable, owner: str = None):
+    """Submit func to the request pool; raises SessionBusyError while owner has MAX_SESSION_REQUESTS in flight"""
+    if owner is None:
+        return _request_pool.submit(func)
+    with _owner_lock:
+        requests = _owner_requests.setdefault(owner, set())
+        if len(requests) >= MAX_SESSION_REQUESTS:
+            raise SessionBusyError(f"{len(requests)} requests still in flight")
+        future = _request_pool.submit(func)
+        requests.add(future)
+    # Runs when the request finishes, however long after the caller gave up on it
+    future.add_done_callback(lambda done: _forget_request(owner, done))
+    return future
+
+def wait_for(func: Callable, timeout: float, on_wait: Callable[[float], None] = None, deadline: float = None,
+             owner: str = None, on_cancel: Callable[[], None] = None, on_abandon: Callable[[], None] = None):
+    """Run func on the request pool and wait for it, calling on_wait(elapsed) between slices.
+
+    timeout counts from when a worker picks func up; deadline (time.monotonic(), default: timeout from now)
+    bounds the whole wait, queue included. Raises NotStartedError if func was still queued at the deadline,
+    TimeoutError if it ran out of time. If on_wait raises or time runs out, func is abandoned: cancelled if it
+    hasn't started yet (on_cancel() runs then), otherwise it stops counting against owner and on_abandon()
+    asks it to stop early.
+    """
+    started = []
+    def job():
+        started.append(time.monotonic())
+        return func()
+    
+    start = time.monotonic()
+    if deadline is None:
+        deadline = start + timeout
+    future = submit_request(job, owner)
+    if on_cancel is not None:
+        future.add_done_callback(lambda done: done.cancelled() and on_cancel())
+    try:
+        while True:
+            end = min(started[0] + timeout, deadline) if started else deadline
+            left = end - time.monotonic()
+            if left <= 0:
+                if future.cancel():
+                    raise NotStartedError(f"Deadline exceeded: no free worker within {deadline - start:.0f}s")
+                raise TimeoutError(f"Deadline exceeded: no answer within {timeout:.0f}s")
+            try:
+                return future.result(timeout=min(WAIT_SLICE, left))
+            except FutureTimeoutError:
+                if on_wait:
+                    on_wait(time.monotonic() - start)
+    finally:
+        if not future.cancel() and not future.done():
+            if owner is not None:
+                _forget_request(owner, future)
+            if on_abandon is not None:
+                on_abandon()
+
+def pause(seconds: float, on_wait: Callable[[float], None] = None):
+    """time.sleep that still lets on_wait cancel the call"""
+    end = time.monotonic() + seconds
+    while (left := end - time.monotonic()) > 0:
+        time.sleep(min(WAIT_SLICE, left))
+        if on_wait:
+            on_wait(seconds - max(0.0, end - time.monotonic()))
+
+def call_gemini_with_retry(prompt: str, max_tokens: int = 2500, retries: int = 3, system_instruction: str = None,
+                           budgets: Sequence[TokenBudget] = (), usage: Dict = None,
+                           on_wait: Callable[[float], None] = None, timeout: float = TOTAL_TIMEOUT,
+                           json_output: bool = False, validate: Callable[[str], None] = None, owner: str = None) -> str:
+    """Enhanced Gemini API call with retry logic; system_instruction is the prompt part shared by every user.
+
+    With budgets, max_tokens is lowered as they run low and the call is refused once they can't cover it.
+    A usage dict, if given, is filled in with the token counts and the output limit used. Attempts time out
+    after ATTEMPT_TIMEOUT and the whole call after timeout seconds; on_wait(elapsed seconds) is called while
+    waiting and may raise to cancel. validate(text) raises ValueError for an answer that should be retried.
+    owner (e.g. a session id) caps that caller's requests in flight at MAX_SESSION_REQUESTS.
+    """
+    input_estimate = estimate_tokens(prompt) + estimate_tokens(system_instruction or "")
+    max_tokens, limiting = plan_output_tokens(max_tokens, input_estimate, budgets)
+    if usage is not None:
+        usage.update(max_output_tokens=max_tokens, shortened_by=limiting.name if limiting else None)
+    if not max_tokens:
+        return f"{ERROR_PREFIX} {limiting.name.capitalize()} AI budget is used up. Please try again later."
+    
+    genai = load_genai()
+    deadline = time.monotonic() + timeout
+    
+    for attempt in range(retries):
+        left = deadline - time.monotonic()
+        if left <= 0:
+            return TIMEOUT_MESSAGE
+        # Fail fast while the breaker is open, including between this call's own retries
+        if not GEMINI_CIRCUIT.allow():
+            return unavailable_message()
+        response = None
+        # Reserved before sending, so concurrent calls can't spend the same tokens
+        reservation = input_estimate + max_tokens
+        short = reserve_tokens(budgets, reservation)
+        if short is not None:
+            GEMINI_CIRCUIT.release()
+            return f"{ERROR_PREFIX} {short.name.capitalize()} AI budget is used up. Please try again later."
+        
+        abandoned = threading.Event()
+        
+        def settle(answer=None, text: str = ""):
+            """Settle this attempt's reservation to what it used (nothing without an answer)"""
+            used = 0
+            if answer is not None:
+                counts = response_usage(answer, input_estimate, text)
+                used = counts['input_tokens'] + counts['output_tokens']
+            settle_tokens(budgets, reservation, used)
+        
+        try:
+            def request():
+                # Settled on the worker, so abandoned and timed-out requests are charged too
+                answer, chunks = None, []
+                try:
+                    # Whatever is left of the call's deadline once a worker is free, up to ATTEMPT_TIMEOUT
+                    attempt_timeout = max(1.0, min(ATTEMPT_TIMEOUT, deadline - time.monotonic()))
+                    model = build_model(genai, max_tokens, system_instruction, json_output)
+                    # Streamed, so an abandoned attempt stops at its next chunk instead of holding a worker
+                    answer = model.generate_content(prompt, stream=True, request_options={"timeout": attempt_timeout})
+                    for chunk in answer:
+                        chunks.append(parts_text(chunk))
+                        if abandoned.is_set():
+                            raise RequestAbandoned("Nobody is waiting for the answer")
+                    return answer
+                finally:
+                    settle(answer, "".join(chunks))
+            
+            try:
+                response = wait_for(request, ATTEMPT_TIMEOUT, on_wait, deadline, owner, settle, abandoned.set)
+            except BaseException as e:
+                if not isinstance(e, Exception):
+                    # Cancelled by the caller: this attempt says nothing about Gemini's health
+                    GEMINI_CIRCUIT.release()
+                raise
+            GEMINI_CIRCUIT.record_success()
+            text = extract_text(response)
+            
+            # Input is billed whether or not any text came back; settle() charges the budgets
+            counts = response_usage(response, input_estimate, text)
+            if usage is not None:
+                usage.update(counts)
+            logger.info("Gemini call: %(input_tokens)d input tokens (%(cached_tokens)d cached), "
+                        "%(output_tokens)d output tokens", counts)
+            
+            if text and validate is not None:
+                try:
+                    validate(text)
+                except ValueError as e:
+                    logger.warning("Gemini answer failed validation: %s", e)
+                    if attempt == retries - 1:
+                        return f"{ERROR_PREFIX} The answer didn't have the expected format ({e}). Please try again."
+                    text = ""
+            
+            if text:
+                return text
+            
+            if attempt < retries - 1:
+                pause(min(RETRY_DELAY, max(0.0, deadline - time.monotonic())), on_wait)
+                continue
+            else:
+                return EMPTY_RESPONSE_MESSAGE
+                
+        except Exception as e:
+            error_msg = str(e)
+            if isinstance(e, SessionBusyError):
+                # Refused before it was submitted, so neither the worker nor on_cancel settles it
+                settle_tokens(budgets, reservation, 0)
+            if isinstance(e, (NotStartedError, SessionBusyError)):
+                # Never sent, so it says nothing about Gemini's health
+                GEMINI_CIRCUIT.release()
+                return BUSY_MESSAGE if isinstance(e, NotStartedError) else SESSION_BUSY_MESSAGE
+            if response is None:
+                if "invalid" in error_msg.lower() and "quota" not in error_msg.lower():
+                    # The API answered; the request or key is wrong, which fail-fast can't fix
+                    GEMINI_CIRCUIT.record_success()
+                else:
+                    GEMINI_CIRCUIT.record_failure()
+            if "quota" in error_msg.lower():
+                return f"{ERROR_PREFIX} API quota exceeded. Please try again later."
+            elif "invalid" in error_msg.lower():
+                return f"{ERROR_PREFIX} Invalid API key. Please check your GEMINI_API_KEY."
+            elif attempt < retries - 1:
+                pause(min(RETRY_DELAY, max(0.0, deadline - time.monotonic())), on_wait)
+                continue
+            elif isinstance(e, TimeoutError) or "deadline" in error_msg.lower():
+                return TIMEOUT_MESSAGE
+            else:
+                return f"{ERROR_PREFIX} Error: {error_msg}"
+    
+    return NO_RESPONSE_MESSAGE
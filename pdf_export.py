@@ -0,0 +1,277 @@
+"""PDF rendering of generated resumes and cover letters with ReportLab.
+
+Free-form resumes are parsed from their Markdown line by line; structured resumes (resume_schema) are laid
+out straight from their fields, in any template's look, so one generation renders as every template locally.
+"""
+
+import logging
+import re
+import threading
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+from resume_schema import ResumeSection, StructuredResume
+from resume_templates import RESUME_TEMPLATES
+
+logger = logging.getLogger(__name__)
+
+def clean_markdown_for_pdf(content: str) -> str:
+    """Remove markdown code blocks"""
+    content = re.sub(r'```markdown\s*', '', content)
+    content = re.sub(r'```\s*', '', content)
+    content = content.replace('```', '')
+    return content.strip()
+
+def warm_up_pdf_export():
+    """Import ReportLab and build a throwaway PDF so the first real export doesn't pay for it"""
+    try:
+        create_professional_pdf("# Warm-up\n## Section\n- Item", "Warm-up")
+    except Exception:
+        pass
+
+@lru_cache(maxsize=None)
+def start_pdf_warmup() -> threading.Thread:
+    """Run the ReportLab warm-up once per process in a background thread"""
+    thread = threading.Thread(target=warm_up_pdf_export, name="pdf-warmup", daemon=True)
+    thread.start()
+    return thread
+
+# The look free-form PDFs keep; structured resumes take their template's "pdf_style" over it
+DEFAULT_PDF_STYLE = {"font": "Helvetica", "title_color": "#6366f1", "accent": "#4f46e5", "align": "center",
+                     "rule": False, "bullet": "•"}
+
+# Base-14 font family -> (regular, bold, CSS font stack for thumbnails)
+PDF_FONTS = {
+    "Helvetica": ("Helvetica", "Helvetica-Bold", "Helvetica, Arial, sans-serif"),
+    "Times-Roman": ("Times-Roman", "Times-Bold", "'Times New Roman', Times, Georgia, serif"),
+    "Courier": ("Courier", "Courier-Bold", "'Courier New', Courier, monospace"),
+}
+
+def pdf_look(template_name: str = None) -> Dict:
+    return {**DEFAULT_PDF_STYLE, **RESUME_TEMPLATES.get(template_name, {}).get("pdf_style", {})}
+
+@lru_cache(maxsize=None)
+def pdf_styles(template_name: str = None) -> Dict:
+    """Paragraph styles for a template's look (the default look without one), built once per process"""
+    try:
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+        from reportlab.lib.colors import HexColor
+    except ImportError:
+        raise Exception("ReportLab not installed. Install with: pip install reportlab")
+    
+    styles = getSampleStyleSheet()
+    look = pdf_look(template_name)
+    font, bold_font, _ = PDF_FONTS[look['font']]
+    alignment = TA_CENTER if look['align'] == "center" else TA_LEFT
+    
+    return {
+        'look': look,
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=HexColor(look['title_color']),
+            spaceAfter=12,
+            alignment=alignment,
+            fontName=bold_font
+        ),
+        'contact': ParagraphStyle(
+            'CustomContact',
+            parent=styles['BodyText'],
+            fontName=font,
+            fontSize=10,
+            textColor=HexColor('#334155'),
+            spaceAfter=2,
+            alignment=alignment,
+            leading=14
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=HexColor(look['accent']),
+            spaceAfter=8,
+            spaceBefore=12,
+            fontName=bold_font
+        ),
+        'subheading': ParagraphStyle(
+            'CustomSubHeading',
+            parent=styles['Heading3'],
+            fontSize=12,
+            textColor=HexColor('#1e293b'),
+            spaceAfter=6,
+            fontName=bold_font
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['BodyText'],
+            fontName=font,
+            fontSize=10,
+            textColor=HexColor('#334155'),
+            spaceAfter=6,
+            alignment=TA_JUSTIFY,
+            leading=14
+        ),
+        'bullet': ParagraphStyle(
+            'CustomBullet',
+            parent=styles['BodyText'],
+            fontName=font,
+            fontSize=10,
+            textColor=HexColor('#475569'),
+            spaceAfter=4,
+            leftIndent=20,
+            bulletIndent=10,
+            leading=13
+        ),
+    }
+
+def build_pdf(story: List) -> bytes:
+    """Lay out ReportLab flowables on letter pages"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch
+    )
+    
+    try:
+        doc.build(story)
+        buffer.seek(0)
+        return buffer.getvalue()
+    except Exception as e:
+        raise Exception(f"PDF generation failed: {str(e)}")
+
+def create_professional_pdf(content: str, name: str, doc_type: str = "resume") -> bytes:
+    """Create professional PDF"""
+    
+    styles = pdf_styles()
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer
+    
+    content = clean_markdown_for_pdf(content)
+    
+    story = []
+    lines = content.split('\n')
+    
+    for line in lines:
+        line = line.strip()
+        
+        if not line:
+            story.append(Spacer(1, 0.1*inch))
+            continue
+        
+        line = line.replace('**', '').replace('*', '')
+        
+        try:
+            if line.startswith('# '):
+                text = line[2:].strip()
+                story.append(Paragraph(text, styles['title']))
+                story.append(Spacer(1, 0.15*inch))
+            elif line.startswith('## '):
+                text = line[3:].strip()
+                story.append(Spacer(1, 0.1*inch))
+                story.append(Paragraph(text, styles['heading']))
+            elif line.startswith('### '):
+                text = line[4:].strip()
+                story.append(Paragraph(text, styles['subheading']))
+            elif line.startswith('- ') or line.startswith('• '):
+                text = '• ' + line[2:].strip()
+                story.append(Paragraph(text, styles['bullet']))
+            else:
+                story.append(Paragraph(line, styles['body']))
+        except Exception as e:
+            safe_text = line.replace('<', '&lt;').replace('>', '&gt;')
+            story.append(Paragraph(safe_text, styles['body']))
+    
+    return build_pdf(story)
+
+def create_structured_pdf(resume: StructuredResume, template_name: str = None) -> bytes:
+    """PDF of a structured resume in a template's look, laid out from its fields instead of parsed back out of Markdown"""
+    
+    styles = pdf_styles(template_name)
+    look = styles['look']
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.units import inch
+    from reportlab.platypus import HRFlowable, Paragraph, Spacer
+    
+    def paragraph(text: str, style: str, bullet: bool = False):
+        return Paragraph((f"{look['bullet']} " if bullet else '') + escape(text), styles[style])
+    
+    story = [paragraph(resume.name, 'title'), Spacer(1, 0.15*inch)]
+    story += [paragraph(" | ".join(part), 'contact') for part in (resume.contact, resume.links) if part]
+    
+    sections = list(resume.sections)
+    if resume.summary:
+        sections.insert(0, ResumeSection("PROFESSIONAL SUMMARY", text=resume.summary))
+    for section in sections:
+        story += [Spacer(1, 0.2*inch), paragraph(section.title, 'heading')]
+        if look['rule']:
+            story.append(HRFlowable(width="100%", thickness=1, color=HexColor(look['accent']), spaceAfter=6))
+        if section.text:
+            story.append(paragraph(section.text, 'body'))
+        story += [paragraph(item, 'bullet', bullet=True) for item in section.items]
+        for entry in section.entries:
+            story.append(paragraph(entry.heading, 'subheading'))
+            if entry.meta:
+                story.append(paragraph(entry.meta, 'body'))
+            story += [paragraph(bullet, 'bullet', bullet=True) for bullet in entry.bullets]
+    
+    return build_pdf(story)
+
+def render_template_pdfs(resume: StructuredResume) -> Tuple[Dict[str, bytes], Dict[str, str]]:
+    """The structured resume as a PDF in every template's look: (PDFs, errors), both keyed by template.
+
+    Rendered one after another: ReportLab is pure Python and holds the GIL, so threads wouldn't overlap the
+    renders. A template whose PDF fails is logged and reported in the errors; the others are still returned.
+    """
+    pdfs, errors = {}, {}
+    for name in RESUME_TEMPLATES:
+        try:
+            pdfs[name] = create_structured_pdf(resume, name)
+        except Exception as e:
+            logger.exception("Could not render the %s resume PDF", name)
+            errors[name] = str(e) or type(e).__name__
+    return pdfs, errors
+
+# ------------------------- Thumbnails -----------------------------
+
+THUMBNAIL_WIDTH = 170
+# Letter page proportions
+THUMBNAIL_HEIGHT = round(THUMBNAIL_WIDTH * 11 / 8.5)
+
+def resume_thumbnail_html(resume: StructuredResume, template_name: str) -> str:
+    """First-page miniature of create_structured_pdf's layout in HTML/CSS, so no PDF rasterizer is needed"""
+    look = pdf_look(template_name)
+    font_stack = PDF_FONTS[look['font']][2]
+    rule = f"border-bottom:0.5px solid {look['accent']};" if look['rule'] else ""
+    
+    parts = [f'<div style="font-size:9px;font-weight:bold;color:{look["title_color"]};text-align:{look["align"]}">{escape(resume.name)}</div>']
+    parts += [f'<div style="text-align:{look["align"]}">{escape(" | ".join(part))}</div>' for part in (resume.contact, resume.links) if part]
+    sections = list(resume.sections)
+    if resume.summary:
+        sections.insert(0, ResumeSection("PROFESSIONAL SUMMARY", text=resume.summary))
+    for section in sections:
+        parts.append(f'<div style="margin-top:4px;font-weight:bold;color:{look["accent"]};{rule}">{escape(section.title)}</div>')
+        if section.text:
+            parts.append(f'<div>{escape(section.text)}</div>')
+        parts += [f'<div>{look["bullet"]} {escape(item)}</div>' for item in section.items]
+        for entry in section.entries:
+            parts.append(f'<div style="font-weight:bold;color:#1e293b">{escape(entry.heading)}</div>')
+            if entry.meta:
+                parts.append(f'<div>{escape(entry.meta)}</div>')
+            parts += [f'<div style="padding-left:4px">{look["bullet"]} {escape(bullet)}</div>' for bullet in entry.bullets]
+    
+    return (f'<div style="width:{THUMBNAIL_WIDTH}px;height:{THUMBNAIL_HEIGHT}px;overflow:hidden;background:#fff;'
+            f'padding:10px;box-sizing:border-box;border-radius:4px;box-shadow:0 2px 8px rgba(0,0,0,0.25);'
+            f'font-family:{font_stack};font-size:4.5px;line-height:1.35;color:#334155;margin:0 auto">'
+            f'{"".join(parts)}</div>')
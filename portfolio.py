@@ -0,0 +1,2618 @@
+"""Portfolio website generation: templates, presets, third-party assets and the live preview page."""
+
+import hashlib
+import json
+import random
+import re
+import urllib.request
+from typing import Dict, List, Tuple
+
+import streamlit as st
+
+from skills import normalize_skills
+
+# ------------------------- Portfolio Templates -----------------------------
+
+COLOR_PRESETS = {
+    "Purple Dream": {"primary": "#6366f1", "secondary": "#764ba2", "accent": "#ec4899"},
+    "Ocean Blue": {"primary": "#0ea5e9", "secondary": "#06b6d4", "accent": "#3b82f6"},
+    "Sunset Orange": {"primary": "#f97316", "secondary": "#fb923c", "accent": "#ef4444"},
+    "Forest Green": {"primary": "#10b981", "secondary": "#059669", "accent": "#34d399"},
+    "Rose Gold": {"primary": "#ec4899", "secondary": "#f43f5e", "accent": "#fb7185"},
+    "Cyber Purple": {"primary": "#a855f7", "secondary": "#9333ea", "accent": "#c026d3"},
+}
+
+FONT_PRESETS = {
+    "Modern (Inter)": "font-family: 'Inter', sans-serif;",
+    "Professional (Roboto)": "@import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;700&display=swap'); font-family: 'Roboto', sans-serif;",
+    "Creative (Poppins)": "@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700&display=swap'); font-family: 'Poppins', sans-serif;",
+    "Tech (Fira Code)": "@import url('https://fonts.googleapis.com/css2?family=Fira+Code:wght@300;400;500&display=swap'); font-family: 'Fira Code', monospace;",
+}
+
+
+PORTFOLIO_TEMPLATES = {
+    "Modern Minimal": {
+        "description": "Clean design with subtle animations and plenty of whitespace",
+        "preview": "https://example.com/modern-minimal.png"  # You would add actual preview images
+    },
+    "Creative Portfolio": {
+        "description": "Bold colors, creative layouts, and eye-catching animations",
+        "preview": "https://example.com/creative.png"
+    },
+    "Tech Professional": {
+        "description": "Dark theme with code snippets and terminal-style elements",
+        "preview": "https://example.com/tech.png"
+    },
+    "Interactive Designer": {
+        "description": "3D elements, parallax scrolling, and interactive components",
+        "preview": "https://example.com/designer.png"
+    }
+}
+# ------------------------- Portfolio Assets -----------------------------
+
+PARTICLES_JS_URL = "https://cdn.jsdelivr.net/particles.js/2.0.0/particles.min.js"
+PARTICLES_JS_PATH = "assets/js/particles.min.js"
+FONTS_DIR = "assets/fonts"
+FONTS_CSS_PATH = f"{FONTS_DIR}/fonts.css"
+
+ASSET_MODES = {
+    "CDN (lazy loaded)": "Fonts and particles.js load from public CDNs without blocking first paint",
+    "Self-hosted (offline)": "Fonts and particles.js are bundled into the ZIP so the site works offline",
+}
+
+# Google Fonts only serves woff2 files to user agents it recognises as modern browsers
+ASSET_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+}
+
+def parse_font_preset(font_preset: str) -> Tuple[str, str]:
+    """Split a FONT_PRESETS entry into its stylesheet URL and font-family declaration"""
+    url_match = re.search(r"@import url\('([^']+)'\);", font_preset)
+    family_match = re.search(r"font-family:[^;]+;", font_preset)
+    font_url = url_match.group(1) if url_match else ""
+    font_family = family_match.group(0) if family_match else "font-family: 'Inter', sans-serif;"
+    return font_url, font_family
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def fetch_remote_asset(url: str) -> bytes:
+    """Download a third-party asset (cached so repeated exports don't refetch)"""
+    request = urllib.request.Request(url, headers=ASSET_FETCH_HEADERS)
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read()
+
+def bundle_font_assets(font_url: str) -> Dict[str, bytes]:
+    """Download a Google Fonts stylesheet and its font files, rewritten to local paths"""
+    css = fetch_remote_asset(font_url).decode('utf-8')
+    assets = {}
+    
+    def localize(match):
+        src = match.group(1)
+        filename = src.rsplit('/', 1)[-1]
+        assets[f"{FONTS_DIR}/{filename}"] = fetch_remote_asset(src)
+        return f"url({filename})"
+    
+    css = re.sub(r"url\((https://[^)]+)\)", localize, css)
+    css = re.sub(r"@font-face \{(?![^}]*font-display)", "@font-face {\n  font-display: swap;", css)
+    
+    assets[FONTS_CSS_PATH] = css.encode('utf-8')
+    return assets
+
+def collect_portfolio_assets(font_preset: str, include_particles: bool) -> Tuple[Dict[str, bytes], List[str]]:
+    """Collect self-hosted assets for the ZIP. Returns (assets, URLs that could not be fetched)"""
+    assets = {}
+    failed = []
+    
+    font_url, _ = parse_font_preset(font_preset)
+    if font_url:
+        try:
+            assets.update(bundle_font_assets(font_url))
+        except (OSError, ValueError):
+            failed.append(font_url)
+    
+    if include_particles:
+        try:
+            assets[PARTICLES_JS_PATH] = fetch_remote_asset(PARTICLES_JS_URL)
+        except (OSError, ValueError):
+            failed.append(PARTICLES_JS_URL)
+    
+    return assets, failed
+
+def generate_font_links(font_url: str, bundled_assets: Dict[str, bytes] = None) -> str:
+    """Generate non-blocking font <link> tags with preload hints"""
+    bundled_assets = bundled_assets or {}
+    
+    if FONTS_CSS_PATH in bundled_assets:
+        # Preload the regular-weight latin files, the rest are fetched on demand via unicode-range
+        css = bundled_assets[FONTS_CSS_PATH].decode('utf-8')
+        preloads = re.findall(r"/\* latin \*/\s*@font-face \{[^}]*font-weight: 400;[^}]*url\(([^)]+)\)", css)
+        links = "".join(
+            f'<link rel="preload" href="{FONTS_DIR}/{filename}" as="font" type="font/woff2" crossorigin>\n    '
+            for filename in preloads
+        )
+        return links + non_blocking_stylesheet(FONTS_CSS_PATH)
+    
+    if not font_url:
+        return ""
+    
+    return f"""<link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    {non_blocking_stylesheet(font_url)}"""
+
+def non_blocking_stylesheet(href: str) -> str:
+    """Stylesheet that loads as print-only and switches to all media once loaded, so it never blocks rendering"""
+    return f"""<link rel="preload" href="{href}" as="style">
+    <link rel="stylesheet" href="{href}" media="print" onload="this.media='all'">
+    <noscript><link rel="stylesheet" href="{href}"></noscript>"""
+
+def generate_particles_script(primary_color, script_src=PARTICLES_JS_URL):
+    """Generate particles.js script, loaded after first paint when the browser is idle"""
+    return f"""
+<script>
+    (function() {{
+        function initParticles() {{
+            particlesJS('particles-js', {{
+                particles: {{
+                    number: {{ value: 80, density: {{ enable: true, value_area: 800 }} }},
+                    color: {{ value: '{primary_color}' }},
+                    shape: {{ type: 'circle' }},
+                    opacity: {{ value: 0.5 }},
+                    size: {{ value: 3, random: true }},
+                    line_linked: {{
+                        enable: true,
+                        distance: 150,
+                        color: '{primary_color}',
+                        opacity: 0.4,
+                        width: 1
+                    }},
+                    move: {{ enable: true, speed: 2 }}
+                }},
+                interactivity: {{
+                    events: {{
+                        onhover: {{ enable: true, mode: 'repulse' }},
+                        onclick: {{ enable: true, mode: 'push' }}
+                    }}
+                }}
+            }});
+        }}
+        
+        function loadParticles() {{
+            const script = document.createElement('script');
+            script.src = '{script_src}';
+            script.async = true;
+            script.onload = initParticles;
+            document.body.appendChild(script);
+        }}
+        
+        window.addEventListener('load', function() {{
+            if ('requestIdleCallback' in window) {{
+                requestIdleCallback(loadParticles, {{ timeout: 2000 }});
+            }} else {{
+                setTimeout(loadParticles, 200);
+            }}
+        }});
+    }})();
+</script>
+"""
+
+def generate_theme_init_script():
+    """Generate the <head> script applying the saved theme; kept inline in exported bundles so it runs before first paint"""
+    return """
+    <script data-inline>
+        document.documentElement.setAttribute('data-theme', localStorage.getItem('theme') || 'dark');
+    </script>
+"""
+
+def generate_theme_toggle_script():
+    """Generate the theme toggle button wiring"""
+    return """
+<script>
+    const themeToggle = document.getElementById('themeToggle');
+    const html = document.documentElement;
+    
+    if (themeToggle) {
+        themeToggle.innerHTML = html.getAttribute('data-theme') === 'dark' ? '☀️' : '🌙';
+        themeToggle.addEventListener('click', function() {
+            const theme = html.getAttribute('data-theme');
+            const newTheme = theme === 'dark' ? 'light' : 'dark';
+            html.setAttribute('data-theme', newTheme);
+            localStorage.setItem('theme', newTheme);
+            this.innerHTML = newTheme === 'dark' ? '☀️' : '🌙';
+        });
+    }
+</script>
+"""
+def generate_modern_minimal_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme):
+    """Generate Modern Minimal portfolio HTML"""
+    
+    about_section = ""
+    if config['show_about']:
+        about_section = f"""
+    <section id="about" class="section fade-in">
+        <div class="container">
+            <h2 class="section-title">About Me</h2>
+            <div class="about-content">
+                <div class="about-text">
+                    <p>{config['about']}</p>
+                </div>
+                <div class="about-stats" style="{'display: none;' if not config['show_stats'] else ''}">
+                    <div class="stat-card">
+                        <div class="stat-number">{config['num_projects']}+</div>
+                        <div class="stat-label">Projects</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="stat-number">{config['num_skills']}+</div>
+                        <div class="stat-label">Technologies</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="stat-number">{config['years_exp']}</div>
+                        <div class="stat-label">Years</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="stat-number">100%</div>
+                        <div class="stat-label">Passion</div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </section>
+    """
+
+    # Main HTML
+    html = f"""
+<!DOCTYPE html>
+<html lang="en" data-theme="{initial_theme}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{config['name']} - Portfolio</title>
+    {font_import}
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        :root {{
+            --primary: {config['primary_color']};
+            --secondary: {config['secondary_color']};
+            --accent: {config['accent_color']};
+            --card-radius: {config['card_radius']}px;
+            --button-radius: {config['button_radius']}px;
+            --hero-title-size: {config['hero_title_size']}rem;
+            --logo-size: {config['logo_size']}rem;
+        }}
+        
+        [data-theme="dark"] {{
+            --bg-primary: #0f172a;
+            --bg-secondary: #1e293b;
+            --text-primary: #f8fafc;
+            --text-secondary: rgba(248, 250, 252, 0.8);
+            --card-bg: rgba(255, 255, 255, 0.05);
+            --border-color: rgba(255, 255, 255, 0.1);
+        }}
+        
+        [data-theme="light"] {{
+            --bg-primary: #ffffff;
+            --bg-secondary: #f8fafc;
+            --text-primary: #0f172a;
+            --text-secondary: #475569;
+            --card-bg: #ffffff;
+            --border-color: #e2e8f0;
+        }}
+        
+        body {{
+            {font_family}
+            background: var(--bg-primary);
+            color: var(--text-primary);
+            overflow-x: hidden;
+            scroll-behavior: smooth;
+            transition: background 0.3s ease, color 0.3s ease;
+        }}
+        
+        .theme-toggle {{
+            position: fixed;
+            top: 1.5rem;
+            right: 1.5rem;
+            z-index: 1001;
+            width: 50px;
+            height: 50px;
+            border-radius: 50%;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            border: none;
+            cursor: pointer;
+            font-size: 1.5rem;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+            transition: all 0.3s ease;
+        }}
+        
+        .theme-toggle:hover {{
+            transform: scale(1.1) rotate(20deg);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.6);
+        }}
+        
+        #particles-js {{
+            position: fixed;
+            width: 100%;
+            height: 100%;
+            z-index: -1;
+            {'display: none;' if not config['show_particles'] else ''}
+        }}
+        
+        [data-theme="light"] #particles-js {{
+            opacity: 0.3;
+        }}
+        
+        nav {{
+            position: fixed;
+            top: 0;
+            width: 100%;
+            background: var(--card-bg);
+            backdrop-filter: blur(10px);
+            padding: 1.5rem 0;
+            z-index: 1000;
+            border-bottom: 1px solid var(--border-color);
+            {'display: none;' if not config['show_nav'] else ''}
+        }}
+        
+        nav .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+        
+        nav .logo {{
+            font-size: var(--logo-size);
+            font-weight: 800;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }}
+        
+        nav .nav-links {{
+            display: flex;
+            gap: 2rem;
+            list-style: none;
+        }}
+        
+        nav a {{
+            color: var(--text-secondary);
+            text-decoration: none;
+            transition: 0.3s;
+            font-weight: 500;
+        }}
+        
+        nav a:hover {{
+            color: var(--text-primary);
+        }}
+        
+        .hero {{
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            text-align: {config['hero_align']};
+            padding: 2rem;
+        }}
+        
+        .hero-content h1 {{
+            font-size: var(--hero-title-size);
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            margin-bottom: 1rem;
+            animation: fadeInUp 0.8s ease-out;
+        }}
+        
+        .hero-content .tagline {{
+            font-size: 1.5rem;
+            color: var(--text-secondary);
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.2s backwards;
+        }}
+        
+        .hero-content .description {{
+            font-size: 1.15rem;
+            color: var(--text-secondary);
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.4s backwards;
+        }}
+        
+        .btn {{
+            padding: 1rem 2rem;
+            border-radius: var(--button-radius);
+            font-weight: 600;
+            text-decoration: none;
+            display: inline-block;
+            margin: 0.5rem;
+            transition: all 0.3s ease;
+        }}
+        
+        .btn-primary {{
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            color: white;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+        }}
+        
+        .btn-primary:hover {{
+            transform: translateY(-3px);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.5);
+        }}
+        
+        .btn-secondary {{
+            border: 2px solid var(--primary);
+            color: var(--primary);
+        }}
+        
+        .btn-secondary:hover {{
+            background: rgba(99, 102, 241, 0.1);
+        }}
+        
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+        }}
+        
+        .section {{
+            padding: 5rem 0;
+        }}
+        
+        .section-title {{
+            font-size: 2.5rem;
+            text-align: center;
+            margin-bottom: 3rem;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }}
+        
+        .about-content {{
+            display: grid;
+            grid-template-columns: {config.get('about_layout', '1fr 1fr')};
+            gap: 3rem;
+            align-items: center;
+        }}
+        
+        .about-text {{
+            font-size: 1.1rem;
+            line-height: 1.7;
+        }}
+        
+        .about-stats {{
+            display: grid;
+            grid-template-columns: repeat(2, 1fr);
+            gap: 1.5rem;
+        }}
+        
+        .stat-card {{
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--card-radius);
+            padding: 1.5rem;
+            text-align: center;
+            transition: all 0.3s ease;
+        }}
+        
+        .stat-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .stat-number {{
+            font-size: 2rem;
+            font-weight: 700;
+            color: var(--primary);
+            margin-bottom: 0.5rem;
+        }}
+        
+        .stat-label {{
+            color: var(--text-secondary);
+        }}
+        
+        .skills-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .skill-card {{
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--card-radius);
+            padding: 2rem;
+            transition: all 0.3s ease;
+        }}
+        
+        .skill-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .skill-card h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+        }}
+        
+        .skill-tags {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+        }}
+        
+        .skill-tag {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+        }}
+        
+        .projects-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .project-card {{
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--card-radius);
+            overflow: hidden;
+            transition: all 0.3s ease;
+        }}
+        
+        .project-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .project-image {{
+            height: 200px;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 3rem;
+        }}
+        
+        .project-content {{
+            padding: 1.5rem;
+        }}
+        
+        .project-content h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+        }}
+        
+        .project-tech {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-top: 1rem;
+        }}
+        
+        .tech-badge {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+        }}
+        
+        .contact-content {{
+            text-align: center;
+            max-width: 600px;
+            margin: 0 auto;
+        }}
+        
+        .contact-content p {{
+            font-size: 1.1rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .contact-info {{
+            font-size: 1.2rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .social-links {{
+            display: flex;
+            justify-content: center;
+            gap: 1rem;
+            font-size: 1.5rem;
+        }}
+        
+        .social-links a {{
+            color: var(--primary);
+            transition: all 0.3s ease;
+        }}
+        
+        .social-links a:hover {{
+            transform: translateY(-3px);
+        }}
+        
+        @keyframes fadeInUp {{
+            from {{ opacity: 0; transform: translateY(30px); }}
+            to {{ opacity: 1; transform: translateY(0); }}
+        }}
+        
+        .fade-in {{
+            opacity: 0;
+            transform: translateY(30px);
+            transition: opacity 0.6s ease, transform 0.6s ease;
+        }}
+        
+        .fade-in.visible {{
+            opacity: 1;
+            transform: translateY(0);
+        }}
+        
+        @media (max-width: 768px) {{
+            .about-content {{
+                grid-template-columns: 1fr;
+            }}
+            
+            .about-stats {{
+                grid-template-columns: repeat(2, 1fr);
+            }}
+            
+            nav .nav-links {{
+                display: none;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div id="particles-js"></div>
+    {theme_toggle_html}
+    <nav>
+        <div class="container">
+            <div class="logo">{config['name']}</div>
+            <ul class="nav-links">
+                <li><a href="#home">Home</a></li>
+                {'<li><a href="#about">About</a></li>' if config['show_about'] else ''}
+                <li><a href="#skills">Skills</a></li>
+                <li><a href="#projects">Projects</a></li>
+                <li><a href="#contact">Contact</a></li>
+            </ul>
+        </div>
+    </nav>
+
+    <section id="home" class="hero">
+        <div class="hero-content">
+            <div style="font-size: 1.3rem; color: var(--primary); margin-bottom: 1rem;">{config['greeting_text']}</div>
+            <h1>{config['name']}</h1>
+            <p class="tagline">{config['tagline']}</p>
+            <p class="description">{config['about']}</p>
+            <div>
+                <a href="#projects" class="btn btn-primary">View Work →</a>
+                <a href="#contact" class="btn btn-secondary">Contact</a>
+            </div>
+        </div>
+    </section>
+
+    {about_section}
+
+    <section id="skills" class="section fade-in">
+        <div class="container">
+            <h2 class="section-title">Skills & Expertise</h2>
+            <div class="skills-grid">{config['skills_html']}</div>
+        </div>
+    </section>
+
+    <section id="projects" class="section fade-in">
+        <div class="container">
+            <h2 class="section-title">Featured Projects</h2>
+            <div class="projects-grid">{config['projects_html']}</div>
+        </div>
+    </section>
+
+    <section id="contact" class="section fade-in">
+        <div class="container">
+            <h2 class="section-title">Let's Connect</h2>
+            <div class="contact-content">
+                <p>I'm always excited to collaborate on innovative projects!</p>
+                <div class="contact-info">{config['email']}</div>
+                <div class="social-links">{config['social_links_html']}</div>
+            </div>
+        </div>
+    </section>
+
+    {config['particles_script']}
+    {theme_toggle_script}
+
+    <script>
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
+            anchor.addEventListener('click', function (e) {{
+                e.preventDefault();
+                const target = document.querySelector(this.getAttribute('href'));
+                if (target) {{
+                    target.scrollIntoView({{ behavior: 'smooth' }});
+                }}
+            }});
+        }});
+        
+        // Fade in animation on scroll
+        const observerOptions = {{
+            root: null,
+            rootMargin: '0px',
+            threshold: 0.1
+        }};
+        
+        const observer = new IntersectionObserver((entries) => {{
+            entries.forEach(entry => {{
+                if (entry.isIntersecting) {{
+                    entry.target.classList.add('visible');
+                }}
+            }});
+        }}, observerOptions);
+        
+        document.querySelectorAll('.fade-in').forEach(el => {{
+            observer.observe(el);
+        }});
+    </script>
+</body>
+</html>
+"""
+    return html
+
+def generate_creative_portfolio_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme):
+    """Generate Creative Portfolio HTML with morphing shapes and animations"""
+    
+    # Similar structure but with creative elements
+    # This is a simplified version - you would expand it with more creative features
+    
+    about_section = ""
+    if config['show_about']:
+        about_section = f"""
+    <section id="about" class="section">
+        <div class="morph-shape"></div>
+        <div class="container">
+            <h2 class="section-title glow-text">About Me</h2>
+            <div class="about-content">
+                <div class="about-text">
+                    <p>{config['about']}</p>
+                </div>
+                <div class="about-visual">
+                    <div class="floating-element"></div>
+                </div>
+            </div>
+        </div>
+    </section>
+    """
+
+    html = f"""
+<!DOCTYPE html>
+<html lang="en" data-theme="{initial_theme}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{config['name']} - Creative Portfolio</title>
+    {font_import}
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        :root {{
+            --primary: {config['primary_color']};
+            --secondary: {config['secondary_color']};
+            --accent: {config['accent_color']};
+            --card-radius: {config['card_radius']}px;
+            --button-radius: {config['button_radius']}px;
+            --hero-title-size: {config['hero_title_size']}rem;
+            --logo-size: {config['logo_size']}rem;
+        }}
+        
+        [data-theme="dark"] {{
+            --bg-primary: #0f172a;
+            --bg-secondary: #1e293b;
+            --text-primary: #f8fafc;
+            --text-secondary: rgba(248, 250, 252, 0.8);
+            --card-bg: rgba(255, 255, 255, 0.05);
+            --border-color: rgba(255, 255, 255, 0.1);
+        }}
+        
+        [data-theme="light"] {{
+            --bg-primary: #ffffff;
+            --bg-secondary: #f8fafc;
+            --text-primary: #0f172a;
+            --text-secondary: #475569;
+            --card-bg: #ffffff;
+            --border-color: #e2e8f0;
+        }}
+        
+        body {{
+            {font_family}
+            background: var(--bg-primary);
+            color: var(--text-primary);
+            overflow-x: hidden;
+            scroll-behavior: smooth;
+            transition: background 0.3s ease, color 0.3s ease;
+        }}
+        
+        .theme-toggle {{
+            position: fixed;
+            top: 1.5rem;
+            right: 1.5rem;
+            z-index: 1001;
+            width: 50px;
+            height: 50px;
+            border-radius: 50%;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            border: none;
+            cursor: pointer;
+            font-size: 1.5rem;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+            transition: all 0.3s ease;
+        }}
+        
+        .theme-toggle:hover {{
+            transform: scale(1.1) rotate(20deg);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.6);
+        }}
+        
+        #particles-js {{
+            position: fixed;
+            width: 100%;
+            height: 100%;
+            z-index: -1;
+            {'display: none;' if not config['show_particles'] else ''}
+        }}
+        
+        [data-theme="light"] #particles-js {{
+            opacity: 0.3;
+        }}
+        
+        nav {{
+            position: fixed;
+            top: 0;
+            width: 100%;
+            background: var(--card-bg);
+            backdrop-filter: blur(10px);
+            padding: 1.5rem 0;
+            z-index: 1000;
+            border-bottom: 1px solid var(--border-color);
+            {'display: none;' if not config['show_nav'] else ''}
+        }}
+        
+        nav .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+        
+        nav .logo {{
+            font-size: var(--logo-size);
+            font-weight: 800;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }}
+        
+        nav .nav-links {{
+            display: flex;
+            gap: 2rem;
+            list-style: none;
+        }}
+        
+        nav a {{
+            color: var(--text-secondary);
+            text-decoration: none;
+            transition: 0.3s;
+            font-weight: 500;
+        }}
+        
+        nav a:hover {{
+            color: var(--text-primary);
+        }}
+        
+        .hero {{
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            text-align: {config['hero_align']};
+            padding: 2rem;
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .hero::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: radial-gradient(circle at 20% 80%, var(--primary) 0%, transparent 50%),
+                        radial-gradient(circle at 80% 20%, var(--secondary) 0%, transparent 50%);
+            opacity: 0.1;
+            z-index: -1;
+        }}
+        
+        .hero-content h1 {{
+            font-size: var(--hero-title-size);
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            margin-bottom: 1rem;
+            animation: fadeInUp 0.8s ease-out;
+        }}
+        
+        .hero-content .tagline {{
+            font-size: 1.5rem;
+            color: var(--text-secondary);
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.2s backwards;
+        }}
+        
+        .hero-content .description {{
+            font-size: 1.15rem;
+            color: var(--text-secondary);
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.4s backwards;
+        }}
+        
+        .btn {{
+            padding: 1rem 2rem;
+            border-radius: var(--button-radius);
+            font-weight: 600;
+            text-decoration: none;
+            display: inline-block;
+            margin: 0.5rem;
+            transition: all 0.3s ease;
+        }}
+        
+        .btn-primary {{
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            color: white;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+        }}
+        
+        .btn-primary:hover {{
+            transform: translateY(-3px);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.5);
+        }}
+        
+        .btn-secondary {{
+            border: 2px solid var(--primary);
+            color: var(--primary);
+        }}
+        
+        .btn-secondary:hover {{
+            background: rgba(99, 102, 241, 0.1);
+        }}
+        
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+        }}
+        
+        .section {{
+            padding: 5rem 0;
+            position: relative;
+        }}
+        
+        .section-title {{
+            font-size: 2.5rem;
+            text-align: center;
+            margin-bottom: 3rem;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }}
+        
+        .morph-shape {{
+            position: absolute;
+            top: 10%;
+            right: 10%;
+            width: 300px;
+            height: 300px;
+            border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;
+            background: linear-gradient(45deg, var(--primary), var(--secondary));
+            opacity: 0.1;
+            animation: morph 8s ease-in-out infinite;
+            z-index: -1;
+        }}
+        
+        .floating-element {{
+            width: 100px;
+            height: 100px;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            border-radius: 50%;
+            position: relative;
+            animation: float 6s ease-in-out infinite;
+        }}
+        
+        .about-content {{
+            display: grid;
+            grid-template-columns: {config.get('about_layout', '1fr 1fr')};
+            gap: 3rem;
+            align-items: center;
+        }}
+        
+        .about-text {{
+            font-size: 1.1rem;
+            line-height: 1.7;
+        }}
+        
+        .skills-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .skill-card {{
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--card-radius);
+            padding: 2rem;
+            transition: all 0.3s ease;
+            transform-style: preserve-3d;
+        }}
+        
+        .skill-card:hover {{
+            transform: translateY(-5px) rotateY(5deg);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .skill-card h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+        }}
+        
+        .skill-tags {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+        }}
+        
+        .skill-tag {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+        }}
+        
+        .projects-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .project-card {{
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--card-radius);
+            overflow: hidden;
+            transition: all 0.3s ease;
+            transform-style: preserve-3d;
+        }}
+        
+        .project-card:hover {{
+            transform: translateY(-5px) rotateY(5deg);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .project-image {{
+            height: 200px;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 3rem;
+        }}
+        
+        .project-content {{
+            padding: 1.5rem;
+        }}
+        
+        .project-content h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+        }}
+        
+        .project-tech {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-top: 1rem;
+        }}
+        
+        .tech-badge {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+        }}
+        
+        .contact-content {{
+            text-align: center;
+            max-width: 600px;
+            margin: 0 auto;
+        }}
+        
+        .contact-content p {{
+            font-size: 1.1rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .contact-info {{
+            font-size: 1.2rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .social-links {{
+            display: flex;
+            justify-content: center;
+            gap: 1rem;
+            font-size: 1.5rem;
+        }}
+        
+        .social-links a {{
+            color: var(--primary);
+            transition: all 0.3s ease;
+        }}
+        
+        .social-links a:hover {{
+            transform: translateY(-3px);
+        }}
+        
+        .glow-text {{
+            text-shadow: 0 0 10px rgba(255, 255, 255, 0.5),
+                         0 0 20px rgba(255, 255, 255, 0.3),
+                         0 0 30px rgba(255, 255, 255, 0.2);
+        }}
+        
+        @keyframes fadeInUp {{
+            from {{ opacity: 0; transform: translateY(30px); }}
+            to {{ opacity: 1; transform: translateY(0); }}
+        }}
+        
+        @keyframes morph {{
+            0% {{ border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%; }}
+            50% {{ border-radius: 30% 60% 70% 40% / 50% 60% 30% 60%; }}
+            100% {{ border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%; }}
+        }}
+        
+        @keyframes float {{
+            0% {{ transform: translateY(0px); }}
+            50% {{ transform: translateY(-20px); }}
+            100% {{ transform: translateY(0px); }}
+        }}
+        
+        @media (max-width: 768px) {{
+            .about-content {{
+                grid-template-columns: 1fr;
+            }}
+            
+            nav .nav-links {{
+                display: none;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div id="particles-js"></div>
+    {theme_toggle_html}
+    <nav>
+        <div class="container">
+            <div class="logo">{config['name']}</div>
+            <ul class="nav-links">
+                <li><a href="#home">Home</a></li>
+                {'<li><a href="#about">About</a></li>' if config['show_about'] else ''}
+                <li><a href="#skills">Skills</a></li>
+                <li><a href="#projects">Projects</a></li>
+                <li><a href="#contact">Contact</a></li>
+            </ul>
+        </div>
+    </nav>
+
+    <section id="home" class="hero">
+        <div class="hero-content">
+            <div style="font-size: 1.3rem; color: var(--primary); margin-bottom: 1rem;">{config['greeting_text']}</div>
+            <h1>{config['name']}</h1>
+            <p class="tagline">{config['tagline']}</p>
+            <p class="description">{config['about']}</p>
+            <div>
+                <a href="#projects" class="btn btn-primary">View Work →</a>
+                <a href="#contact" class="btn btn-secondary">Contact</a>
+            </div>
+        </div>
+    </section>
+
+    {about_section}
+
+    <section id="skills" class="section">
+        <div class="container">
+            <h2 class="section-title">Skills & Expertise</h2>
+            <div class="skills-grid">{config['skills_html']}</div>
+        </div>
+    </section>
+
+    <section id="projects" class="section">
+        <div class="container">
+            <h2 class="section-title">Featured Projects</h2>
+            <div class="projects-grid">{config['projects_html']}</div>
+        </div>
+    </section>
+
+    <section id="contact" class="section">
+        <div class="container">
+            <h2 class="section-title">Let's Connect</h2>
+            <div class="contact-content">
+                <p>I'm always excited to collaborate on innovative projects!</p>
+                <div class="contact-info">{config['email']}</div>
+                <div class="social-links">{config['social_links_html']}</div>
+            </div>
+        </div>
+    </section>
+
+    {config['particles_script']}
+    {theme_toggle_script}
+
+    <script>
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
+            anchor.addEventListener('click', function (e) {{
+                e.preventDefault();
+                const target = document.querySelector(this.getAttribute('href'));
+                if (target) {{
+                    target.scrollIntoView({{ behavior: 'smooth' }});
+                }}
+            }});
+        }});
+    </script>
+</body>
+</html>
+"""
+    return html
+
+def generate_tech_professional_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme):
+    """Generate Tech Professional portfolio HTML with terminal-style elements"""
+    
+    # Similar structure but with tech-focused elements
+    # This is a simplified version - you would expand it with more tech features
+    
+    about_section = ""
+    if config['show_about']:
+        about_section = f"""
+    <section id="about" class="section">
+        <div class="container">
+            <h2 class="section-title">&gt; About Me</h2>
+            <div class="terminal">
+                <div class="terminal-header">
+                    <div class="terminal-buttons">
+                        <div class="terminal-button close"></div>
+                        <div class="terminal-button minimize"></div>
+                        <div class="terminal-button maximize"></div>
+                    </div>
+                    <div class="terminal-title">about.sh</div>
+                </div>
+                <div class="terminal-body">
+                    <div class="terminal-line">
+                        <span class="terminal-prompt">$</span>
+                        <span class="terminal-command">cat about.txt</span>
+                    </div>
+                    <div class="terminal-output">
+                        <p>{config['about']}</p>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </section>
+    """
+
+    html = f"""
+<!DOCTYPE html>
+<html lang="en" data-theme="dark">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{config['name']} - Tech Portfolio</title>
+    {font_import}
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        :root {{
+            --primary: {config['primary_color']};
+            --secondary: {config['secondary_color']};
+            --accent: {config['accent_color']};
+            --card-radius: {config['card_radius']}px;
+            --button-radius: {config['button_radius']}px;
+            --hero-title-size: {config['hero_title_size']}rem;
+            --logo-size: {config['logo_size']}rem;
+            --terminal-bg: #1e1e1e;
+            --terminal-text: #f8f8f2;
+            --terminal-prompt: #50fa7b;
+            --terminal-cursor: #f8f8f0;
+        }}
+        
+        body {{
+            {font_family}
+            background: #0d1117;
+            color: #c9d1d9;
+            overflow-x: hidden;
+            scroll-behavior: smooth;
+        }}
+        
+        .theme-toggle {{
+            position: fixed;
+            top: 1.5rem;
+            right: 1.5rem;
+            z-index: 1001;
+            width: 50px;
+            height: 50px;
+            border-radius: 50%;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            border: none;
+            cursor: pointer;
+            font-size: 1.5rem;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+            transition: all 0.3s ease;
+        }}
+        
+        .theme-toggle:hover {{
+            transform: scale(1.1) rotate(20deg);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.6);
+        }}
+        
+        #particles-js {{
+            position: fixed;
+            width: 100%;
+            height: 100%;
+            z-index: -1;
+            {'display: none;' if not config['show_particles'] else ''}
+        }}
+        
+        nav {{
+            position: fixed;
+            top: 0;
+            width: 100%;
+            background: rgba(13, 17, 23, 0.8);
+            backdrop-filter: blur(10px);
+            padding: 1.5rem 0;
+            z-index: 1000;
+            border-bottom: 1px solid #30363d;
+            {'display: none;' if not config['show_nav'] else ''}
+        }}
+        
+        nav .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+        
+        nav .logo {{
+            font-size: var(--logo-size);
+            font-weight: 800;
+            color: var(--primary);
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        nav .nav-links {{
+            display: flex;
+            gap: 2rem;
+            list-style: none;
+        }}
+        
+        nav a {{
+            color: #8b949e;
+            text-decoration: none;
+            transition: 0.3s;
+            font-weight: 500;
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        nav a:hover {{
+            color: #c9d1d9;
+        }}
+        
+        .hero {{
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            text-align: {config['hero_align']};
+            padding: 2rem;
+            position: relative;
+        }}
+        
+        .hero::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: 
+                linear-gradient(to right, rgba(13, 17, 23, 0.8) 1px, transparent 1px),
+                linear-gradient(to bottom, rgba(13, 17, 23, 0.8) 1px, transparent 1px);
+            background-size: 40px 40px;
+            z-index: -1;
+        }}
+        
+        .hero-content {{
+            max-width: 800px;
+        }}
+        
+        .hero-content h1 {{
+            font-size: var(--hero-title-size);
+            color: var(--primary);
+            margin-bottom: 1rem;
+            font-family: 'Fira Code', monospace;
+            animation: fadeInUp 0.8s ease-out;
+        }}
+        
+        .hero-content .tagline {{
+            font-size: 1.5rem;
+            color: #8b949e;
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.2s backwards;
+        }}
+        
+        .hero-content .description {{
+            font-size: 1.15rem;
+            color: #8b949e;
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.4s backwards;
+        }}
+        
+        .btn {{
+            padding: 1rem 2rem;
+            border-radius: var(--button-radius);
+            font-weight: 600;
+            text-decoration: none;
+            display: inline-block;
+            margin: 0.5rem;
+            transition: all 0.3s ease;
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .btn-primary {{
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            color: white;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+        }}
+        
+        .btn-primary:hover {{
+            transform: translateY(-3px);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.5);
+        }}
+        
+        .btn-secondary {{
+            border: 2px solid var(--primary);
+            color: var(--primary);
+        }}
+        
+        .btn-secondary:hover {{
+            background: rgba(99, 102, 241, 0.1);
+        }}
+        
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+        }}
+        
+        .section {{
+            padding: 5rem 0;
+        }}
+        
+        .section-title {{
+            font-size: 2.5rem;
+            text-align: center;
+            margin-bottom: 3rem;
+            color: var(--primary);
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .terminal {{
+            background: var(--terminal-bg);
+            border-radius: 8px;
+            overflow: hidden;
+            margin-bottom: 2rem;
+            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
+        }}
+        
+        .terminal-header {{
+            background: #21262d;
+            padding: 0.5rem 1rem;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+        }}
+        
+        .terminal-buttons {{
+            display: flex;
+            gap: 0.5rem;
+        }}
+        
+        .terminal-button {{
+            width: 12px;
+            height: 12px;
+            border-radius: 50%;
+        }}
+        
+        .terminal-button.close {{
+            background: #ff5f56;
+        }}
+        
+        .terminal-button.minimize {{
+            background: #ffbd2e;
+        }}
+        
+        .terminal-button.maximize {{
+            background: #27c93f;
+        }}
+        
+        .terminal-title {{
+            color: var(--terminal-text);
+            font-size: 0.9rem;
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .terminal-body {{
+            padding: 1rem;
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .terminal-line {{
+            display: flex;
+            margin-bottom: 0.5rem;
+        }}
+        
+        .terminal-prompt {{
+            color: var(--terminal-prompt);
+            margin-right: 0.5rem;
+        }}
+        
+        .terminal-command {{
+            color: var(--terminal-text);
+        }}
+        
+        .terminal-output {{
+            color: var(--terminal-text);
+            margin-top: 0.5rem;
+            white-space: pre-wrap;
+        }}
+        
+        .terminal-cursor {{
+            display: inline-block;
+            width: 10px;
+            height: 1.2em;
+            background: var(--terminal-cursor);
+            animation: blink 1s infinite;
+        }}
+        
+        .skills-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .skill-card {{
+            background: #161b22;
+            border: 1px solid #30363d;
+            border-radius: var(--card-radius);
+            padding: 2rem;
+            transition: all 0.3s ease;
+        }}
+        
+        .skill-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.3);
+            border-color: var(--primary);
+        }}
+        
+        .skill-card h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .skill-tags {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+        }}
+        
+        .skill-tag {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .projects-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .project-card {{
+            background: #161b22;
+            border: 1px solid #30363d;
+            border-radius: var(--card-radius);
+            overflow: hidden;
+            transition: all 0.3s ease;
+        }}
+        
+        .project-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.3);
+            border-color: var(--primary);
+        }}
+        
+        .project-image {{
+            height: 200px;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 3rem;
+        }}
+        
+        .project-content {{
+            padding: 1.5rem;
+        }}
+        
+        .project-content h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .project-tech {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-top: 1rem;
+        }}
+        
+        .tech-badge {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .contact-content {{
+            text-align: center;
+            max-width: 600px;
+            margin: 0 auto;
+        }}
+        
+        .contact-content p {{
+            font-size: 1.1rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .contact-info {{
+            font-size: 1.2rem;
+            margin-bottom: 2rem;
+            font-family: 'Fira Code', monospace;
+        }}
+        
+        .social-links {{
+            display: flex;
+            justify-content: center;
+            gap: 1rem;
+            font-size: 1.5rem;
+        }}
+        
+        .social-links a {{
+            color: var(--primary);
+            transition: all 0.3s ease;
+        }}
+        
+        .social-links a:hover {{
+            transform: translateY(-3px);
+        }}
+        
+        @keyframes fadeInUp {{
+            from {{ opacity: 0; transform: translateY(30px); }}
+            to {{ opacity: 1; transform: translateY(0); }}
+        }}
+        
+        @keyframes blink {{
+            0%, 50% {{ opacity: 1; }}
+            51%, 100% {{ opacity: 0; }}
+        }}
+        
+        @media (max-width: 768px) {{
+            nav .nav-links {{
+                display: none;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div id="particles-js"></div>
+    {theme_toggle_html}
+    <nav>
+        <div class="container">
+            <div class="logo">{config['name']}</div>
+            <ul class="nav-links">
+                <li><a href="#home">Home</a></li>
+                {'<li><a href="#about">About</a></li>' if config['show_about'] else ''}
+                <li><a href="#skills">Skills</a></li>
+                <li><a href="#projects">Projects</a></li>
+                <li><a href="#contact">Contact</a></li>
+            </ul>
+        </div>
+    </nav>
+
+    <section id="home" class="hero">
+        <div class="hero-content">
+            <div style="font-size: 1.3rem; color: var(--primary); margin-bottom: 1rem; font-family: 'Fira Code', monospace;">$ ./greeting.sh</div>
+            <h1>{config['name']}</h1>
+            <p class="tagline">{config['tagline']}</p>
+            <p class="description">{config['about']}</p>
+            <div>
+                <a href="#projects" class="btn btn-primary">View Work →</a>
+                <a href="#contact" class="btn btn-secondary">Contact</a>
+            </div>
+        </div>
+    </section>
+
+    {about_section}
+
+    <section id="skills" class="section">
+        <div class="container">
+            <h2 class="section-title">&gt; Skills & Expertise</h2>
+            <div class="skills-grid">{config['skills_html']}</div>
+        </div>
+    </section>
+
+    <section id="projects" class="section">
+        <div class="container">
+            <h2 class="section-title">&gt; Featured Projects</h2>
+            <div class="projects-grid">{config['projects_html']}</div>
+        </div>
+    </section>
+
+    <section id="contact" class="section">
+        <div class="container">
+            <h2 class="section-title">&gt; Let's Connect</h2>
+            <div class="contact-content">
+                <p>I'm always excited to collaborate on innovative projects!</p>
+                <div class="contact-info">{config['email']}</div>
+                <div class="social-links">{config['social_links_html']}</div>
+            </div>
+        </div>
+    </section>
+
+    {config['particles_script']}
+    {theme_toggle_script}
+
+    <script>
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
+            anchor.addEventListener('click', function (e) {{
+                e.preventDefault();
+                const target = document.querySelector(this.getAttribute('href'));
+                if (target) {{
+                    target.scrollIntoView({{ behavior: 'smooth' }});
+                }}
+            }});
+        }});
+    </script>
+</body>
+</html>
+"""
+    return html
+
+def generate_interactive_designer_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme):
+    """Generate Interactive Designer portfolio HTML with 3D elements and parallax"""
+    
+    # Similar structure but with interactive designer elements
+    # This is a simplified version - you would expand it with more interactive features
+    
+    about_section = ""
+    if config['show_about']:
+        about_section = f"""
+    <section id="about" class="section">
+        <div class="container">
+            <h2 class="section-title">About Me</h2>
+            <div class="about-content">
+                <div class="about-text">
+                    <p>{config['about']}</p>
+                </div>
+                <div class="about-visual">
+                    <div class="interactive-element"></div>
+                </div>
+            </div>
+        </div>
+    </section>
+    """
+
+    html = f"""
+<!DOCTYPE html>
+<html lang="en" data-theme="{initial_theme}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{config['name']} - Interactive Portfolio</title>
+    {font_import}
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        :root {{
+            --primary: {config['primary_color']};
+            --secondary: {config['secondary_color']};
+            --accent: {config['accent_color']};
+            --card-radius: {config['card_radius']}px;
+            --button-radius: {config['button_radius']}px;
+            --hero-title-size: {config['hero_title_size']}rem;
+            --logo-size: {config['logo_size']}rem;
+        }}
+        
+        [data-theme="dark"] {{
+            --bg-primary: #0f172a;
+            --bg-secondary: #1e293b;
+            --text-primary: #f8fafc;
+            --text-secondary: rgba(248, 250, 252, 0.8);
+            --card-bg: rgba(255, 255, 255, 0.05);
+            --border-color: rgba(255, 255, 255, 0.1);
+        }}
+        
+        [data-theme="light"] {{
+            --bg-primary: #ffffff;
+            --bg-secondary: #f8fafc;
+            --text-primary: #0f172a;
+            --text-secondary: #475569;
+            --card-bg: #ffffff;
+            --border-color: #e2e8f0;
+        }}
+        
+        body {{
+            {font_family}
+            background: var(--bg-primary);
+            color: var(--text-primary);
+            overflow-x: hidden;
+            scroll-behavior: smooth;
+            transition: background 0.3s ease, color 0.3s ease;
+            perspective: 1000px;
+        }}
+        
+        .theme-toggle {{
+            position: fixed;
+            top: 1.5rem;
+            right: 1.5rem;
+            z-index: 1001;
+            width: 50px;
+            height: 50px;
+            border-radius: 50%;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            border: none;
+            cursor: pointer;
+            font-size: 1.5rem;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+            transition: all 0.3s ease;
+        }}
+        
+        .theme-toggle:hover {{
+            transform: scale(1.1) rotate(20deg);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.6);
+        }}
+        
+        #particles-js {{
+            position: fixed;
+            width: 100%;
+            height: 100%;
+            z-index: -1;
+            {'display: none;' if not config['show_particles'] else ''}
+        }}
+        
+        [data-theme="light"] #particles-js {{
+            opacity: 0.3;
+        }}
+        
+        nav {{
+            position: fixed;
+            top: 0;
+            width: 100%;
+            background: var(--card-bg);
+            backdrop-filter: blur(10px);
+            padding: 1.5rem 0;
+            z-index: 1000;
+            border-bottom: 1px solid var(--border-color);
+            {'display: none;' if not config['show_nav'] else ''}
+        }}
+        
+        nav .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+        
+        nav .logo {{
+            font-size: var(--logo-size);
+            font-weight: 800;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }}
+        
+        nav .nav-links {{
+            display: flex;
+            gap: 2rem;
+            list-style: none;
+        }}
+        
+        nav a {{
+            color: var(--text-secondary);
+            text-decoration: none;
+            transition: 0.3s;
+            font-weight: 500;
+        }}
+        
+        nav a:hover {{
+            color: var(--text-primary);
+        }}
+        
+        .hero {{
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            text-align: {config['hero_align']};
+            padding: 2rem;
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .hero::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: 
+                radial-gradient(circle at 20% 80%, var(--primary) 0%, transparent 50%),
+                radial-gradient(circle at 80% 20%, var(--secondary) 0%, transparent 50%);
+            opacity: 0.1;
+            z-index: -1;
+        }}
+        
+        .hero-content {{
+            position: relative;
+            z-index: 1;
+        }}
+        
+        .hero-content h1 {{
+            font-size: var(--hero-title-size);
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            margin-bottom: 1rem;
+            animation: fadeInUp 0.8s ease-out;
+        }}
+        
+        .hero-content .tagline {{
+            font-size: 1.5rem;
+            color: var(--text-secondary);
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.2s backwards;
+        }}
+        
+        .hero-content .description {{
+            font-size: 1.15rem;
+            color: var(--text-secondary);
+            margin-bottom: 2rem;
+            animation: fadeInUp 0.8s ease-out 0.4s backwards;
+        }}
+        
+        .btn {{
+            padding: 1rem 2rem;
+            border-radius: var(--button-radius);
+            font-weight: 600;
+            text-decoration: none;
+            display: inline-block;
+            margin: 0.5rem;
+            transition: all 0.3s ease;
+        }}
+        
+        .btn-primary {{
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            color: white;
+            box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4);
+        }}
+        
+        .btn-primary:hover {{
+            transform: translateY(-3px);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.5);
+        }}
+        
+        .btn-secondary {{
+            border: 2px solid var(--primary);
+            color: var(--primary);
+        }}
+        
+        .btn-secondary:hover {{
+            background: rgba(99, 102, 241, 0.1);
+        }}
+        
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 0 2rem;
+        }}
+        
+        .section {{
+            padding: 5rem 0;
+            position: relative;
+        }}
+        
+        .section-title {{
+            font-size: 2.5rem;
+            text-align: center;
+            margin-bottom: 3rem;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }}
+        
+        .about-content {{
+            display: grid;
+            grid-template-columns: {config.get('about_layout', '1fr 1fr')};
+            gap: 3rem;
+            align-items: center;
+        }}
+        
+        .about-text {{
+            font-size: 1.1rem;
+            line-height: 1.7;
+        }}
+        
+        .interactive-element {{
+            width: 300px;
+            height: 300px;
+            position: relative;
+            transform-style: preserve-3d;
+            animation: rotate3d 20s infinite linear;
+        }}
+        
+        .interactive-element-face {{
+            position: absolute;
+            width: 300px;
+            height: 300px;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            opacity: 0.7;
+            border: 2px solid var(--primary);
+        }}
+        
+        .interactive-element-face.front {{
+            transform: translateZ(150px);
+        }}
+        
+        .interactive-element-face.back {{
+            transform: rotateY(180deg) translateZ(150px);
+        }}
+        
+        .interactive-element-face.right {{
+            transform: rotateY(90deg) translateZ(150px);
+        }}
+        
+        .interactive-element-face.left {{
+            transform: rotateY(-90deg) translateZ(150px);
+        }}
+        
+        .interactive-element-face.top {{
+            transform: rotateX(90deg) translateZ(150px);
+        }}
+        
+        .interactive-element-face.bottom {{
+            transform: rotateX(-90deg) translateZ(150px);
+        }}
+        
+        .skills-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .skill-card {{
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--card-radius);
+            padding: 2rem;
+            transition: all 0.3s ease;
+            transform-style: preserve-3d;
+        }}
+        
+        .skill-card:hover {{
+            transform: translateY(-5px) rotateY(5deg);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .skill-card h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+        }}
+        
+        .skill-tags {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+        }}
+        
+        .skill-tag {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+        }}
+        
+        .projects-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+            gap: 2rem;
+        }}
+        
+        .project-card {{
+            background: var(--card-bg);
+            border: 1px solid var(--border-color);
+            border-radius: var(--card-radius);
+            overflow: hidden;
+            transition: all 0.3s ease;
+            transform-style: preserve-3d;
+        }}
+        
+        .project-card:hover {{
+            transform: translateY(-5px) rotateY(5deg);
+            box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .project-image {{
+            height: 200px;
+            background: linear-gradient(135deg, var(--primary), var(--secondary));
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 3rem;
+        }}
+        
+        .project-content {{
+            padding: 1.5rem;
+        }}
+        
+        .project-content h3 {{
+            margin-bottom: 1rem;
+            color: var(--primary);
+        }}
+        
+        .project-tech {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-top: 1rem;
+        }}
+        
+        .tech-badge {{
+            background: rgba(99, 102, 241, 0.1);
+            color: var(--primary);
+            padding: 0.3rem 0.8rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+        }}
+        
+        .contact-content {{
+            text-align: center;
+            max-width: 600px;
+            margin: 0 auto;
+        }}
+        
+        .contact-content p {{
+            font-size: 1.1rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .contact-info {{
+            font-size: 1.2rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .social-links {{
+            display: flex;
+            justify-content: center;
+            gap: 1rem;
+            font-size: 1.5rem;
+        }}
+        
+        .social-links a {{
+            color: var(--primary);
+            transition: all 0.3s ease;
+        }}
+        
+        .social-links a:hover {{
+            transform: translateY(-3px);
+        }}
+        
+        @keyframes fadeInUp {{
+            from {{ opacity: 0; transform: translateY(30px); }}
+            to {{ opacity: 1; transform: translateY(0); }}
+        }}
+        
+        @keyframes rotate3d {{
+            from {{ transform: rotateX(0deg) rotateY(0deg); }}
+            to {{ transform: rotateX(360deg) rotateY(360deg); }}
+        }}
+        
+        @media (max-width: 768px) {{
+            .about-content {{
+                grid-template-columns: 1fr;
+            }}
+            
+            .interactive-element {{
+                width: 200px;
+                height: 200px;
+            }}
+            
+            .interactive-element-face {{
+                width: 200px;
+                height: 200px;
+            }}
+            
+            .interactive-element-face.front,
+            .interactive-element-face.back {{
+                transform: translateZ(100px);
+            }}
+            
+            .interactive-element-face.right,
+            .interactive-element-face.left {{
+                transform: rotateY(90deg) translateZ(100px);
+            }}
+            
+            .interactive-element-face.top,
+            .interactive-element-face.bottom {{
+                transform: rotateX(90deg) translateZ(100px);
+            }}
+            
+            nav .nav-links {{
+                display: none;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div id="particles-js"></div>
+    {theme_toggle_html}
+    <nav>
+        <div class="container">
+            <div class="logo">{config['name']}</div>
+            <ul class="nav-links">
+                <li><a href="#home">Home</a></li>
+                {'<li><a href="#about">About</a></li>' if config['show_about'] else ''}
+                <li><a href="#skills">Skills</a></li>
+                <li><a href="#projects">Projects</a></li>
+                <li><a href="#contact">Contact</a></li>
+            </ul>
+        </div>
+    </nav>
+
+    <section id="home" class="hero">
+        <div class="hero-content">
+            <div style="font-size: 1.3rem; color: var(--primary); margin-bottom: 1rem;">{config['greeting_text']}</div>
+            <h1>{config['name']}</h1>
+            <p class="tagline">{config['tagline']}</p>
+            <p class="description">{config['about']}</p>
+            <div>
+                <a href="#projects" class="btn btn-primary">View Work →</a>
+                <a href="#contact" class="btn btn-secondary">Contact</a>
+            </div>
+        </div>
+    </section>
+
+    {about_section}
+
+    <section id="skills" class="section">
+        <div class="container">
+            <h2 class="section-title">Skills & Expertise</h2>
+            <div class="skills-grid">{config['skills_html']}</div>
+        </div>
+    </section>
+
+    <section id="projects" class="section">
+        <div class="container">
+            <h2 class="section-title">Featured Projects</h2>
+            <div class="projects-grid">{config['projects_html']}</div>
+        </div>
+    </section>
+
+    <section id="contact" class="section">
+        <div class="container">
+            <h2 class="section-title">Let's Connect</h2>
+            <div class="contact-content">
+                <p>I'm always excited to collaborate on innovative projects!</p>
+                <div class="contact-info">{config['email']}</div>
+                <div class="social-links">{config['social_links_html']}</div>
+            </div>
+        </div>
+    </section>
+
+    {config['particles_script']}
+    {theme_toggle_script}
+
+    <script>
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
+            anchor.addEventListener('click', function (e) {{
+                e.preventDefault();
+                const target = document.querySelector(this.getAttribute('href'));
+                if (target) {{
+                    target.scrollIntoView({{ behavior: 'smooth' }});
+                }}
+            }});
+        }});
+    </script>
+</body>
+</html>
+"""
+    return html
+
+def generate_portfolio_html(config):
+    """Generate complete portfolio HTML with theme support"""
+    
+    # Get selected template
+    template = config.get('template', 'Modern Minimal')
+    
+    font_url, font_family = parse_font_preset(config['font_family'])
+    font_import = generate_font_links(font_url, config.get('bundled_assets'))
+
+    theme_toggle_html = ""
+    theme_toggle_script = ""
+    
+    if config['theme_mode'] == 'Toggle (User Choice)':
+        theme_toggle_html = """
+        <button id="themeToggle" class="theme-toggle" aria-label="Toggle theme">
+            🌙
+        </button>
+        """
+        theme_toggle_script = generate_theme_toggle_script()
+    
+    initial_theme = 'dark' if config['theme_mode'] in ['Dark', 'Toggle (User Choice)'] else 'light'
+    
+    # Generate different HTML based on template
+    if template == "Modern Minimal":
+        html_content = generate_modern_minimal_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme)
+    elif template == "Creative Portfolio":
+        html_content = generate_creative_portfolio_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme)
+    elif template == "Tech Professional":
+        html_content = generate_tech_professional_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme)
+    elif template == "Interactive Designer":
+        html_content = generate_interactive_designer_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme)
+    else:
+        # Default to Modern Minimal
+        html_content = generate_modern_minimal_html(config, font_family, font_import, theme_toggle_html, theme_toggle_script, initial_theme)
+    
+    if theme_toggle_script:
+        html_content = html_content.replace('</head>', generate_theme_init_script() + '</head>', 1)
+    
+    return html_content
+
+def build_portfolio_sections(technical_skills: str, soft_skills: str, projects: List[Dict], github: str, linkedin: str, email: str) -> Tuple[str, str, str]:
+    """Build the skills, projects and social links HTML shared by all portfolio templates"""
+    skills_categories = {
+        "Technical Skills": normalize_skills(technical_skills)[:8],
+        "Soft Skills": normalize_skills(soft_skills)[:5]
+    }
+    
+    skills_html = ""
+    for category, skills_list in skills_categories.items():
+        tags = "".join([f'<span class="skill-tag">{s}</span>' for s in skills_list])
+        skills_html += f'<div class="skill-card"><h3>{category}</h3><div class="skill-tags">{tags}</div></div>'
+    
+    projects_html = ""
+    for proj in projects[:6]:
+        tech_badges = "".join([f'<span class="tech-badge">{t}</span>' for t in normalize_skills(proj.get('tech', ''))])
+        projects_html += f'''
+        <div class="project-card">
+            <div class="project-image">💡</div>
+            <div class="project-content">
+                <h3>{proj.get('name', 'Project')}</h3>
+                <p>{proj.get('description', '')}</p>
+                <div class="project-tech">{tech_badges}</div>
+            </div>
+        </div>
+        '''
+    
+    social_links_html = f'''
+        <a href="https://{github}" target="_blank" title="GitHub">🐙</a>
+        <a href="https://{linkedin}" target="_blank" title="LinkedIn">💼</a>
+        <a href="mailto:{email}" title="Email">📧</a>
+    '''
+    
+    return skills_html, projects_html, social_links_html
+
+def generate_skill_chart(skills):
+    """Generate an animated skill chart with smooth transitions."""
+    return f"""
+    <style>
+        .skill-chart-container {{
+            width: 100%;
+            max-width: 600px;
+            margin: 20px auto;
+        }}
+        .skill-item {{
+            margin-bottom: 15px;
+        }}
+        .skill-name {{
+            font-weight: 600;
+            margin-bottom: 5px;
+            color: #222;
+        }}
+        .skill-bar {{
+            width: 100%;
+            height: 10px;
+            background: #e5e5e5;
+            border-radius: 20px;
+            overflow: hidden;
+        }}
+        .skill-progress {{
+            height: 10px;
+            width: 0%;
+            background: linear-gradient(90deg, #00b4d8, #0077b6);
+            border-radius: 20px;
+            transition: width 1.5s ease-in-out;
+        }}
+    </style>
+
+    <div class="skill-chart-container">
+        {"".join([
+            f'''
+            <div class="skill-item">
+                <div class="skill-name">{skill.strip().title()}</div>
+                <div class="skill-bar">
+                    <div class="skill-progress" style="width: 0%;" data-width="{random.randint(70, 100)}%"></div>
+                </div>
+            </div>
+            ''' for skill in skills.split(',')[:5]
+        ])}
+    </div>
+
+    <script>
+        const observer = new IntersectionObserver((entries) => {{
+            entries.forEach(entry => {{
+                if (entry.isIntersecting) {{
+                    const width = entry.target.getAttribute('data-width');
+                    entry.target.style.width = width;
+                }}
+            }});
+        }});
+
+        document.querySelectorAll('.skill-progress').forEach(el => {{
+            observer.observe(el);
+        }});
+    </script>
+    """
+
+def generate_3d_project_cards(projects):
+    """Generate 3D project cards with hover effects"""
+    return "".join([f"""
+    <div class="project-card-3d card-3d">
+        <div class="card-face card-front">
+            <h3>{project['name']}</h3>
+            <p>{project['description'][:100]}...</p>
+        </div>
+        <div class="card-face card-back">
+            <h3>Technologies</h3>
+            <p>{project['tech']}</p>
+            <a href="{project['link']}" class="btn">View Project</a>
+        </div>
+    </div>
+    """ for project in projects[:6]])
+
+# ------------------------- Portfolio Preview -----------------------------
+
+# Config values exposed as CSS custom properties; changing only these patches the preview in place
+PREVIEW_CSS_VARIABLES = {
+    'primary_color': ('--primary', ''),
+    'secondary_color': ('--secondary', ''),
+    'accent_color': ('--accent', ''),
+    'card_radius': ('--card-radius', 'px'),
+    'button_radius': ('--button-radius', 'px'),
+    'hero_title_size': ('--hero-title-size', 'rem'),
+    'logo_size': ('--logo-size', 'rem'),
+}
+
+# Config keys the templates don't render; changing them never re-renders the preview
+PREVIEW_IGNORED_KEYS = ('hover_effect', 'nav_opacity', 'particles_script', 'bundled_assets')
+
+PREVIEW_STYLE = """
+    <style>
+        /* Live preview: heavy effects disabled */
+        *, *::before, *::after {
+            animation: none !important;
+            transition: none !important;
+            transform-style: flat !important;
+        }
+        body {
+            perspective: none !important;
+        }
+        .fade-in {
+            opacity: 1 !important;
+            transform: none !important;
+        }
+        #particles-js {
+            display: none !important;
+        }
+    </style>
+"""
+
+def preview_structure_key(config: Dict) -> str:
+    """Hash of everything in the config that requires re-rendering the preview HTML"""
+    structural = {
+        key: value for key, value in config.items()
+        if key not in PREVIEW_CSS_VARIABLES and key not in PREVIEW_IGNORED_KEYS
+    }
+    return hashlib.sha256(json.dumps(structural, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def generate_preview_html(config: Dict) -> str:
+    """Generate the lightweight preview page with particles, 3D transforms and animations off"""
+    preview_config = {**config, 'show_particles': False, 'particles_script': "", 'bundled_assets': {}}
+    html = generate_portfolio_html(preview_config)
+    html = html.replace('<html lang="en"', '<html lang="en" data-portfolio-preview', 1)
+    return html.replace('</head>', PREVIEW_STYLE + '</head>', 1)
+
+def generate_preview_patch(config: Dict) -> str:
+    """Generate a tiny script that updates the preview's CSS variables without reloading it"""
+    variables = {name: f"{config[key]}{unit}" for key, (name, unit) in PREVIEW_CSS_VARIABLES.items()}
+    return f"""
+<script>
+    (function() {{
+        const variables = {json.dumps(variables)};
+        window.parent.document.querySelectorAll('iframe').forEach(function(frame) {{
+            try {{
+                const root = frame.contentDocument && frame.contentDocument.documentElement;
+                if (root && root.hasAttribute('data-portfolio-preview')) {{
+                    Object.entries(variables).forEach(([name, value]) => root.style.setProperty(name, value));
+                }}
+            }} catch (e) {{}}
+        }});
+    }})();
+</script>
+"""
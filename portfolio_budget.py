@@ -0,0 +1,245 @@
+"""Static performance budget analyzer for generated portfolio pages.
+
+Runs offline on the HTML produced by generate_portfolio_html().
+
+Usage:
+    python portfolio_budget.py index.html [more.html ...] [--json] [--min-score 80]
+"""
+
+import argparse
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from typing import Dict, List, Tuple
+
+# rule -> label, warn threshold, fail threshold, score weight (weights add up to 100)
+PERFORMANCE_BUDGET = {
+    "total_bytes": {"label": "Page size", "warn": 50_000, "fail": 100_000, "weight": 15},
+    "blocking_resources": {"label": "Render-blocking resources", "warn": 1, "fail": 3, "weight": 20},
+    "inline_script_bytes": {"label": "Inline script size", "warn": 10_000, "fail": 30_000, "weight": 15},
+    "animated_elements": {"label": "Animated elements", "warn": 10, "fail": 25, "weight": 15},
+    "infinite_animations": {"label": "Infinite @keyframes animations", "warn": 1, "fail": 3, "weight": 20},
+    "dom_nodes": {"label": "DOM nodes", "warn": 800, "fail": 1400, "weight": 15},
+}
+
+STATUS_ICONS = {"pass": "✅", "warn": "⚠️", "fail": "❌"}
+
+class _PortfolioParser(HTMLParser):
+    """Collects elements, scripts, stylesheets and inline CSS from a page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.elements = []
+        self.scripts = []
+        self.stylesheets = []
+        self.styles = []
+        self._in_script = None
+        self._in_style = False
+        self._in_noscript = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self.elements.append({
+            "tag": tag,
+            "id": attrs.get("id") or "",
+            "classes": (attrs.get("class") or "").split(),
+            "style": attrs.get("style") or "",
+        })
+
+        if tag == "script":
+            self._in_script = {"src": attrs.get("src"), "attrs": attrs, "content": ""}
+        elif tag == "style":
+            self._in_style = True
+            self.styles.append("")
+        elif tag == "noscript":
+            self._in_noscript = True
+        elif tag == "link" and "stylesheet" in (attrs.get("rel") or "").lower().split() and not self._in_noscript:
+            self.stylesheets.append(attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._in_script is not None:
+            self.scripts.append(self._in_script)
+            self._in_script = None
+        elif tag == "style":
+            self._in_style = False
+        elif tag == "noscript":
+            self._in_noscript = False
+
+    def handle_data(self, data):
+        if self._in_script is not None:
+            self._in_script["content"] += data
+        elif self._in_style:
+            self.styles[-1] += data
+
+def _split_css_blocks(css: str) -> List[Tuple[str, str]]:
+    """Split CSS into top-level (prelude, body) pairs, honouring nested braces"""
+    blocks = []
+    depth = 0
+    start = 0
+    prelude = ""
+    for index, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude = css[start:index].strip()
+                start = index + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:index]))
+                start = index + 1
+    return blocks
+
+def _parse_css_animations(css: str, rules: List[Dict] = None) -> List[Dict]:
+    """Find rules that declare animations. Returns [{'selectors', 'keyframes', 'infinite'}]"""
+    rules = [] if rules is None else rules
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+
+    for prelude, body in _split_css_blocks(css):
+        if prelude.startswith("@media") or prelude.startswith("@supports"):
+            _parse_css_animations(body, rules)
+            continue
+        if prelude.startswith("@"):
+            continue
+
+        declarations = dict(
+            (name.strip().lower(), value.strip())
+            for name, _, value in (d.partition(":") for d in body.split(";"))
+            if value.strip()
+        )
+        animation = declarations.get("animation", "") or declarations.get("animation-name", "")
+        if not animation or animation.lower() == "none":
+            continue
+
+        infinite = "infinite" in animation or declarations.get("animation-iteration-count") == "infinite"
+        rules.append({
+            "selectors": [selector.strip() for selector in prelude.split(",")],
+            "keyframes": animation.split()[0],
+            "infinite": infinite,
+        })
+
+    return rules
+
+def _matches_selector(element: Dict, selector: str) -> bool:
+    """Match an element against the last compound of a simple selector (tag, #id, .class)"""
+    compound = re.split(r"[\s>+~]+", selector.strip())[-1]
+    compound = re.sub(r"::?[\w-]+(\([^)]*\))?", "", compound)
+    if not compound or compound == "*":
+        return bool(compound)
+
+    tag_match = re.match(r"^[a-zA-Z][\w-]*", compound)
+    if tag_match and tag_match.group(0).lower() != element["tag"]:
+        return False
+    for element_id in re.findall(r"#([\w-]+)", compound):
+        if element_id != element["id"]:
+            return False
+    for class_name in re.findall(r"\.([\w-]+)", compound):
+        if class_name not in element["classes"]:
+            return False
+    return True
+
+def _is_blocking_script(script: Dict) -> bool:
+    attrs = script["attrs"]
+    return bool(script["src"]) and "async" not in attrs and "defer" not in attrs and attrs.get("type") != "module"
+
+def _is_blocking_stylesheet(attrs: Dict) -> bool:
+    media = (attrs.get("media") or "all").lower()
+    return media in ("all", "screen") or "screen" in media
+
+def _rule_status(value: int, rule: Dict) -> str:
+    if value >= rule["fail"]:
+        return "fail"
+    if value >= rule["warn"]:
+        return "warn"
+    return "pass"
+
+def analyze_portfolio_html(html: str) -> Dict:
+    """Check a generated portfolio page against PERFORMANCE_BUDGET. Returns score, metrics and findings"""
+    parser = _PortfolioParser()
+    parser.feed(html)
+    parser.close()
+
+    css = "\n".join(parser.styles)
+    animation_rules = _parse_css_animations(css)
+
+    blocking = [script["src"] for script in parser.scripts if _is_blocking_script(script)]
+    blocking += [attrs.get("href", "") for attrs in parser.stylesheets if _is_blocking_stylesheet(attrs)]
+    blocking += re.findall(r"@import\s+url\(['\"]?([^'\")]+)", css)
+
+    inline_script_bytes = sum(len(script["content"].encode("utf-8")) for script in parser.scripts if not script["src"])
+
+    animated = [
+        element for element in parser.elements
+        if "animation" in element["style"]
+        or any(_matches_selector(element, selector) for rule in animation_rules for selector in rule["selectors"])
+    ]
+    infinite_keyframes = sorted({rule["keyframes"] for rule in animation_rules if rule["infinite"]})
+
+    metrics = {
+        "total_bytes": len(html.encode("utf-8")),
+        "blocking_resources": len(blocking),
+        "inline_script_bytes": inline_script_bytes,
+        "animated_elements": len(animated),
+        "infinite_animations": len(infinite_keyframes),
+        "dom_nodes": len(parser.elements),
+    }
+    details = {
+        "blocking_resources": blocking,
+        "infinite_animations": infinite_keyframes,
+        "animated_elements": sorted({"." + element["classes"][0] if element["classes"] else element["tag"] for element in animated}),
+    }
+
+    findings = []
+    score = 100.0
+    for name, rule in PERFORMANCE_BUDGET.items():
+        value = metrics[name]
+        status = _rule_status(value, rule)
+        if status == "fail":
+            score -= rule["weight"]
+        elif status == "warn":
+            score -= rule["weight"] / 2
+
+        findings.append({
+            "rule": name,
+            "label": rule["label"],
+            "value": value,
+            "warn": rule["warn"],
+            "fail": rule["fail"],
+            "status": status,
+            "details": details.get(name, []),
+        })
+
+    return {"score": int(round(score)), "metrics": metrics, "findings": findings}
+
+def format_budget_report(report: Dict, title: str = "Portfolio") -> str:
+    """Format an analyze_portfolio_html() report as plain text"""
+    lines = [f"{title}: performance score {report['score']}/100"]
+    for finding in report["findings"]:
+        line = f"  {STATUS_ICONS[finding['status']]} {finding['label']}: {finding['value']:,} (warn ≥ {finding['warn']:,}, fail ≥ {finding['fail']:,})"
+        if finding["details"] and finding["status"] != "pass":
+            line += f" — {', '.join(finding['details'][:5])}"
+        lines.append(line)
+    return "\n".join(lines)
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check generated portfolio pages against a performance budget")
+    parser.add_argument("paths", nargs="+", help="HTML files to analyze")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    parser.add_argument("--min-score", type=int, default=0, help="Exit with status 1 if any page scores lower")
+    args = parser.parse_args(argv)
+
+    reports = {}
+    for path in args.paths:
+        with open(path, encoding="utf-8") as f:
+            reports[path] = analyze_portfolio_html(f.read())
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print("\n\n".join(format_budget_report(report, path) for path, report in reports.items()))
+
+    return 1 if any(report["score"] < args.min_score for report in reports.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Deploy-ready ZIP bundles of generated portfolio sites."""
+
+import gzip
+import hashlib
+import re
+import zipfile
+from io import BytesIO
+from typing import Dict, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Optional: portfolio bundles skip .br files without it
+
+PRECOMPRESS_EXTENSIONS = ('.html', '.css', '.js')
+# Already-compressed formats gain nothing from deflate, so they are stored as-is
+STORED_EXTENSIONS = ('.gz', '.br', '.woff2', '.png', '.jpg', '.zip')
+
+PORTFOLIO_HEADERS = """/*
+  X-Content-Type-Options: nosniff
+  Referrer-Policy: strict-origin-when-cross-origin
+
+/index.html
+  Cache-Control: public, max-age=0, must-revalidate
+
+/
+  Cache-Control: public, max-age=0, must-revalidate
+
+/assets/*
+  Cache-Control: public, max-age=31536000, immutable
+"""
+
+def hashed_filename(path: str, data: bytes) -> str:
+    """Insert a short content hash before the extension: site.css -> site.1a2b3c4d5e.css"""
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    stem, dot, ext = path.rpartition('.')
+    return f"{stem}.{digest}.{ext}" if dot else f"{path}.{digest}"
+
+def split_portfolio_assets(html_content: str, bundled_assets: Dict[str, bytes] = None) -> Tuple[str, Dict[str, bytes]]:
+    """Move inline CSS/JS into content-hashed files and hash bundled CSS/JS names.
+
+    Only href/src values pointing at a bundled file are renamed, so the same path in page text is left alone.
+    Scripts written as <script data-inline> must run before the page renders and stay inline.
+    """
+    files = {}
+    
+    for path, data in (bundled_assets or {}).items():
+        if path.endswith(('.css', '.js')):
+            new_path = hashed_filename(path, data)
+            # Attributes, and the src of script elements built in JS (script.src = '...')
+            html_content = re.sub(rf"""(\b(?:href|src)\s*=\s*["']){re.escape(path)}(["'])""",
+                                  lambda match: f"{match.group(1)}{new_path}{match.group(2)}", html_content)
+            path = new_path
+        files[path] = data
+    
+    def extract_style(match):
+        data = match.group(1).strip().encode('utf-8')
+        path = hashed_filename("assets/css/site.css", data)
+        files[path] = data
+        return f'<link rel="stylesheet" href="{path}">'
+    
+    def extract_script(match):
+        data = match.group(1).strip().encode('utf-8')
+        path = hashed_filename(f"assets/js/site-{extract_script.count}.js", data)
+        extract_script.count += 1
+        files[path] = data
+        return f'<script src="{path}" defer></script>'
+    
+    extract_script.count = 1
+    html_content = re.sub(r"<style>(.*?)</style>", extract_style, html_content, flags=re.DOTALL)
+    html_content = re.sub(r"<script>(.*?)</script>", extract_script, html_content, flags=re.DOTALL)
+    
+    return html_content, files
+
+def precompress_file(data: bytes) -> Dict[str, bytes]:
+    """Return gzip (and brotli, when installed) encodings keyed by file suffix"""
+    encoded = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded['.br'] = brotli.compress(data, quality=11)
+    return encoded
+
+def generate_portfolio_readme(name: str, theme_mode: str, template: str, asset_mode: str) -> str:
+    """Generate the README shipped inside the portfolio ZIP"""
+    return f"""# {name}'s Portfolio
+
+## 🌟 Features
+- 🌓 Theme: {theme_mode}
+- 🎨 Template: {template}
+- 📦 Assets: {asset_mode}
+- 🎨 Responsive Design
+- ⚡ Fast Loading
+- 📱 Mobile Friendly
+- ✨ Smooth Animations
+
+## 🚀 Deploy
+
+### Option 1: Netlify (Easiest)
+1. Go to [netlify.com](https://netlify.com)
+2. Drag and drop this folder
+3. Your site is live!
+
+### Option 2: Vercel
+1. Go to [vercel.com](https://vercel.com)
+2. Import from GitHub or upload files
+3. Deploy instantly
+
+### Option 3: GitHub Pages
+1. Create a new repository
+2. Upload files
+3. Enable GitHub Pages in settings
+4. Your portfolio is live at username.github.io
+
+## ⚡ Caching & Compression
+- CSS and JavaScript live in `assets/` with content-hashed filenames, so they can be cached forever.
+- `_headers` sets long-lived caching for `assets/` on Netlify and Cloudflare Pages; `index.html` is always revalidated.
+- Every HTML, CSS and JS file has precompressed `.gz` (and `.br`) siblings for servers such as nginx
+  (`gzip_static on;` / `brotli_static on;`).
+
+## 📝 Customization
+Edit `index.html` and the files in `assets/` to customize colors, content, and layout.
+If you change a hashed file, rename it (or remove the hash) so browsers pick up the new version.
+
+Created with AI Career Builder Pro 🚀
+"""
+
+def build_portfolio_bundle(html_content: str, readme: str, bundled_assets: Dict[str, bytes] = None) -> bytes:
+    """Build a deploy-ready, deflate-compressed ZIP of the portfolio site"""
+    html_content, files = split_portfolio_assets(html_content, bundled_assets)
+    files['index.html'] = html_content.encode('utf-8')
+    
+    for path, data in list(files.items()):
+        if path.endswith(PRECOMPRESS_EXTENSIONS):
+            for suffix, encoded in precompress_file(data).items():
+                files[path + suffix] = encoded
+    
+    files['_headers'] = PORTFOLIO_HEADERS.encode('utf-8')
+    files['README.md'] = readme.encode('utf-8')
+    
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        for path in sorted(files):
+            compress_type = zipfile.ZIP_STORED if path.endswith(STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+            zf.writestr(path, files[path], compress_type=compress_type)
+    
+    return zip_buffer.getvalue()
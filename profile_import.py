@@ -0,0 +1,193 @@
+"""Bulk import of student profiles from CSV or JSONL files.
+
+Streams the file row by row, validates every record with the profile model and hands valid
+profiles to a sink in batches, so memory stays flat however large the cohort is.
+
+CSV columns are Profile field names. Nested fields (education_list, experiences, projects,
+certifications) hold a JSON array; certifications may also be "Name (Year)" lines.
+Files ending in .gz are decompressed on the fly.
+
+Usage:
+    python profile_import.py students.csv [more.jsonl ...] [--db profiles.db --tokens tokens.csv | --output profiles.jsonl] [--json]
+
+With --db every imported student without a profile token gets one; they are appended to the --tokens CSV
+(email,token), readable only by its owner, for the admin to hand out. Without its token a student can't
+load or update the imported profile.
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import time
+from contextlib import ExitStack
+from typing import IO, Callable, Dict, Iterator, List, Tuple, Union
+
+from profile_model import NESTED_FIELDS, Profile
+from profile_store import ProfileStore
+
+DEFAULT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 20
+
+def detect_format(filename: str) -> str:
+    name = filename.lower().removesuffix('.gz')
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    raise ValueError(f"Can't tell the format of '{filename}'; use a .csv or .jsonl file")
+
+def _parse_csv_row(row: Dict[str, str]) -> Dict:
+    if None in row:
+        raise ValueError("more cells than header columns")
+    record = {}
+    for name, cell in row.items():
+        if not cell:
+            continue
+        if name in NESTED_FIELDS and cell.lstrip().startswith('['):
+            try:
+                cell = json.loads(cell)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"'{name}' is not a valid JSON array: {e.msg}") from e
+        record[name] = cell
+    return record
+
+def _parse_jsonl_line(line: str) -> Dict:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e.msg}") from e
+
+ROW_PARSERS = {'csv': _parse_csv_row, 'jsonl': _parse_jsonl_line}
+
+def iter_rows(text: IO[str], fmt: str) -> Iterator[Tuple[int, object]]:
+    """Yield (line number, raw row) pairs without reading ahead"""
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        try:
+            for row in reader:
+                yield reader.line_num, row
+        except csv.Error as e:
+            raise ValueError(f"line {reader.line_num}: {e}") from e
+    else:
+        for line_no, line in enumerate(text, 1):
+            if line.strip():
+                yield line_no, line
+
+def import_profiles(text: IO[str], fmt: str, save_batch: Callable[[List[Profile]], None],
+                    batch_size: int = DEFAULT_BATCH_SIZE, max_errors: int = MAX_REPORTED_ERRORS) -> Dict:
+    """Validate every row and pass valid profiles to save_batch; invalid rows are counted and skipped"""
+    parse = ROW_PARSERS[fmt]
+    rows = imported = rejected = 0
+    errors = []
+    batch = []
+    start = time.perf_counter()
+
+    for line_no, raw in iter_rows(text, fmt):
+        rows += 1
+        try:
+            profile = Profile.from_dict(parse(raw))
+            problems = profile.validate()
+            if problems:
+                raise ValueError("; ".join(problems))
+        except ValueError as e:
+            rejected += 1
+            if len(errors) < max_errors:
+                errors.append(f"line {line_no}: {e}")
+            continue
+        batch.append(profile)
+        if len(batch) >= batch_size:
+            save_batch(batch)
+            imported += len(batch)
+            batch = []
+    if batch:
+        save_batch(batch)
+        imported += len(batch)
+
+    seconds = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'imported': imported,
+        'rejected': rejected,
+        'errors': errors,
+        'seconds': round(seconds, 3),
+        'rows_per_sec': round(rows / seconds, 1) if seconds else 0.0,
+    }
+
+def import_file(source: Union[str, IO[bytes]], save_batch: Callable[[List[Profile]], None], fmt: str = None, **kwargs) -> Dict:
+    """Import a file path or a binary file object such as a Streamlit upload"""
+    filename = source if isinstance(source, str) else getattr(source, 'name', '')
+    fmt = fmt or detect_format(filename)
+    with ExitStack() as stack:
+        stream = stack.enter_context(open(source, 'rb')) if isinstance(source, str) else source
+        if filename.lower().endswith('.gz'):
+            stream = stack.enter_context(gzip.GzipFile(fileobj=stream))
+        # utf-8-sig drops the byte order mark spreadsheet apps put in front of CSV exports
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        try:
+            return import_profiles(text, fmt, save_batch, **kwargs)
+        finally:
+            text.detach()  # leave the caller's stream open
+
+def jsonl_writer(out: IO[str]) -> Callable[[List[Profile]], None]:
+    """A save_batch that appends profiles to a JSONL file in the compact storage format"""
+    def save_batch(profiles: List[Profile]):
+        out.writelines(profile.to_json() + "\n" for profile in profiles)
+    return save_batch
+
+def token_writer(out: IO[str]) -> Callable[[str, str], None]:
+    """An on_token callback for ProfileStore.save_many that appends email,token rows to a CSV file"""
+    writer = csv.writer(out)
+    return lambda email, token: writer.writerow((email, token))
+
+def format_import_report(report: Dict, title: str) -> str:
+    lines = [
+        f"{title}: {report['rows']:,} rows, {report['imported']:,} imported, {report['rejected']:,} rejected "
+        f"in {report['seconds']:.2f}s ({report['rows_per_sec']:,.0f} rows/sec)"
+    ]
+    lines += [f"  ❌ {error}" for error in report['errors']]
+    if report['rejected'] > len(report['errors']):
+        lines.append(f"  … and {report['rejected'] - len(report['errors']):,} more")
+    return "\n".join(lines)
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate and import student profiles from CSV or JSONL files")
+    parser.add_argument("paths", nargs="+", help="CSV or JSONL files (optionally .gz)")
+    sink = parser.add_mutually_exclusive_group()
+    sink.add_argument("--db", help="Save valid profiles to this SQLite profile store")
+    sink.add_argument("--output", help="Append valid profiles to this JSONL file")
+    parser.add_argument("--tokens", help="With --db: append the profile tokens issued to imported students to this CSV")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Profiles per save batch")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args(argv)
+    if args.db and not args.tokens:
+        parser.error("--db needs --tokens, or imported students could never load their profiles")
+
+    reports = {}
+    with ExitStack() as stack:
+        if args.db:
+            store = ProfileStore(args.db)
+            # Tokens are credentials: the file is created readable by its owner only
+            tokens_fd = os.open(args.tokens, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            on_token = token_writer(stack.enter_context(open(tokens_fd, 'a', encoding='utf-8', newline='')))
+            save_batch = lambda profiles: store.save_many(profiles, on_token)
+        elif args.output:
+            save_batch = jsonl_writer(stack.enter_context(open(args.output, 'a', encoding='utf-8')))
+        else:
+            # Validate only
+            save_batch = lambda profiles: None
+        for path in args.paths:
+            reports[path] = import_file(path, save_batch, batch_size=args.batch_size)
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print("\n".join(format_import_report(report, path) for path, report in reports.items()))
+
+    return 1 if any(report['rejected'] for report in reports.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Typed student profile: slotted, immutable records with validation, stable fingerprints and compact JSON.
+
+Records are frozen, so saving an edited sidebar section produces a new Profile and a plain `==`
+is all change detection needs. Dict/JSON input (saved profiles, imports) goes through from_dict().
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, fields, replace
+from typing import Dict, List, Tuple
+
+# Choices offered in the sidebar
+TARGET_INDUSTRIES = ("Technology", "Finance", "Healthcare", "Education", "Marketing",
+                     "Consulting", "Manufacturing", "Entertainment", "Retail", "Other")
+EXPERIENCE_LEVELS = ("Entry Level", "1-2 Years", "3-5 Years", "5-10 Years", "10+ Years")
+PROJECT_TYPES = ("Personal", "Academic", "Freelance", "Open Source", "Hackathon")
+WRITING_TONES = ("Professional", "Creative", "Technical", "Startup", "Academic", "Executive")
+
+# Same limits as the sidebar's number inputs
+MAX_EDUCATION = 5
+MAX_EXPERIENCES = 10
+MAX_PROJECTS = 15
+MAX_CERTIFICATIONS = 10
+
+REQUIRED_FIELDS = ('name', 'email', 'phone', 'target_role', 'technical_skills')
+
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# Certifications used to be saved as "Name (Year)" lines
+CERTIFICATION_PATTERN = re.compile(r"^(.*?)\s*\((\d{4})\)$")
+
+def _text(value, field: str) -> str:
+    """Coerce a JSON scalar to text; anything else is a malformed profile"""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ValueError(f"'{field}' must be text, got {type(value).__name__}")
+
+class _Record:
+    """from_dict/to_dict shared by the flat records below (their fields are all text)"""
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        if isinstance(data, cls):
+            return data
+        if not isinstance(data, dict):
+            raise ValueError(f"{cls.__name__} must be an object, got {type(data).__name__}")
+        return cls(*(_text(data.get(name), name) for name in cls._FIELDS))
+
+    def to_dict(self, compact: bool = False) -> Dict[str, str]:
+        values = zip(self._FIELDS, (getattr(self, name) for name in self._FIELDS))
+        return {name: value for name, value in values if value or not compact}
+
+@dataclass(frozen=True, slots=True)
+class Education(_Record):
+    degree: str = ""
+    major: str = ""
+    university: str = ""
+    grad_year: str = ""
+    gpa: str = ""
+    honors: str = ""
+    coursework: str = ""
+
+@dataclass(frozen=True, slots=True)
+class Experience(_Record):
+    title: str = ""
+    company: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    location: str = ""
+    description: str = ""
+
+@dataclass(frozen=True, slots=True)
+class Project(_Record):
+    name: str = ""
+    type: str = ""
+    description: str = ""
+    tech: str = ""
+    link: str = ""
+    demo: str = ""
+    highlights: str = ""
+
+@dataclass(frozen=True, slots=True)
+class Certification(_Record):
+    name: str = ""
+    year: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, str):
+            match = CERTIFICATION_PATTERN.match(data.strip())
+            return cls(match.group(1), match.group(2)) if match else cls(data.strip())
+        return super(Certification, cls).from_dict(data)
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.year})" if self.year else self.name
+
+for _record in (Education, Experience, Project, Certification):
+    _record._FIELDS = tuple(f.name for f in fields(_record))
+
+# Profile fields holding a list of records
+NESTED_FIELDS = {
+    'education_list': Education,
+    'experiences': Experience,
+    'projects': Project,
+    'certifications': Certification,
+}
+
+def _records(value, field: str) -> Tuple:
+    record_type = NESTED_FIELDS[field]
+    if field == 'certifications' and isinstance(value, str):
+        value = [line for line in value.splitlines() if line.strip()]
+    if value is None:
+        return ()
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"'{field}' must be a list, got {type(value).__name__}")
+    return tuple(record_type.from_dict(item) for item in value)
+
+def fingerprint_json(profile_json: str) -> str:
+    """Profile.fingerprint() for a profile already serialized with to_json()"""
+    return hashlib.sha256(profile_json.encode('utf-8')).hexdigest()
+
+def _coerce(field: str, value):
+    return _records(value, field) if field in NESTED_FIELDS else _text(value, field)
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+    headline: str = ""
+    education_list: Tuple[Education, ...] = ()
+    target_role: str = ""
+    target_industry: str = ""
+    target_companies: str = ""
+    experience_level: str = ""
+    technical_skills: str = ""
+    soft_skills: str = ""
+    languages: str = ""
+    experiences: Tuple[Experience, ...] = ()
+    projects: Tuple[Project, ...] = ()
+    certifications: Tuple[Certification, ...] = ()
+    achievements: str = ""
+    linkedin: str = ""
+    github: str = ""
+    tone: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Profile":
+        """Build a profile from saved/imported JSON; unknown keys are ignored, malformed values raise ValueError"""
+        if not isinstance(data, dict):
+            raise ValueError(f"Profile must be an object, got {type(data).__name__}")
+        return cls(**{name: _coerce(name, data[name]) for name in PROFILE_FIELDS if name in data})
+
+    @classmethod
+    def from_json(cls, text: str) -> "Profile":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid profile JSON: {e}") from e
+        return cls.from_dict(data)
+
+    def update(self, **changes) -> "Profile":
+        """Return a copy with some fields replaced; lists of dicts are converted to records"""
+        return replace(self, **{name: _coerce(name, value) for name, value in changes.items()})
+
+    def to_dict(self, compact: bool = False) -> Dict:
+        """Plain dict for JSON; compact drops empty fields, which from_dict restores as defaults"""
+        data = {}
+        for name in PROFILE_FIELDS:
+            value = getattr(self, name)
+            if name in NESTED_FIELDS:
+                value = [record.to_dict(compact) for record in value]
+            if value or not compact:
+                data[name] = value
+        return data
+
+    def to_json(self) -> str:
+        """Compact, key-sorted JSON: the storage format and the input to fingerprint()"""
+        return json.dumps(self.to_dict(compact=True), separators=(',', ':'), sort_keys=True, ensure_ascii=False)
+
+    def fingerprint(self) -> str:
+        """Content hash that is stable across processes (unlike hash()), for cache keys"""
+        return fingerprint_json(self.to_json())
+
+    def validate(self) -> List[str]:
+        """List what is missing or out of range; an empty list means the profile is usable"""
+        problems = [f"'{name}' is required" for name in REQUIRED_FIELDS if not getattr(self, name).strip()]
+        if self.email.strip() and not EMAIL_PATTERN.fullmatch(self.email.strip()):
+            problems.append(f"'{self.email}' is not a valid email address")
+        for name, choices in (('target_industry', TARGET_INDUSTRIES), ('experience_level', EXPERIENCE_LEVELS),
+                              ('tone', WRITING_TONES)):
+            value = getattr(self, name)
+            if value and value not in choices:
+                problems.append(f"'{name}' must be one of: {', '.join(choices)}")
+        for project in self.projects:
+            if project.type and project.type not in PROJECT_TYPES:
+                problems.append(f"Project '{project.name}' has unknown type '{project.type}'")
+        for name, limit in (('education_list', MAX_EDUCATION), ('experiences', MAX_EXPERIENCES),
+                            ('projects', MAX_PROJECTS), ('certifications', MAX_CERTIFICATIONS)):
+            if len(getattr(self, name)) > limit:
+                problems.append(f"'{name}' has more than {limit} entries")
+        return problems
+
+PROFILE_FIELDS = tuple(f.name for f in fields(Profile))
+TEXT_FIELDS = tuple(name for name in PROFILE_FIELDS if name not in NESTED_FIELDS)
@@ -0,0 +1,264 @@
+"""Local SQLite store for student profiles, their versions and cached Gemini outputs.
+
+Profiles are keyed by email. Saving a changed profile adds a new version; saving an unchanged one
+is a no-op. The database runs in WAL mode so concurrent Streamlit sessions can read while one writes.
+Its path comes from PROFILE_DB_PATH (default: profiles.db in the working directory).
+
+Students own what they save: the first save returns a random profile token, and loading or updating the
+profile needs it. Only a hash of the token is stored. Bulk imports (save_many) are an admin path keyed by
+email; they issue a token for every imported profile that has none, for the admin to hand to the student.
+"""
+
+import hashlib
+import os
+import secrets
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from profile_model import Profile, fingerprint_json
+
+DEFAULT_DB_PATH = "profiles.db"
+SCHEMA_VERSION = 2
+PROFILE_TOKEN_BYTES = 18
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    target_role TEXT NOT NULL,
+    target_industry TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profiles_target_role ON profiles (target_role);
+CREATE INDEX IF NOT EXISTS profiles_target_industry ON profiles (target_industry);
+
+CREATE TABLE IF NOT EXISTS profile_versions (
+    profile_id INTEGER NOT NULL REFERENCES profiles (id),
+    version INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (profile_id, version)
+);
+
+CREATE TABLE IF NOT EXISTS generated_outputs (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS generated_outputs_fingerprint ON generated_outputs (fingerprint);
+"""
+
+# Schema version -> statements that bring a database from the previous version to it
+MIGRATIONS = {
+    1: SCHEMA,
+    2: """
+ALTER TABLE profiles ADD COLUMN token_hash TEXT;
+CREATE UNIQUE INDEX IF NOT EXISTS profiles_token_hash ON profiles (token_hash);
+""",
+}
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+def new_profile_token() -> str:
+    return secrets.token_urlsafe(PROFILE_TOKEN_BYTES)
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.strip().encode('utf-8')).hexdigest()
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+class ProfileStore:
+    """Thread-safe access to one database file; each thread gets its own connection"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        if self._connection().execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            # executescript() would commit on its own, so the statements run one by one inside the transaction
+            with self._transaction() as conn:
+                # Read again under the write lock: another process may have migrated in the meantime
+                current = conn.execute("PRAGMA user_version").fetchone()[0]
+                for version in range(current + 1, SCHEMA_VERSION + 1):
+                    for statement in MIGRATIONS[version].split(";"):
+                        if statement.strip():
+                            conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode: transactions are opened explicitly in _transaction()
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=10)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so concurrent writers wait instead of failing mid-way
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------- Profiles -----------------------------
+
+    def _save(self, conn: sqlite3.Connection, profile: Profile, now: str) -> Tuple[int, int, bool]:
+        email = normalize_email(profile.email)
+        if not email:
+            raise ValueError("A profile needs an email address to be stored")
+        data = profile.to_json()
+        fingerprint = fingerprint_json(data)
+        row = conn.execute("SELECT id, version, fingerprint FROM profiles WHERE email = ?", (email,)).fetchone()
+        if row and row[2] == fingerprint:
+            return row[0], row[1], False
+
+        columns = (profile.name, profile.target_role, profile.target_industry)
+        if row:
+            profile_id, version = row[0], row[1] + 1
+            conn.execute(
+                "UPDATE profiles SET name = ?, target_role = ?, target_industry = ?, version = ?, fingerprint = ?, updated_at = ? "
+                "WHERE id = ?",
+                (*columns, version, fingerprint, now, profile_id)
+            )
+        else:
+            version = 1
+            profile_id = conn.execute(
+                "INSERT INTO profiles (email, name, target_role, target_industry, version, fingerprint, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (email, *columns, version, fingerprint, now)
+            ).lastrowid
+        conn.execute(
+            "INSERT INTO profile_versions (profile_id, version, fingerprint, data, created_at) VALUES (?, ?, ?, ?, ?)",
+            (profile_id, version, fingerprint, data, now)
+        )
+        return profile_id, version, True
+
+    def save(self, profile: Profile, token: str = None) -> Tuple[int, int, str]:
+        """Store a student's own profile as a new version unless it is unchanged; returns (profile id, version, token).
+
+        Without a token a new profile is created under a fresh token. With one, the profile it belongs to is
+        updated (following an email change). Raises PermissionError for an unknown token or an email that is
+        already stored under another token or by an import, so nobody can overwrite a profile they don't own.
+        """
+        email = normalize_email(profile.email)
+        with self._transaction() as conn:
+            owned = None
+            if token:
+                owned = conn.execute("SELECT id FROM profiles WHERE token_hash = ?", (hash_token(token),)).fetchone()
+                if owned is None:
+                    raise PermissionError("Unknown profile token")
+            existing = conn.execute("SELECT id FROM profiles WHERE email = ?", (email,)).fetchone()
+            if existing and (owned is None or existing[0] != owned[0]):
+                raise PermissionError("A profile with this email is already saved here. Load it with the profile token "
+                                      "you got when it was saved or imported to update it.")
+            if owned:
+                conn.execute("UPDATE profiles SET email = ? WHERE id = ?", (email, owned[0]))
+            
+            token = token.strip() if token else new_profile_token()
+            profile_id, version, _ = self._save(conn, profile, _now())
+            conn.execute("UPDATE profiles SET token_hash = ? WHERE id = ?", (hash_token(token), profile_id))
+        return profile_id, version, token
+
+    def save_many(self, profiles: List[Profile], on_token: Callable[[str, str], None] = None) -> int:
+        """Save a batch in one transaction, keyed by email (the bulk importer's admin sink); returns how many versions were added.
+
+        A profile without a token gets a new one, passed to on_token(email, token) so the admin can hand it to
+        the student; profiles students already own keep their token.
+        """
+        now = _now()
+        added = 0
+        with self._transaction() as conn:
+            for profile in profiles:
+                profile_id, _, changed = self._save(conn, profile, now)
+                added += changed
+                token = new_profile_token()
+                claimed = conn.execute("UPDATE profiles SET token_hash = ? WHERE id = ? AND token_hash IS NULL",
+                                       (hash_token(token), profile_id)).rowcount
+                if claimed and on_token:
+                    on_token(normalize_email(profile.email), token)
+        return added
+
+    def load(self, profile_id: int, version: int = None) -> Optional[Profile]:
+        """Latest (or a given) version of a profile by id"""
+        row = self._connection().execute(
+            "SELECT data FROM profile_versions WHERE profile_id = ? "
+            "AND version = COALESCE(?, (SELECT version FROM profiles WHERE id = ?))",
+            (profile_id, version, profile_id)
+        ).fetchone()
+        return Profile.from_json(row[0]) if row else None
+
+    def profile_id(self, email: str) -> Optional[int]:
+        row = self._connection().execute("SELECT id FROM profiles WHERE email = ?", (normalize_email(email),)).fetchone()
+        return row[0] if row else None
+
+    def load_by_token(self, token: str) -> Optional[Profile]:
+        """Latest version of the profile a token was issued for"""
+        row = self._connection().execute("SELECT id FROM profiles WHERE token_hash = ?", (hash_token(token),)).fetchone()
+        return self.load(row[0]) if row else None
+
+    def versions(self, profile_id: int) -> List[Dict]:
+        rows = self._connection().execute(
+            "SELECT version, fingerprint, created_at FROM profile_versions WHERE profile_id = ? ORDER BY version DESC",
+            (profile_id,)
+        ).fetchall()
+        return [{'version': version, 'fingerprint': fingerprint, 'created_at': created_at} for version, fingerprint, created_at in rows]
+
+    def search(self, target_role: str = None, target_industry: str = None, limit: int = 100) -> List[Dict]:
+        """Profiles by exact target role and/or industry, most recently updated first"""
+        clauses, params = [], []
+        for column, value in (('target_role', target_role), ('target_industry', target_industry)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection().execute(
+            f"SELECT id, email, name, target_role, target_industry, version, updated_at FROM profiles {where} "
+            "ORDER BY updated_at DESC LIMIT ?",
+            (*params, limit)
+        ).fetchall()
+        keys = ('id', 'email', 'name', 'target_role', 'target_industry', 'version', 'updated_at')
+        return [dict(zip(keys, row)) for row in rows]
+
+    # ------------------------- Generated Outputs -----------------------------
+
+    def load_output(self, key: str) -> Optional[str]:
+        row = self._connection().execute("SELECT content FROM generated_outputs WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def save_output(self, key: str, fingerprint: str, kind: str, content: str):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO generated_outputs (key, fingerprint, kind, content, created_at) VALUES (?, ?, ?, ?, ?)",
+                (key, fingerprint, kind, content, _now())
+            )
+
+@lru_cache(maxsize=None)
+def get_profile_store() -> ProfileStore:
+    """The process-wide store at PROFILE_DB_PATH"""
+    return ProfileStore(os.getenv("PROFILE_DB_PATH", DEFAULT_DB_PATH))
@@ -0,0 +1,319 @@
+"""Candidate data and the prompts sent to Gemini for resumes, cover letters and career advice.
+
+Prompts are compiled compactly: empty fields are left out instead of sent as "N/A", long free text is
+truncated to a token budget, and estimate_tokens() reports roughly what each prompt costs. The fixed
+instructions live in system prompts shared by every user, so only the short per-user message varies.
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from profile_model import Profile, TEXT_FIELDS
+from resume_schema import RESUME_JSON_SHAPE
+from resume_templates import RESUME_TEMPLATES
+from skills import normalize_skills
+
+# ------------------------- Prompt Compiler -----------------------------
+
+# Gemini averages about 4 characters per token on English text
+CHARS_PER_TOKEN = 4
+# Per experience/project description, and per other free-text field or answer
+DESCRIPTION_TOKEN_BUDGET = 120
+FIELD_TOKEN_BUDGET = 150
+QUESTION_TOKEN_BUDGET = 400
+
+def estimate_tokens(text: str) -> int:
+    """Rough input token count, close enough for budgets and reporting"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to about max_tokens at a word boundary, marking the cut with an ellipsis"""
+    text = text.strip()
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    return text[:cut if cut > limit // 2 else limit].rstrip(" ,;.") + "…"
+
+def join_present(values: Iterable[str], separator: str = " | ") -> str:
+    return separator.join(value.strip() for value in values if value and value.strip())
+
+def field_lines(fields: Iterable[Tuple[str, str]]) -> str:
+    """"Label: value" lines for the fields that have a value; multi-line values start on their own line"""
+    lines = []
+    for label, value in fields:
+        value = (value or "").strip()
+        if value:
+            lines.append(f"{label}:\n{value}" if "\n" in value else f"{label}: {value}")
+    return "\n".join(lines)
+
+def compact(prompt: str) -> str:
+    """Drop runs of blank lines and trailing spaces left by omitted fields"""
+    return re.sub(r"\n{3,}", "\n\n", re.sub(r"[ \t]+\n", "\n", prompt)).strip() + "\n"
+
+# ------------------------- Candidate Data -----------------------------
+
+def compile_candidate_data(profile: Profile) -> Dict:
+    """Flatten the sidebar profile into the fields used by the prompts"""
+    experiences = profile.experiences
+    projects = profile.projects
+    education_list = profile.education_list
+    
+    # Compile experience and projects for resume generation; empty parts are left out
+    exp_text = "\n\n".join([
+        join_present([
+            f"**{e.title}**" + (f" at {e.company}" if e.company.strip() else ""),
+            join_present([e.start_date, e.end_date], " - "),
+            e.location,
+        ]) + (f"\n{truncate_to_tokens(e.description, DESCRIPTION_TOKEN_BUDGET)}" if e.description.strip() else "")
+        for e in experiences if e.title.strip()
+    ])
+    
+    proj_text = "\n\n".join([
+        f"**{p.name}** ({p.type or 'Personal'})"
+        + (f": {truncate_to_tokens(p.description, DESCRIPTION_TOKEN_BUDGET)}" if p.description.strip() else "")
+        + "".join(f"\n{label}: {value}" for label, value in (("Tech Stack", ", ".join(normalize_skills(p.tech))), ("Link", p.link.strip())) if value)
+        for p in projects if p.name.strip()
+    ])
+    
+    candidate_data = {field: getattr(profile, field) for field in TEXT_FIELDS}
+    candidate_data['technical_skills'] = ", ".join(normalize_skills(profile.technical_skills))
+    candidate_data['soft_skills'] = ", ".join(normalize_skills(profile.soft_skills))
+    candidate_data['achievements'] = truncate_to_tokens(profile.achievements, FIELD_TOKEN_BUDGET)
+    
+    # Add compiled data
+    candidate_data['work_experience'] = exp_text
+    candidate_data['projects'] = proj_text
+    candidate_data['certifications'] = "\n".join(str(c) for c in profile.certifications)
+    
+    # Handle education data
+    if education_list and education_list[0].degree:
+        candidate_data['education'] = f"{education_list[0].degree} in {education_list[0].major} from {education_list[0].university}"
+        candidate_data['gpa'] = education_list[0].gpa
+        candidate_data['coursework'] = truncate_to_tokens(education_list[0].coursework, FIELD_TOKEN_BUDGET)
+    else:
+        candidate_data['education'] = ""
+        candidate_data['gpa'] = ""
+        candidate_data['coursework'] = ""
+    
+    return candidate_data
+
+# ------------------------- Prompts -----------------------------
+# Each prompt is a static system instruction, identical for every user, plus a short per-user message with
+# the profile. Only the message varies per call.
+
+RESUME_SYSTEM_PROMPT = """
+You are an elite resume writer specializing in {template_name} resumes. Write an EXCEPTIONAL resume for the candidate profile in the message.
+
+**TEMPLATE STYLE:**
+{prompt_style}
+
+**REQUIREMENTS:**
+1. Follow the {template_name} template style exactly
+2. Clean Markdown (# ## ### - *); NO code blocks, NO tables
+3. Every bullet point has quantifiable metrics and a powerful action verb (Architected, Engineered, Optimized, Spearheaded)
+4. Include ATS keywords for the target role; feature any Target Posting Keywords prominently
+5. Concise and impactful, optimized for both ATS and human readers
+6. Use only facts from the profile; leave out anything it doesn't mention, including sections it has no data for
+
+**STRUCTURE:**
+
+# [Name]
+[Location | Email | Phone]
+[LinkedIn | GitHub]
+
+## PROFESSIONAL SUMMARY
+[3-4 powerful lines]
+
+## TECHNICAL SKILLS
+- [Category]: [skills]
+
+## EXPERIENCE
+### [Job Title] | [Company Name]
+*[Dates] | [Location]*
+- [Achievement with metrics]
+
+## PROJECTS
+### [Project Name]
+*Technologies: [Stack]*
+- [Description with impact]
+
+## EDUCATION
+### [Degree] in [Major]
+*[University] | Graduated: [Date] | GPA: [GPA, if given]*
+
+## CERTIFICATIONS & ACHIEVEMENTS
+- [Items]
+
+**OUTPUT:** Plain markdown text only, no wrappers.
+"""
+
+RESUME_SYSTEM_PROMPTS = {
+    name: compact(RESUME_SYSTEM_PROMPT.format(template_name=name, prompt_style=template['prompt_style'].strip()))
+    for name, template in RESUME_TEMPLATES.items()
+}
+
+# Structured mode: the same resume as JSON (see resume_schema), rendered to Markdown, PDF and portfolio locally
+RESUME_JSON_SYSTEM_PROMPT = """
+You are an elite resume writer specializing in {template_name} resumes. Write an EXCEPTIONAL resume for the candidate profile in the message, as JSON.
+
+**TEMPLATE STYLE:**
+{prompt_style}
+
+**REQUIREMENTS:**
+1. Follow the {template_name} template style exactly, including its section order
+2. Plain text in every field; NO Markdown
+3. Every bullet point has quantifiable metrics and a powerful action verb (Architected, Engineered, Optimized, Spearheaded)
+4. Include ATS keywords for the target role; feature any Target Posting Keywords prominently
+5. Concise and impactful, optimized for both ATS and human readers
+6. Use only facts from the profile; leave out anything it doesn't mention, including sections it has no data for
+
+**JSON SHAPE:**
+{shape}
+
+Use "entries" for jobs, projects and degrees, "items" for lists such as skills and certifications, and "text" for a paragraph.
+
+**OUTPUT:** One JSON object only, no code fences.
+"""
+
+RESUME_JSON_SYSTEM_PROMPTS = {
+    name: compact(RESUME_JSON_SYSTEM_PROMPT.format(template_name=name, prompt_style=template['prompt_style'].strip(),
+                                                   shape=RESUME_JSON_SHAPE))
+    for name, template in RESUME_TEMPLATES.items()
+}
+
+COVER_LETTER_SYSTEM_PROMPT = compact("""
+You are an expert career counselor writing compelling cover letters from the details in the message.
+
+**STRUCTURE:**
+
+[Name]
+[Contact]
+
+[Date]
+
+Hiring Manager
+[Company]
+
+Dear Hiring Manager,
+
+**OPENING (3-4 sentences):**
+[Hook that grabs attention. State the position.]
+
+**YOUR BACKGROUND (4-5 sentences):**
+[Your journey to this field. Relevant experiences. Genuine enthusiasm.]
+
+**YOUR VALUE (4-5 sentences):**
+[Top achievement using STAR method. Include technical details and metrics.]
+
+**COMPANY FIT (3-4 sentences):**
+[Why THIS company specifically. How you align with their mission. What excites you.]
+
+**CLOSING (2-3 sentences):**
+[Reiterate enthusiasm. Thank them. Express eagerness to discuss.]
+
+Sincerely,
+[Name]
+
+**REQUIREMENTS:**
+- 300-450 words total, in the requested tone
+- Specific examples with metrics
+- Show company research
+- Authentic voice
+- Zero typos
+
+**OUTPUT:** Plain text, no code blocks.
+""")
+
+CAREER_ADVISOR_SYSTEM_PROMPT = compact("""
+You are a senior career advisor with 20+ years of experience helping students and professionals.
+The message holds the student's profile and their question.
+
+**YOUR RESPONSE SHOULD INCLUDE:**
+
+## Direct Answer
+[Provide clear, specific answer to their question]
+
+## Actionable Steps
+1. [First specific action]
+2. [Second specific action]
+3. [Third specific action]
+4. [Fourth specific action]
+5. [Fifth specific action]
+
+## Timeline
+- Week 1-2: [What to do]
+- Week 3-4: [What to do]
+- Month 2-3: [What to do]
+- Month 4-6: [What to do]
+
+## Resources
+- **Online Courses:** [Specific recommendations]
+- **Books:** [Specific titles]
+- **Platforms:** [Specific websites/tools]
+- **Communities:** [Where to network]
+
+## Encouragement & Motivation
+[Supportive, realistic advice that motivates them]
+
+**TONE:** Be supportive, specific, and practical. Use examples when helpful.
+""")
+
+def generate_resume_prompt(template_name, candidate_data, job_keywords: List[str] = None):
+    """Per-user resume message; send it with RESUME_SYSTEM_PROMPTS[template_name] (or RESUME_JSON_SYSTEM_PROMPTS).
+
+    job_keywords are skills from a target posting the candidate has.
+    """
+    data = candidate_data
+    profile = field_lines([
+        ("Name", data.get('name')),
+        ("Contact", join_present([data.get('location'), data.get('email'), data.get('phone')])),
+        ("Links", join_present([data.get('linkedin'), data.get('github')])),
+        ("Target Role", data.get('target_role')),
+        ("Industry", data.get('target_industry')),
+        ("Experience Level", data.get('experience_level')),
+        ("Education", data.get('education')),
+        ("GPA", data.get('gpa')),
+        ("Coursework", data.get('coursework')),
+        ("Technical Skills", data.get('technical_skills')),
+        ("Soft Skills", data.get('soft_skills')),
+        ("Languages", data.get('languages')),
+        ("Work Experience", data.get('work_experience')),
+        ("Projects", data.get('projects')),
+        ("Certifications", data.get('certifications')),
+        ("Achievements", data.get('achievements')),
+        ("Tone", data.get('tone') or "Professional"),
+        ("Target Posting Keywords", ", ".join(job_keywords or ())),
+    ])
+    return compact(f"**CANDIDATE PROFILE:**\n{profile}")
+
+def generate_cover_letter_prompt(candidate_data: Dict, why_role: str, why_company: str, achievement: str) -> str:
+    """Per-user cover letter message; send it with COVER_LETTER_SYSTEM_PROMPT"""
+    details = field_lines([
+        ("Name", candidate_data.get('name')),
+        ("Contact", join_present([candidate_data.get('email'), candidate_data.get('phone'), candidate_data.get('linkedin')])),
+        ("Date", datetime.now().strftime("%B %d, %Y")),
+        ("Role", candidate_data.get('target_role')),
+        ("Company", candidate_data.get('target_companies')),
+        ("Education", candidate_data.get('education')),
+        ("Skills", candidate_data.get('technical_skills')),
+        ("Why Role", truncate_to_tokens(why_role, FIELD_TOKEN_BUDGET)),
+        ("Why Company", truncate_to_tokens(why_company, FIELD_TOKEN_BUDGET)),
+        ("Achievement", truncate_to_tokens(achievement, FIELD_TOKEN_BUDGET)),
+        ("Tone", candidate_data.get('tone') or "Professional"),
+    ])
+    return compact(f"Write my cover letter.\n\n**DETAILS:**\n{details}")
+
+def generate_advisor_prompt(candidate_data: Dict, question: str) -> str:
+    """Per-user career advisor message; send it with CAREER_ADVISOR_SYSTEM_PROMPT"""
+    profile = field_lines([
+        ("Name", candidate_data.get('name')),
+        ("Education", candidate_data.get('education')),
+        ("Target Role", candidate_data.get('target_role')),
+        ("Experience Level", candidate_data.get('experience_level')),
+        ("Skills", candidate_data.get('technical_skills')),
+        ("Industry", candidate_data.get('target_industry')),
+    ])
+    question = truncate_to_tokens(question, QUESTION_TOKEN_BUDGET)
+    return compact(f"**STUDENT PROFILE:**\n{profile}\n\n**QUESTION:**\n{question}")
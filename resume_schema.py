@@ -0,0 +1,163 @@
+"""Structured resumes: the JSON shape Gemini is asked for, strict validation, and local renderers.
+
+One validated answer renders to Markdown (display, ATS check, download), the PDF (pdf_export) and the
+portfolio's about text and project cards, so every format comes from a single Gemini call and rendering
+is deterministic. Malformed JSON raises ValueError naming the offending field.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+MAX_SECTIONS = 12
+MAX_ENTRIES = 20
+MAX_ITEMS = 30
+
+# Shown to the model as the shape to return
+RESUME_JSON_SHAPE = """{
+  "name": "Full Name",
+  "contact": ["City, State", "email", "phone"],
+  "links": ["linkedin.com/in/...", "github.com/..."],
+  "summary": "3-4 powerful lines",
+  "sections": [
+    {"title": "TECHNICAL SKILLS", "items": ["Category: skill, skill"]},
+    {"title": "EXPERIENCE", "entries": [
+      {"heading": "Job Title | Company Name", "meta": "Dates | Location", "bullets": ["Achievement with metrics"]}
+    ]},
+    {"title": "PROJECTS", "entries": [
+      {"heading": "Project Name", "meta": "Technologies: Stack", "bullets": ["Description with impact"]}
+    ]}
+  ]
+}"""
+
+CODE_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+TECHNOLOGIES_PREFIX = re.compile(r"^(?:tech(?:nologies|nology| stack)?|stack)\s*:\s*", re.IGNORECASE)
+
+def _text(value, path: str, required: bool = False) -> str:
+    if value is None:
+        value = ""
+    if not isinstance(value, str):
+        raise ValueError(f"'{path}' must be text, got {type(value).__name__}")
+    if required and not value.strip():
+        raise ValueError(f"'{path}' is required")
+    return value.strip()
+
+def _texts(value, path: str, limit: int = MAX_ITEMS) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    if not isinstance(value, list):
+        raise ValueError(f"'{path}' must be a list, got {type(value).__name__}")
+    if len(value) > limit:
+        raise ValueError(f"'{path}' has more than {limit} entries")
+    texts = (_text(item, f"{path}[{i}]") for i, item in enumerate(value))
+    return tuple(text for text in texts if text)
+
+def _objects(value, path: str, limit: int) -> List[Dict]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"'{path}' must be a list, got {type(value).__name__}")
+    if len(value) > limit:
+        raise ValueError(f"'{path}' has more than {limit} entries")
+    for i, item in enumerate(value):
+        if not isinstance(item, dict):
+            raise ValueError(f"'{path}[{i}]' must be an object, got {type(item).__name__}")
+    return value
+
+@dataclass(frozen=True, slots=True)
+class ResumeEntry:
+    heading: str
+    meta: str = ""
+    bullets: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict, path: str) -> "ResumeEntry":
+        return cls(_text(data.get('heading'), f"{path}.heading", required=True),
+                   _text(data.get('meta'), f"{path}.meta"),
+                   _texts(data.get('bullets'), f"{path}.bullets"))
+
+@dataclass(frozen=True, slots=True)
+class ResumeSection:
+    title: str
+    text: str = ""
+    items: Tuple[str, ...] = ()
+    entries: Tuple[ResumeEntry, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict, path: str) -> "ResumeSection":
+        entries = _objects(data.get('entries'), f"{path}.entries", MAX_ENTRIES)
+        return cls(_text(data.get('title'), f"{path}.title", required=True),
+                   _text(data.get('text'), f"{path}.text"),
+                   _texts(data.get('items'), f"{path}.items"),
+                   tuple(ResumeEntry.from_dict(entry, f"{path}.entries[{i}]") for i, entry in enumerate(entries)))
+
+@dataclass(frozen=True, slots=True)
+class StructuredResume:
+    name: str
+    contact: Tuple[str, ...] = ()
+    links: Tuple[str, ...] = ()
+    summary: str = ""
+    sections: Tuple[ResumeSection, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StructuredResume":
+        """Validate a decoded JSON resume; unknown keys are ignored, malformed values raise ValueError"""
+        if not isinstance(data, dict):
+            raise ValueError(f"Resume must be an object, got {type(data).__name__}")
+        sections = _objects(data.get('sections'), "sections", MAX_SECTIONS)
+        resume = cls(_text(data.get('name'), "name", required=True),
+                     _texts(data.get('contact'), "contact"),
+                     _texts(data.get('links'), "links"),
+                     _text(data.get('summary'), "summary"),
+                     tuple(ResumeSection.from_dict(section, f"sections[{i}]") for i, section in enumerate(sections)))
+        if not resume.summary and not resume.sections:
+            raise ValueError("Resume has no summary and no sections")
+        return resume
+
+def parse_resume_json(text: str) -> StructuredResume:
+    """Parse and validate the model's JSON answer (a surrounding ```json fence is tolerated)"""
+    try:
+        data = json.loads(CODE_FENCE_PATTERN.sub("", text.strip()))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Resume is not valid JSON: {e.msg} (line {e.lineno})") from e
+    return StructuredResume.from_dict(data)
+
+def validate_resume_json(text: str):
+    """Raise ValueError unless text is a valid structured resume (the validate hook for Gemini calls)"""
+    parse_resume_json(text)
+
+# ------------------------- Renderers -----------------------------
+
+def resume_to_markdown(resume: StructuredResume) -> str:
+    """The same Markdown layout the free-form resumes use, so display, ATS check and downloads are unchanged"""
+    lines = [f"# {resume.name}"]
+    lines += [" | ".join(part) for part in (resume.contact, resume.links) if part]
+    if resume.summary:
+        lines += ["", "## PROFESSIONAL SUMMARY", resume.summary]
+    for section in resume.sections:
+        lines += ["", f"## {section.title}"]
+        if section.text:
+            lines.append(section.text)
+        lines += [f"- {item}" for item in section.items]
+        for entry in section.entries:
+            lines.append(f"### {entry.heading}")
+            if entry.meta:
+                lines.append(f"*{entry.meta}*")
+            lines += [f"- {bullet}" for bullet in entry.bullets]
+    return "\n".join(lines) + "\n"
+
+def resume_portfolio_content(resume: StructuredResume) -> Dict:
+    """About text and project cards (the dicts build_portfolio_sections takes) from a structured resume"""
+    projects = []
+    for section in resume.sections:
+        if "project" not in section.title.lower():
+            continue
+        for entry in section.entries:
+            name = entry.heading.split(" | ")[0]
+            projects.append({
+                'name': name,
+                'description': " ".join(entry.bullets[:2]),
+                'tech': TECHNOLOGIES_PREFIX.sub("", entry.meta) if TECHNOLOGIES_PREFIX.match(entry.meta) else "",
+            })
+    return {'about': resume.summary, 'projects': projects}
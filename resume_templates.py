@@ -0,0 +1,139 @@
+"""Resume templates offered in the Resume Generator tab and the style instructions sent with each.
+
+"sections" lists the sections a resume in that style is expected to have; ats_score checks for them.
+"pdf_style" is the look pdf_export gives structured resumes in that style: a base-14 font family ("Helvetica",
+"Times-Roman" or "Courier"), title and heading colors, title alignment, a rule under headings and the bullet.
+"""
+
+RESUME_TEMPLATES = {
+    "Modern Professional": {
+        "description": "Clean, modern design with clear sections. Perfect for tech and corporate roles.",
+        "badge": "Most Popular",
+        "sections": ("summary", "skills", "experience", "projects", "education"),
+        "pdf_style": {"font": "Helvetica", "title_color": "#6366f1", "accent": "#4f46e5", "align": "center", "rule": True, "bullet": "•"},
+        "prompt_style": """
+Use a modern, clean format with:
+- Clear section dividers with horizontal lines
+- Bold company/project names
+- Italicized dates and locations
+- Concise bullet points (1-2 lines each)
+- Professional summary at top
+- Skills grouped by category
+"""
+    },
+    
+    "ATS-Optimized": {
+        "description": "Maximized for Applicant Tracking Systems. Simple formatting, keyword-rich.",
+        "badge": "ATS-Friendly",
+        "sections": ("summary", "skills", "experience", "education"),
+        "pdf_style": {"font": "Helvetica", "title_color": "#111827", "accent": "#111827", "align": "left", "rule": False, "bullet": "-"},
+        "prompt_style": """
+Use ATS-optimized format with:
+- Simple, linear structure (no columns/tables)
+- Standard section headings (EXPERIENCE, EDUCATION, SKILLS)
+- Keywords from job description prominently placed
+- Plain text formatting (no graphics/icons)
+- Contact info at top in simple format
+- Reverse chronological order
+"""
+    },
+    
+    "Creative": {
+        "description": "Stand-out design for creative fields like design, marketing, content creation.",
+        "badge": "Eye-Catching",
+        "sections": ("summary", "skills", "experience", "projects", "education"),
+        "pdf_style": {"font": "Helvetica", "title_color": "#db2777", "accent": "#7c3aed", "align": "center", "rule": False, "bullet": "»"},
+        "prompt_style": """
+Use creative, engaging format with:
+- Unique section names (e.g., "My Journey" instead of "Experience")
+- Personality-driven language
+- Story-telling approach
+- Creative bullet point symbols (→, ★, ◆)
+- Emphasis on portfolio/creative work
+- Visual hierarchy with varied formatting
+"""
+    },
+    
+    "Technical/Engineering": {
+        "description": "Detail-oriented format for developers, engineers, and technical roles.",
+        "badge": "Tech-Focused",
+        "sections": ("skills", "experience", "projects", "education", "certifications"),
+        "pdf_style": {"font": "Courier", "title_color": "#0f766e", "accent": "#0f766e", "align": "left", "rule": True, "bullet": "›"},
+        "prompt_style": """
+Use technical format with:
+- Detailed technical skills section with proficiency levels
+- Project descriptions with tech stack details
+- GitHub/technical portfolio links prominent
+- Code/architecture achievements highlighted
+- Certifications and technical training emphasized
+- Metrics around system performance, scale, efficiency
+"""
+    },
+    
+    "Executive/Senior": {
+        "description": "Leadership-focused format for senior positions and executives.",
+        "badge": "Leadership",
+        "sections": ("summary", "experience", "skills", "education"),
+        "pdf_style": {"font": "Times-Roman", "title_color": "#1e3a8a", "accent": "#1e3a8a", "align": "center", "rule": True, "bullet": "•"},
+        "prompt_style": """
+Use executive format with:
+- Strong professional summary/executive profile
+- Leadership achievements and business impact
+- Strategic initiatives and organizational results
+- Board memberships, publications, speaking engagements
+- High-level metrics (revenue, team size, budget)
+- Focus on vision and strategy over tactical details
+"""
+    },
+    
+    "Academic/Research": {
+        "description": "Comprehensive CV format for academia, research, and scientific positions.",
+        "badge": "Research",
+        "sections": ("education", "experience", "publications", "skills"),
+        "pdf_style": {"font": "Times-Roman", "title_color": "#374151", "accent": "#7f1d1d", "align": "center", "rule": False, "bullet": "•"},
+        "prompt_style": """
+Use academic CV format with:
+- Detailed education section with thesis/dissertation
+- Publications and citations section
+- Research experience with methodology details
+- Grants, awards, and honors
+- Conference presentations and talks
+- Teaching experience and courses taught
+- Academic service and committee work
+"""
+    },
+    
+    "Minimalist": {
+        "description": "Ultra-clean, minimal design. Perfect for any industry.",
+        "badge": "Simple",
+        "sections": ("experience", "education", "skills"),
+        "pdf_style": {"font": "Helvetica", "title_color": "#111827", "accent": "#6b7280", "align": "left", "rule": False, "bullet": "–"},
+        "prompt_style": """
+Use minimalist format with:
+- Maximum white space
+- Simple typography (one or two fonts)
+- Minimal use of bold/italics
+- Clean section breaks
+- Concise descriptions (1 line when possible)
+- Focus on impact over details
+- Elegant simplicity
+"""
+    },
+    
+    "Startup/Entrepreneurial": {
+        "description": "Fast-paced, impact-focused format for startups and growth companies.",
+        "badge": "Growth-Minded",
+        "sections": ("summary", "experience", "projects", "skills"),
+        "pdf_style": {"font": "Helvetica", "title_color": "#ea580c", "accent": "#0d9488", "align": "left", "rule": True, "bullet": "›"},
+        "prompt_style": """
+Use startup-focused format with:
+- Emphasis on rapid growth and scaling
+- Startup/entrepreneurial experience highlighted
+- Metrics around user growth, revenue, market share
+- Scrappy, resourceful achievements
+- Cross-functional capabilities
+- Innovation and experimentation
+- "Wear many hats" versatility
+"""
+    }
+}
@@ -0,0 +1,254 @@
+"""Skill taxonomy, skill normalization and a job description matcher.
+
+normalize_skills() turns a free-form skills field into canonical names (aliases resolved, case folded,
+duplicates dropped); it is cached per field value, so each edit is parsed once however many places read it.
+
+Every spelling of every known skill goes into one Aho-Corasick automaton, so a job description is
+scanned once, in time linear in its length, however large the vocabulary grows. Matches are
+case-insensitive, must start and end on word boundaries, and resolve to the skill's canonical name.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Quick-fill templates offered in the sidebar; they also seed the taxonomy
+SKILL_TEMPLATES = {
+    "Software Engineer": {
+        "technical": "Python, JavaScript, React, Node.js, SQL, Git, Docker, AWS, REST APIs, MongoDB",
+        "soft": "Problem Solving, Team Collaboration, Agile Development, Code Review, Communication"
+    },
+    "Data Scientist": {
+        "technical": "Python, R, TensorFlow, PyTorch, Pandas, NumPy, Scikit-learn, SQL, Tableau, Jupyter",
+        "soft": "Statistical Analysis, Data Visualization, Research, Communication, Critical Thinking"
+    },
+    "Product Manager": {
+        "technical": "SQL, Google Analytics, JIRA, Figma, A/B Testing, Excel, Product Roadmapping",
+        "soft": "Leadership, Stakeholder Management, Strategic Thinking, Communication, Prioritization"
+    },
+    "UI/UX Designer": {
+        "technical": "Figma, Adobe XD, Sketch, Photoshop, Illustrator, HTML/CSS, Prototyping, User Research",
+        "soft": "Creativity, Empathy, Communication, Collaboration, Attention to Detail"
+    },
+    "Marketing Specialist": {
+        "technical": "SEO, Google Ads, Facebook Ads, Google Analytics, HubSpot, Mailchimp, Content Marketing",
+        "soft": "Creativity, Analytical Thinking, Communication, Project Management, Adaptability"
+    }
+}
+
+# Vocabulary beyond the templates
+TECHNICAL_SKILLS = (
+    "Java", "C", "C++", "C#", "TypeScript", "Golang", "Rust", "Kotlin", "Swift", "Ruby", "PHP", "Scala", "MATLAB",
+    "Bash", "HTML", "CSS", "Vue", "Angular", "Next.js", "Django", "Flask", "FastAPI", "Spring Boot", "Express",
+    "GraphQL", "Microservices", "PostgreSQL", "MySQL", "Redis", "Elasticsearch", "DynamoDB", "Cassandra",
+    "Kafka", "Spark", "Hadoop", "Airflow", "Snowflake", "dbt", "Kubernetes", "Terraform", "Ansible", "Jenkins",
+    "GitHub Actions", "CI/CD", "Linux", "Azure", "GCP", "Keras", "Machine Learning", "Deep Learning",
+    "Natural Language Processing", "Computer Vision", "Data Analysis", "Statistics", "Power BI", "Looker",
+    "LLMs", "Unit Testing", "System Design", "Distributed Systems", "Data Structures", "Algorithms",
+    "Agile", "Scrum", "Wireframing", "Copywriting", "Email Marketing", "Social Media Marketing",
+)
+SOFT_SKILLS = (
+    "Teamwork", "Mentoring", "Public Speaking", "Time Management", "Negotiation", "Presentation Skills",
+    "Written Communication", "Ownership", "Decision Making", "Customer Focus", "Cross-functional Collaboration",
+)
+
+# Canonical name -> other spellings that mean the same skill
+SKILL_ALIASES = {
+    "JavaScript": ("JS", "ECMAScript"),
+    "TypeScript": ("TS",),
+    "Node.js": ("Node", "NodeJS"),
+    "React": ("React.js", "ReactJS"),
+    "Vue": ("Vue.js", "VueJS"),
+    "Next.js": ("NextJS",),
+    "Golang": ("Go", "Go language"),
+    "PostgreSQL": ("Postgres",),
+    "MongoDB": ("Mongo",),
+    "Kubernetes": ("K8s",),
+    "AWS": ("Amazon Web Services",),
+    "GCP": ("Google Cloud", "Google Cloud Platform"),
+    "Azure": ("Microsoft Azure",),
+    "CI/CD": ("Continuous Integration", "Continuous Delivery", "Continuous Deployment"),
+    "REST APIs": ("REST", "RESTful", "REST API", "RESTful APIs", "RESTful API"),
+    "Scikit-learn": ("sklearn", "scikit learn"),
+    "HTML/CSS": ("HTML5/CSS3",),
+    "A/B Testing": ("AB Testing", "Split Testing"),
+    "Machine Learning": ("ML",),
+    "Deep Learning": ("DL",),
+    "Natural Language Processing": ("NLP",),
+    "LLMs": ("LLM", "Large Language Models"),
+    "Data Visualization": ("Data Viz",),
+    "SEO": ("Search Engine Optimization",),
+    "JIRA": ("Atlassian JIRA",),
+    "Teamwork": ("Team Player",),
+    "Team Collaboration": ("Collaborating with teams",),
+    "Problem Solving": ("Problem-solving",),
+}
+
+# Spellings this short, and tool names that are also ordinary words ("you will excel at", "the rest of"),
+# only match with their exact case
+CASE_SENSITIVE_MAX_LENGTH = 2
+CASE_SENSITIVE_SPELLINGS = frozenset({"Excel", "Sketch", "Spark", "Swift", "Rust", "Ruby", "Express", "Node", "REST"})
+
+# Language names that are also grades, funding rounds and abbreviations ("Series C", "R&D", "Go to market")
+# only count before "programming"/"language" or in a list with other skills ("Python, R and SQL", "C/C++")
+LIST_ONLY_SPELLINGS = frozenset({"C", "R", "Go"})
+LANGUAGE_CONTEXT = re.compile(r"\s*(?:programming|language|developer|code)\b", re.IGNORECASE)
+LIST_GAP = re.compile(r"\s*(?:[,/;]|(?:,\s*)?(?:and|or)\s)\s*", re.IGNORECASE)
+# Tool names that are also verbs, and the words that follow the verb ("Excel at", "excel in")
+VERB_USES = {"Excel": re.compile(r"\s+(?:at|in)\b")}
+
+# Commas are the documented separator; semicolons, new lines and bullets are what people paste
+SKILL_SEPARATORS = re.compile(r"[,;\n]")
+ENTRY_PUNCTUATION = " \t•·*-"
+
+def split_skills(text: str) -> List[str]:
+    entries = (entry.strip(ENTRY_PUNCTUATION).rstrip(".") for entry in SKILL_SEPARATORS.split(text))
+    return [entry for entry in entries if entry]
+
+def build_taxonomy() -> Dict[str, str]:
+    """Canonical skill name -> 'technical' or 'soft'"""
+    taxonomy = {}
+    for template in SKILL_TEMPLATES.values():
+        taxonomy.update(dict.fromkeys(split_skills(template["technical"]), "technical"))
+    taxonomy.update(dict.fromkeys(TECHNICAL_SKILLS, "technical"))
+    for template in SKILL_TEMPLATES.values():
+        for skill in split_skills(template["soft"]):
+            taxonomy.setdefault(skill, "soft")
+    for skill in SOFT_SKILLS:
+        taxonomy.setdefault(skill, "soft")
+    for skill in SKILL_ALIASES:
+        taxonomy.setdefault(skill, "technical")
+    return taxonomy
+
+SKILL_TAXONOMY = build_taxonomy()
+
+# Whole entries can't be ordinary words, so here every alias applies in any case ("js" -> "JavaScript")
+CANONICAL_SPELLINGS = {skill.casefold(): skill for skill in SKILL_TAXONOMY}
+for _skill, _aliases in SKILL_ALIASES.items():
+    CANONICAL_SPELLINGS.update(dict.fromkeys((alias.casefold() for alias in _aliases), _skill))
+
+def canonical_skill(skill: str) -> str:
+    return CANONICAL_SPELLINGS.get(skill.casefold(), skill)
+
+@lru_cache(maxsize=1024)
+def normalize_skills(text: str) -> Tuple[str, ...]:
+    """Canonical skill names from a skills field, in the order first listed; unknown skills keep their spelling"""
+    skills = {}
+    for entry in split_skills(text):
+        skill = canonical_skill(entry)
+        skills.setdefault(skill.casefold(), skill)
+    return tuple(skills.values())
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char in "+#"
+
+def _in_context(text: str, matches: List[Tuple[int, int, str, bool]], index: int) -> bool:
+    """Whether a LIST_ONLY_SPELLINGS match is followed by "programming" or sits in a list of other skills"""
+    start, end = matches[index][:2]
+    if LANGUAGE_CONTEXT.match(text, end):
+        return True
+    gaps = []
+    if index:
+        gaps.append(text[matches[index - 1][1]:start])
+    if index + 1 < len(matches):
+        gaps.append(text[end:matches[index + 1][0]])
+    return any(LIST_GAP.fullmatch(gap) for gap in gaps)
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every spelling of a set of skills"""
+
+    def __init__(self, spellings: Dict[str, str]):
+        # spellings: spelling -> canonical skill name
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._patterns = []
+        for spelling, skill in spellings.items():
+            self._add(spelling, skill)
+        self._link()
+
+    def _add(self, spelling: str, skill: str):
+        state = 0
+        for char in spelling.lower():
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._output[state].append(len(self._patterns))
+        self._patterns.append((spelling, skill))
+
+    def _link(self):
+        """Breadth-first fail links; each state also inherits the outputs of its fail state"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def scan(self, text: str) -> List[Tuple[int, int, str]]:
+        """(start, end, skill) for every whole-word match, longest first where matches overlap"""
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self._patterns
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters change length when lowercased; fall back to per-character folding
+            lowered = "".join(char.lower()[0] for char in text)
+        matches = []
+        state = 0
+        for index, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in output[state]:
+                spelling, skill = patterns[pattern]
+                start, end = index + 1 - len(spelling), index + 1
+                if start > 0 and _is_word_char(text[start - 1]) or end < len(text) and _is_word_char(text[end]):
+                    continue
+                if (len(spelling) <= CASE_SENSITIVE_MAX_LENGTH or spelling in CASE_SENSITIVE_SPELLINGS) and text[start:end] != spelling:
+                    continue
+                if spelling in VERB_USES and VERB_USES[spelling].match(text, end):
+                    continue
+                matches.append((start, end, skill, spelling in LIST_ONLY_SPELLINGS))
+
+        # Leftmost-longest: "Team Collaboration" wins over the "Collaboration" inside it
+        selected = []
+        covered_until = 0
+        for match in sorted(matches, key=lambda match: (match[0], match[0] - match[1])):
+            if match[0] >= covered_until:
+                selected.append(match)
+                covered_until = match[1]
+        return [(start, end, skill) for index, (start, end, skill, list_only) in enumerate(selected)
+                if not list_only or _in_context(text, selected, index)]
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skills mentioned in the text, in order of first mention"""
+        return list(dict.fromkeys(skill for _, _, skill in self.scan(text)))
+
+@lru_cache(maxsize=256)
+def get_skill_matcher(extra_skills: Tuple[str, ...] = ()) -> SkillMatcher:
+    """Matcher for the taxonomy plus a profile's own skills that the taxonomy doesn't know (cached per set)"""
+    spellings = {skill: skill for skill in SKILL_TAXONOMY}
+    for skill, aliases in SKILL_ALIASES.items():
+        spellings.update(dict.fromkeys(aliases, skill))
+    for skill in extra_skills:
+        spellings.setdefault(skill, skill)
+    return SkillMatcher(spellings)
+
+def match_job_skills(job_description: str, technical_skills: str, soft_skills: str) -> Dict:
+    """Skills the job description asks for, split into those the profile lists and those it doesn't"""
+    profile_skills = normalize_skills(technical_skills) + normalize_skills(soft_skills)
+    matcher = get_skill_matcher(tuple(sorted(skill for skill in profile_skills if skill not in SKILL_TAXONOMY)))
+
+    # Entries such as "Docker & Kubernetes" also count for the known skills inside them
+    have = set(profile_skills) | set(get_skill_matcher().find(", ".join(profile_skills)))
+    wanted = matcher.find(job_description)
+    return {
+        'matched': [skill for skill in wanted if skill in have],
+        'missing': [skill for skill in wanted if skill not in have],
+        'categories': {skill: SKILL_TAXONOMY.get(skill, "technical") for skill in wanted},
+    }
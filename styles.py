@@ -0,0 +1,415 @@
+"""App-wide stylesheet, injected once per browser session by app.py."""
+
+ADVANCED_CSS = """
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Space+Grotesk:wght@400;500;600;700&display=swap');
+    
+    :root {
+        --primary: #6366f1;
+        --primary-dark: #4f46e5;
+        --secondary: #ec4899;
+        --success: #10b981;
+        --warning: #f59e0b;
+        --error: #ef4444;
+        --dark: #0f172a;
+        --light: #f8fafc;
+        --gradient-1: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        --gradient-2: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+        --gradient-3: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        --gradient-4: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%);
+    }
+    
+    * {
+        font-family: 'Inter', sans-serif;
+    }
+    
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    /* Removed header visibility: hidden to keep hamburger button visible */
+    
+    .main {
+        background: linear-gradient(180deg, #0f172a 0%, #1e293b 100%);
+    }
+    
+    .stApp {
+        background: linear-gradient(180deg, #0f172a 0%, #1e293b 100%);
+    }
+    
+    /* Enhanced Form Styling */
+    .stTextInput > div > div > input,
+    .stTextArea > div > div > textarea,
+    .stSelectbox > div > div > select {
+        background: rgba(255,255,255,0.05) !important;
+        border: 1px solid rgba(255,255,255,0.1) !important;
+        border-radius: 8px !important;
+        color: white !important;
+        transition: all 0.3s ease !important;
+    }
+    
+    .stTextInput > div > div > input:focus,
+    .stTextArea > div > div > textarea:focus {
+        border-color: var(--primary) !important;
+        box-shadow: 0 0 0 2px rgba(99,102,241,0.2) !important;
+    }
+    
+    .stNumberInput > div > div > input {
+        background: rgba(255,255,255,0.05) !important;
+        color: white !important;
+    }
+    
+    /* Animated Header */
+    .hero-header {
+        background: var(--gradient-1);
+        padding: 3rem 2rem;
+        border-radius: 20px;
+        text-align: center;
+        margin-bottom: 2rem;
+        position: relative;
+        overflow: hidden;
+        box-shadow: 0 20px 60px rgba(99,102,241,0.4);
+        animation: slideDown 0.8s cubic-bezier(0.68, -0.55, 0.265, 1.55);
+    }
+    
+    .hero-header::before {
+        content: '';
+        position: absolute;
+        top: -50%;
+        left: -50%;
+        width: 200%;
+        height: 200%;
+        background: radial-gradient(circle, rgba(255,255,255,0.1) 1px, transparent 1px);
+        background-size: 50px 50px;
+        animation: backgroundMove 20s linear infinite;
+    }
+    
+    .hero-header h1 {
+        color: white;
+        font-size: clamp(2rem, 5vw, 3.5rem);
+        font-weight: 800;
+        margin: 0;
+        text-shadow: 2px 2px 10px rgba(0,0,0,0.3);
+        font-family: 'Space Grotesk', sans-serif;
+        position: relative;
+        z-index: 1;
+    }
+    
+    .hero-header .subtitle {
+        color: rgba(255,255,255,0.95);
+        font-size: clamp(1rem, 2vw, 1.3rem);
+        margin-top: 1rem;
+        font-weight: 400;
+        position: relative;
+        z-index: 1;
+    }
+    
+    /* Glass Cards */
+    .glass-card {
+        background: rgba(255,255,255,0.05);
+        backdrop-filter: blur(10px);
+        border: 1px solid rgba(255,255,255,0.1);
+        border-radius: 20px;
+        padding: 2rem;
+        margin: 1.5rem 0;
+        box-shadow: 0 8px 32px rgba(0,0,0,0.2);
+        transition: all 0.3s ease;
+        animation: fadeInUp 0.6s ease-out;
+    }
+    
+    .glass-card:hover {
+        background: rgba(255,255,255,0.08);
+        border-color: rgba(99,102,241,0.3);
+        transform: translateY(-5px);
+        box-shadow: 0 15px 45px rgba(99,102,241,0.3);
+    }
+    
+    /* Buttons */
+    .stButton>button {
+        background: var(--gradient-1) !important;
+        color: white !important;
+        border: none !important;
+        border-radius: 12px !important;
+        padding: 0.9rem 2.5rem !important;
+        font-weight: 600 !important;
+        font-size: 1.05rem !important;
+        transition: all 0.3s ease !important;
+        box-shadow: 0 4px 15px rgba(99,102,241,0.4) !important;
+    }
+    
+    .stButton>button:hover {
+        transform: translateY(-3px) scale(1.02) !important;
+        box-shadow: 0 8px 25px rgba(99,102,241,0.5) !important;
+    }
+    
+    /* Download Button */
+    .download-btn {
+        display: inline-block;
+        padding: 0.9rem 2rem;
+        background: var(--gradient-4);
+        color: white;
+        text-decoration: none;
+        border-radius: 12px;
+        font-weight: 600;
+        font-size: 1rem;
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 15px rgba(67,233,123,0.4);
+        margin: 0.5rem;
+    }
+    
+    .download-btn:hover {
+        transform: translateY(-3px) scale(1.05);
+        box-shadow: 0 8px 25px rgba(67,233,123,0.5);
+        text-decoration: none;
+        color: white;
+    }
+    
+    /* Template Selection Cards */
+    .template-card {
+        background: rgba(255,255,255,0.05);
+        border: 2px solid rgba(255,255,255,0.1);
+        border-radius: 15px;
+        padding: 1.5rem;
+        cursor: pointer;
+        transition: all 0.3s ease;
+        margin: 1rem 0;
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .template-card::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: -100%;
+        width: 100%;
+        height: 100%;
+        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.1), transparent);
+        transition: left 0.5s;
+    }
+    
+    .template-card:hover::before {
+        left: 100%;
+    }
+    
+    .template-card:hover {
+        background: rgba(255,255,255,0.1);
+        border-color: var(--primary);
+        transform: translateY(-5px);
+        box-shadow: 0 10px 30px rgba(99,102,241,0.3);
+    }
+    
+    .template-card.selected {
+        background: rgba(99,102,241,0.2);
+        border-color: var(--primary);
+        box-shadow: 0 0 30px rgba(99,102,241,0.4);
+    }
+    
+    .template-card h4 {
+        color: white;
+        font-size: 1.3rem;
+        margin-bottom: 0.5rem;
+    }
+    
+    .template-card p {
+        color: rgba(255,255,255,0.7);
+        font-size: 0.95rem;
+    }
+    
+    .template-badge {
+        display: inline-block;
+        padding: 0.3rem 0.8rem;
+        background: var(--gradient-1);
+        border-radius: 20px;
+        font-size: 0.75rem;
+        margin-top: 0.5rem;
+        color: white;
+    }
+    
+    /* Alerts */
+    .alert-success {
+        background: linear-gradient(135deg, rgba(16,185,129,0.2) 0%, rgba(5,150,105,0.2) 100%);
+        border-left: 4px solid #10b981;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        color: #d1fae5;
+        backdrop-filter: blur(10px);
+    }
+    
+    .alert-error {
+        background: linear-gradient(135deg, rgba(239,68,68,0.2) 0%, rgba(220,38,38,0.2) 100%);
+        border-left: 4px solid #ef4444;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        color: #fecaca;
+        backdrop-filter: blur(10px);
+    }
+    
+    .alert-info {
+        background: linear-gradient(135deg, rgba(59,130,246,0.2) 0%, rgba(37,99,235,0.2) 100%);
+        border-left: 4px solid #3b82f6;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        color: #dbeafe;
+        backdrop-filter: blur(10px);
+    }
+    
+    .alert-warning {
+        background: linear-gradient(135deg, rgba(245,158,11,0.2) 0%, rgba(217,119,6,0.2) 100%);
+        border-left: 4px solid #f59e0b;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        color: #fef3c7;
+        backdrop-filter: blur(10px);
+    }
+    
+    /* Feature Grid */
+    .feature-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+        gap: 1.5rem;
+        margin: 2rem 0;
+    }
+    
+    .feature-card {
+        background: rgba(255,255,255,0.05);
+        backdrop-filter: blur(10px);
+        border: 1px solid rgba(255,255,255,0.1);
+        border-radius: 15px;
+        padding: 1.5rem;
+        text-align: center;
+        transition: all 0.4s cubic-bezier(0.68, -0.55, 0.265, 1.55);
+        cursor: pointer;
+    }
+    
+    .feature-card:hover {
+        transform: translateY(-10px) scale(1.02);
+        background: rgba(255,255,255,0.08);
+        box-shadow: 0 15px 40px rgba(99,102,241,0.3);
+        border-color: rgba(99,102,241,0.5);
+    }
+    
+    .feature-card .icon {
+        font-size: 3rem;
+        margin-bottom: 1rem;
+        display: block;
+    }
+    
+    /* Animations */
+    @keyframes slideDown {
+        from { opacity: 0; transform: translateY(-50px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    @keyframes fadeInUp {
+        from { opacity: 0; transform: translateY(30px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    @keyframes backgroundMove {
+        0% { transform: translate(0, 0); }
+        100% { transform: translate(50px, 50px); }
+    }
+
+    /* Advanced 3D Animations */
+    .card-3d {
+        transform-style: preserve-3d;
+        transition: transform 0.6s;
+    }
+    
+    .card-3d:hover {
+        transform: rotateY(10deg) rotateX(-10deg);
+    }
+    
+    /* Morphing Shapes */
+    .morph-shape {
+        border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;
+        animation: morph 8s ease-in-out infinite;
+        background: linear-gradient(45deg, var(--primary), var(--secondary));
+    }
+    
+    @keyframes morph {
+        0% { border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%; }
+        50% { border-radius: 30% 60% 70% 40% / 50% 60% 30% 60%; }
+        100% { border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%; }
+    }
+    
+    /* Parallax Background */
+    .parallax-bg {
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        z-index: -1;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        transform: translateZ(-1px) scale(2);
+    }
+    
+    /* Cursor Following Effect */
+    .cursor-follower {
+        position: fixed;
+        width: 20px;
+        height: 20px;
+        border-radius: 50%;
+        background: rgba(255, 255, 255, 0.1);
+        pointer-events: none;
+        z-index: 9999;
+        transition: transform 0.1s ease-out;
+    }
+    
+    /* Glowing Text Effect */
+    .glow-text {
+        text-shadow: 0 0 10px rgba(255, 255, 255, 0.5),
+                     0 0 20px rgba(255, 255, 255, 0.3),
+                     0 0 30px rgba(255, 255, 255, 0.2);
+    }
+    
+    /* Floating Animation */
+    .floating {
+        animation: float 6s ease-in-out infinite;
+    }
+    
+    @keyframes float {
+        0% { transform: translateY(0px); }
+        50% { transform: translateY(-20px); }
+        100% { transform: translateY(0px); }
+    }
+    
+    /* Tabs */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 1rem;
+        background: rgba(255,255,255,0.05);
+        padding: 0.5rem;
+        border-radius: 15px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background: transparent;
+        border-radius: 10px;
+        color: rgba(255,255,255,0.7);
+        font-weight: 600;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: var(--gradient-1) !important;
+        color: white !important;
+    }
+    
+    /* Sidebar */
+    [data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
+    }
+    
+    /* Responsive */
+    @media (max-width: 768px) {
+        .hero-header h1 {
+            font-size: 2rem;
+        }
+        .feature-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+"""
+STYLESHEET_ID = "career-builder-styles"
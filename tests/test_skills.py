@@ -0,0 +1,31 @@
+"""Skill matching: ordinary words in job postings must not come back as missing skills."""
+
+import pytest
+
+from skills import match_job_skills
+
+def wanted(job_description: str):
+    result = match_job_skills(job_description, "Python", "")
+    return result['matched'] + result['missing']
+
+@pytest.mark.parametrize("job_description", [
+    "Please send your CV to jobs@example.com",
+    "We are a Series C startup",
+    "Join our R&D team",
+    "You will Excel at working with customers",
+    "C-level stakeholders",
+    "Go to market with us",
+])
+def test_ordinary_words_are_not_skills(job_description):
+    assert wanted(job_description) == []
+
+@pytest.mark.parametrize("job_description, skills", [
+    ("Experience with Python, R and SQL", ["Python", "R", "SQL"]),
+    ("C/C++ programming", ["C", "C++"]),
+    ("Strong C programming skills", ["C"]),
+    ("Knowledge of R programming", ["R"]),
+    ("Python or Go", ["Python", "Golang"]),
+    ("Advanced Excel and SQL", ["Excel", "SQL"]),
+])
+def test_languages_in_context_are_skills(job_description, skills):
+    assert sorted(wanted(job_description)) == sorted(skills)
@@ -0,0 +1,131 @@
+"""Token budgets for Gemini calls, per Streamlit session and per day for the whole server.
+
+Every call is planned against the budgets it runs under: while plenty is left a call gets the output limit
+its kind asks for; once a budget runs low, answers are shortened (down to MIN_OUTPUT_TOKENS) instead of
+refused, and only a call that can't fit even a short answer is turned away. Each attempt reserves its
+input plus the planned output before it is sent, so concurrent calls can't overshoot a budget. When the
+request finishes, whether or not anyone still waits for it, the reservation is settled to the response's
+token counts (falling back to local estimates), or released if no response came back. The daily budget is
+kept in memory, so it restarts with the server process.
+"""
+
+import os
+import threading
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+# Output tokens asked for per generation kind
+OUTPUT_TOKEN_LIMITS = {
+    "resume": 3500,
+    "resume_json": 3500,
+    "cover_letter": 2000,
+    "advice": 3000,
+}
+
+SESSION_TOKEN_BUDGET = int(os.getenv("SESSION_TOKEN_BUDGET", "60000"))
+DAILY_TOKEN_BUDGET = int(os.getenv("DAILY_TOKEN_BUDGET", "5000000"))
+
+# With less than this share of a budget left, output limits shrink in proportion to what's left
+LOW_BUDGET_SHARE = 0.25
+MIN_OUTPUT_TOKENS = 600
+
+class TokenBudget:
+    """A thread-safe token allowance; name is shown to users when it runs out"""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def _roll_over(self):
+        """Hook for budgets that reset; called with the lock held"""
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll_over()
+            return max(0, self.limit - self.used)
+
+    def charge(self, tokens: int):
+        with self._lock:
+            self._roll_over()
+            self.used += tokens
+
+    def reserve(self, tokens: int) -> bool:
+        """Set tokens aside for a call if the budget still covers them; settle() them once it finishes"""
+        with self._lock:
+            self._roll_over()
+            if self.limit - self.used < tokens:
+                return False
+            self.used += tokens
+            return True
+
+    def settle(self, reserved: int, used: int):
+        """Replace a reservation with the tokens the call actually used (0 when it got no response)"""
+        with self._lock:
+            self._roll_over()
+            # A reservation made before a daily roll-over is already gone
+            self.used = max(0, self.used + used - reserved)
+
+    def summary(self) -> Dict:
+        with self._lock:
+            self._roll_over()
+            return {'name': self.name, 'limit': self.limit, 'used': self.used, 'remaining': max(0, self.limit - self.used)}
+
+class DailyTokenBudget(TokenBudget):
+    """A budget that starts over every calendar day"""
+
+    def __init__(self, name: str, limit: int):
+        super().__init__(name, limit)
+        self.day = date.today()
+
+    def _roll_over(self):
+        today = date.today()
+        if today != self.day:
+            self.day = today
+            self.used = 0
+
+@lru_cache(maxsize=None)
+def get_daily_budget() -> DailyTokenBudget:
+    """The process-wide daily budget shared by every session"""
+    return DailyTokenBudget("today's", DAILY_TOKEN_BUDGET)
+
+def new_session_budget() -> TokenBudget:
+    return TokenBudget("this session's", SESSION_TOKEN_BUDGET)
+
+def reserve_tokens(budgets: Iterable[TokenBudget], tokens: int) -> Optional[TokenBudget]:
+    """Reserve tokens on every budget, or on none: returns the budget that couldn't cover them, else None"""
+    reserved = []
+    for budget in budgets:
+        if not budget.reserve(tokens):
+            for taken in reserved:
+                taken.settle(tokens, 0)
+            return budget
+        reserved.append(budget)
+    return None
+
+def settle_tokens(budgets: Iterable[TokenBudget], reserved: int, used: int):
+    for budget in budgets:
+        budget.settle(reserved, used)
+
+def plan_output_tokens(requested: int, input_tokens: int,
+                       budgets: Iterable[TokenBudget]) -> Tuple[int, Optional[TokenBudget]]:
+    """Output token limit for a call, and the budget that forced it shorter (if any).
+
+    Returns (0, budget) when the budget can't cover the input plus a short answer.
+    """
+    max_tokens, limiting = requested, None
+    for budget in budgets:
+        remaining = budget.remaining
+        available = remaining - input_tokens
+        if available < MIN_OUTPUT_TOKENS:
+            return 0, budget
+        allowed = min(requested, available)
+        if remaining < budget.limit * LOW_BUDGET_SHARE:
+            # Scale down with what's left, so the last calls of a busy day still get an answer
+            allowed = min(allowed, max(MIN_OUTPUT_TOKENS, int(requested * remaining / (budget.limit * LOW_BUDGET_SHARE))))
+        if allowed < max_tokens:
+            max_tokens, limiting = allowed, budget
+    return max_tokens, limiting